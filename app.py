@@ -1,692 +1,156 @@
 import streamlit as st
-import requests
-from datetime import datetime
-import pytz
-import json
 import os
 import time
 import uuid
+from itertools import islice
+from nfl_edge.alerts import drain as drain_alerts, get_alert_engine, position_rules
+from nfl_edge.espn import INJURIES_CACHE, SCORES_CACHE, SCOREBOARD_URL, load_scoreboard, start_scoreboard_poller
+from nfl_edge.feeds import fetch_feeds
+from nfl_edge.gamestate import get_engine
+from nfl_edge.injuries import get_injury_index
+from nfl_edge.kalshi import game_marks, game_url, get_quotes, market_url, pick_edge, quotes_version, team_quote
+from nfl_edge.models import FINAL, LIVE, eastern
+from nfl_edge.metrics import ENABLED as METRICS_ENABLED, rerun_timer, snapshot as metrics_snapshot, span
+from nfl_edge.httpclient import endpoint, get_client
+from nfl_edge.portfolio import Portfolio
+from nfl_edge.positions import get_store
+from nfl_edge.render import (PAGE_CSS, HtmlBlock, render_book_card, render_final_card, render_football_field,
+                             render_game_grid, render_live_card, render_ml_pick, render_position_card,
+                             render_signal_feed, render_stats, render_trade_link, signed)
+from nfl_edge.replay import REPLAY_PATH, REPLAY_SPEED, virtual_now
+from nfl_edge.scoring import score_slate
+from nfl_edge.season import want_games
+from nfl_edge.signals import evaluate_labels, live_state
 
 st.set_page_config(page_title="NFL Edge Finder", page_icon="🏈", layout="wide")
 
+# ========== TIMING ==========
+# no-op unless NFL_METRICS=1; each phase() call closes the previous phase
+# the timings panel shows only with ?admin=<NFL_ADMIN_KEY>, and never when no key is set
+ADMIN_KEY = os.environ.get("NFL_ADMIN_KEY")
+rerun = rerun_timer()
+rerun.phase("setup")
+
 # ========== SESSION ID ==========
+# kept in the URL so refreshes and reloads land on the same position book
 if "sid" not in st.session_state:
-    st.session_state["sid"] = str(uuid.uuid4())
-
-# ========== TIMEZONE ==========
-eastern = pytz.timezone("US/Eastern")
-today_str = datetime.now(eastern).strftime("%Y-%m-%d")
+    st.session_state["sid"] = st.query_params.get("sid") or str(uuid.uuid4())
+if st.query_params.get("sid") != st.session_state["sid"]:
+    st.query_params["sid"] = st.session_state["sid"]
 
 # ========== CSS ==========
-st.markdown("""
-<style>
-.stLinkButton > a {
-    background-color: #00aa00 !important;
-    border-color: #00aa00 !important;
-    color: white !important;
-}
-.stLinkButton > a:hover {
-    background-color: #00cc00 !important;
-    border-color: #00cc00 !important;
-}
-</style>
-""", unsafe_allow_html=True)
+# card HTML, team data, signals and scoring live in nfl_edge (imported once per process)
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 # ========== PERSISTENT STORAGE ==========
-POSITIONS_FILE = "nfl_positions.json"
-
-def load_positions():
-    try:
-        if os.path.exists(POSITIONS_FILE):
-            with open(POSITIONS_FILE, 'r') as f:
-                return json.load(f)
-    except:
-        pass
-    return []
-
-def save_positions(positions):
-    try:
-        with open(POSITIONS_FILE, 'w') as f:
-            json.dump(positions, f, indent=2)
-    except:
-        pass
+position_store = get_store()
 
 # ========== SESSION STATE ==========
 if 'auto_refresh' not in st.session_state:
     st.session_state.auto_refresh = False
-if "positions" not in st.session_state:
-    st.session_state.positions = load_positions()
+if "portfolio" not in st.session_state:
+    st.session_state.portfolio = Portfolio(position_store.list(st.session_state["sid"]))
+if "positions_page" not in st.session_state:
+    st.session_state.positions_page = 0
+if "managing_game" not in st.session_state:
+    st.session_state.managing_game = None
+if "alerts_on" not in st.session_state:
+    st.session_state.alerts_on = True
 if "selected_ml_pick" not in st.session_state:
     st.session_state.selected_ml_pick = None
 if "editing_position" not in st.session_state:
     st.session_state.editing_position = None
-if "last_scores" not in st.session_state:
-    st.session_state.last_scores = {}
-if "score_change_times" not in st.session_state:
-    st.session_state.score_change_times = {}
 
 # ========== AUTO REFRESH ==========
+# live sections re-read the scoreboard every LIVE_TICK seconds (see LIVE SECTIONS), so a
+# new snapshot shows within a second of the poller publishing it; unchanged ticks are cheap
+LIVE_TICK = float(os.environ.get("NFL_LIVE_TICK", 1))
+live_every = LIVE_TICK if st.session_state.auto_refresh else None
 if st.session_state.auto_refresh:
-    st.markdown(f'<meta http-equiv="refresh" content="15;url=?r={int(time.time()) + 15}">', unsafe_allow_html=True)
-    auto_status = "🔄 Auto-refresh ON (15s)"
+    auto_status = "🔄 Live updates ON"
 else:
     auto_status = "⏸️ Auto-refresh OFF"
 
-# ========== TEAM DATA ==========
-KALSHI_CODES = {
-    "Arizona": "ARI", "Atlanta": "ATL", "Baltimore": "BAL", "Buffalo": "BUF",
-    "Carolina": "CAR", "Chicago": "CHI", "Cincinnati": "CIN", "Cleveland": "CLE",
-    "Dallas": "DAL", "Denver": "DEN", "Detroit": "DET", "Green Bay": "GB",
-    "Houston": "HOU", "Indianapolis": "IND", "Jacksonville": "JAX", "Kansas City": "KC",
-    "Las Vegas": "LV", "LA Chargers": "LAC", "LA Rams": "LA", "Miami": "MIA",
-    "Minnesota": "MIN", "New England": "NE", "New Orleans": "NO", "NY Giants": "NYG",
-    "NY Jets": "NYJ", "Philadelphia": "PHI", "Pittsburgh": "PIT", "San Francisco": "SF",
-    "Seattle": "SEA", "Tampa Bay": "TB", "Tennessee": "TEN", "Washington": "WAS"
-}
-
-TEAM_ABBREVS = {
-    "Arizona Cardinals": "Arizona", "Atlanta Falcons": "Atlanta", "Baltimore Ravens": "Baltimore",
-    "Buffalo Bills": "Buffalo", "Carolina Panthers": "Carolina", "Chicago Bears": "Chicago",
-    "Cincinnati Bengals": "Cincinnati", "Cleveland Browns": "Cleveland", "Dallas Cowboys": "Dallas",
-    "Denver Broncos": "Denver", "Detroit Lions": "Detroit", "Green Bay Packers": "Green Bay",
-    "Houston Texans": "Houston", "Indianapolis Colts": "Indianapolis", "Jacksonville Jaguars": "Jacksonville",
-    "Kansas City Chiefs": "Kansas City", "Las Vegas Raiders": "Las Vegas", "Los Angeles Chargers": "LA Chargers",
-    "Los Angeles Rams": "LA Rams", "Miami Dolphins": "Miami", "Minnesota Vikings": "Minnesota",
-    "New England Patriots": "New England", "New Orleans Saints": "New Orleans", "New York Giants": "NY Giants",
-    "New York Jets": "NY Jets", "Philadelphia Eagles": "Philadelphia", "Pittsburgh Steelers": "Pittsburgh",
-    "San Francisco 49ers": "San Francisco", "Seattle Seahawks": "Seattle", "Tampa Bay Buccaneers": "Tampa Bay",
-    "Tennessee Titans": "Tennessee", "Washington Commanders": "Washington"
-}
-
-TEAM_STATS = {
-    "Arizona": {"dvoa": -8.5, "def_rank": 28, "home_win_pct": 0.45},
-    "Atlanta": {"dvoa": 2.5, "def_rank": 20, "home_win_pct": 0.55},
-    "Baltimore": {"dvoa": 12.5, "def_rank": 2, "home_win_pct": 0.72},
-    "Buffalo": {"dvoa": 15.8, "def_rank": 4, "home_win_pct": 0.78},
-    "Carolina": {"dvoa": -12.5, "def_rank": 26, "home_win_pct": 0.38},
-    "Chicago": {"dvoa": 8.5, "def_rank": 10, "home_win_pct": 0.65},
-    "Cincinnati": {"dvoa": 5.8, "def_rank": 12, "home_win_pct": 0.58},
-    "Cleveland": {"dvoa": -2.5, "def_rank": 15, "home_win_pct": 0.52},
-    "Dallas": {"dvoa": 3.2, "def_rank": 14, "home_win_pct": 0.62},
-    "Denver": {"dvoa": 12.5, "def_rank": 3, "home_win_pct": 0.75},
-    "Detroit": {"dvoa": 18.5, "def_rank": 6, "home_win_pct": 0.75},
-    "Green Bay": {"dvoa": 8.2, "def_rank": 10, "home_win_pct": 0.70},
-    "Houston": {"dvoa": 6.5, "def_rank": 8, "home_win_pct": 0.58},
-    "Indianapolis": {"dvoa": -6.8, "def_rank": 22, "home_win_pct": 0.48},
-    "Jacksonville": {"dvoa": -4.5, "def_rank": 19, "home_win_pct": 0.45},
-    "Kansas City": {"dvoa": 22.5, "def_rank": 7, "home_win_pct": 0.82},
-    "Las Vegas": {"dvoa": -8.2, "def_rank": 25, "home_win_pct": 0.45},
-    "LA Chargers": {"dvoa": 7.8, "def_rank": 9, "home_win_pct": 0.55},
-    "LA Rams": {"dvoa": 5.5, "def_rank": 14, "home_win_pct": 0.55},
-    "Miami": {"dvoa": 5.2, "def_rank": 13, "home_win_pct": 0.62},
-    "Minnesota": {"dvoa": 10.5, "def_rank": 11, "home_win_pct": 0.68},
-    "New England": {"dvoa": 9.5, "def_rank": 5, "home_win_pct": 0.70},
-    "New Orleans": {"dvoa": -3.8, "def_rank": 21, "home_win_pct": 0.55},
-    "NY Giants": {"dvoa": -15.5, "def_rank": 30, "home_win_pct": 0.35},
-    "NY Jets": {"dvoa": -7.5, "def_rank": 23, "home_win_pct": 0.42},
-    "Philadelphia": {"dvoa": 14.8, "def_rank": 3, "home_win_pct": 0.75},
-    "Pittsburgh": {"dvoa": 2.8, "def_rank": 5, "home_win_pct": 0.65},
-    "San Francisco": {"dvoa": 10.5, "def_rank": 6, "home_win_pct": 0.68},
-    "Seattle": {"dvoa": 14.5, "def_rank": 2, "home_win_pct": 0.78},
-    "Tampa Bay": {"dvoa": 4.2, "def_rank": 29, "home_win_pct": 0.55},
-    "Tennessee": {"dvoa": -9.8, "def_rank": 31, "home_win_pct": 0.42},
-    "Washington": {"dvoa": 9.5, "def_rank": 8, "home_win_pct": 0.62}
-}
-
-STAR_PLAYERS = {
-    "Arizona": ["Kyler Murray"], "Atlanta": ["Kirk Cousins", "Bijan Robinson"],
-    "Baltimore": ["Lamar Jackson", "Derrick Henry"], "Buffalo": ["Josh Allen", "James Cook"],
-    "Carolina": ["Bryce Young"], "Chicago": ["Caleb Williams"],
-    "Cincinnati": ["Joe Burrow", "Ja'Marr Chase"], "Cleveland": ["Deshaun Watson"],
-    "Dallas": ["Dak Prescott", "CeeDee Lamb"], "Denver": ["Bo Nix"],
-    "Detroit": ["Jared Goff", "Amon-Ra St. Brown"], "Green Bay": ["Jordan Love"],
-    "Houston": ["C.J. Stroud", "Nico Collins"], "Indianapolis": ["Anthony Richardson"],
-    "Jacksonville": ["Trevor Lawrence"], "Kansas City": ["Patrick Mahomes", "Travis Kelce"],
-    "Las Vegas": ["Gardner Minshew"], "LA Chargers": ["Justin Herbert"],
-    "LA Rams": ["Matthew Stafford", "Puka Nacua"], "Miami": ["Tua Tagovailoa", "Tyreek Hill"],
-    "Minnesota": ["J.J. McCarthy", "Justin Jefferson"], "New England": ["Drake Maye"],
-    "New Orleans": ["Derek Carr"], "NY Giants": ["Daniel Jones"],
-    "NY Jets": ["Aaron Rodgers"], "Philadelphia": ["Jalen Hurts", "Saquon Barkley"],
-    "Pittsburgh": ["Russell Wilson"], "San Francisco": ["Brock Purdy", "Christian McCaffrey"],
-    "Seattle": ["Sam Darnold", "Jaxon Smith-Njigba"], "Tampa Bay": ["Baker Mayfield"],
-    "Tennessee": ["Will Levis"], "Washington": ["Jayden Daniels"]
-}
-
-def build_kalshi_ml_url(away_team, home_team, game_date=None):
-    away_code = KALSHI_CODES.get(away_team, "XXX")
-    home_code = KALSHI_CODES.get(home_team, "XXX")
-    if game_date:
-        date_str = game_date.strftime("%y%b%d").upper()
-    else:
-        date_str = datetime.now(eastern).strftime("%y%b%d").upper()
-    ticker = f"KXNFLGAME-{date_str}{away_code}{home_code}"
-    return f"https://kalshi.com/markets/KXNFLGAME/{ticker}"
-
-# ========== SIGNAL CALCULATIONS (SaaS-SAFE) ==========
-def calc_field_pressure(yards_to_endzone, possession_team, home_team):
-    """Calculate field position pressure - uses only yard line"""
-    if not possession_team or not yards_to_endzone:
-        return "UNKNOWN", "#888888"
-    
-    if yards_to_endzone <= 20:
-        return "🔴 RED ZONE", "#ff0000"
-    elif yards_to_endzone <= 35:
-        return "⚠️ THREAT", "#ff8800"
-    elif yards_to_endzone <= 50:
-        return "NEUTRAL", "#888888"
-    else:
-        return "LOW", "#44ff44"
-
-def calc_down_stress(down, distance):
-    """Calculate down & distance stress - uses only down + yards"""
-    if not down or not distance:
-        return "—", "#888888"
-    
-    if down == 1:
-        if distance <= 5:
-            return "EASY", "#44ff44"
-        else:
-            return "NORMAL", "#888888"
-    elif down == 2:
-        if distance <= 5:
-            return "FAVORABLE", "#44ff44"
-        elif distance <= 8:
-            return "NORMAL", "#888888"
-        else:
-            return "MODERATE", "#ffaa00"
-    elif down == 3:
-        if distance <= 3:
-            return "CONVERTIBLE", "#44ff44"
-        elif distance <= 6:
-            return "MODERATE", "#ffaa00"
-        else:
-            return "HIGH RISK", "#ff8800"
-    elif down == 4:
-        return "CRITICAL", "#ff0000"
-    else:
-        return "—", "#888888"
-
-def calc_clock_pressure(quarter, clock_str, score_diff, is_trailing):
-    """Calculate clock pressure - uses only time + score margin"""
-    try:
-        parts = clock_str.split(":")
-        minutes = int(parts[0])
-        seconds = int(parts[1]) if len(parts) > 1 else 0
-        time_left_in_q = minutes * 60 + seconds
-    except:
-        return "UNKNOWN", "#888888"
-    
-    # Calculate total time remaining
-    quarters_left = 4 - quarter
-    total_seconds = (quarters_left * 15 * 60) + time_left_in_q
-    total_minutes = total_seconds / 60
-    
-    if quarter >= 5:  # Overtime
-        return "🚨 OVERTIME", "#ff0000"
-    
-    # Trailing team pressure
-    if is_trailing:
-        if quarter == 4 and total_minutes <= 5 and abs(score_diff) > 8:
-            return "PANIC", "#ff0000"
-        elif quarter == 4 and total_minutes <= 10:
-            return "HIGH", "#ff8800"
-        elif quarter >= 3:
-            return "ELEVATED", "#ffaa00"
-    
-    # General pressure
-    if quarter == 4 and total_minutes <= 5:
-        return "HIGH", "#ff8800"
-    elif quarter == 4:
-        return "ELEVATED", "#ffaa00"
-    elif quarter == 3 and minutes <= 7:
-        return "MODERATE", "#ffff00"
-    else:
-        return "LOW", "#44ff44"
-
-def calc_scoring_drought(game_key, current_total, current_time):
-    """Calculate time since last score - uses only score + clock"""
-    last_total = st.session_state.last_scores.get(game_key, 0)
-    
-    if current_total != last_total:
-        # Score changed - update tracking
-        st.session_state.last_scores[game_key] = current_total
-        st.session_state.score_change_times[game_key] = current_time
-        return "JUST SCORED", "#44ff44", "0:00"
-    
-    # Get time since last score
-    last_score_time = st.session_state.score_change_times.get(game_key)
-    if not last_score_time:
-        st.session_state.score_change_times[game_key] = current_time
-        return "TRACKING", "#888888", "—"
-    
-    # Calculate drought duration
-    try:
-        drought_seconds = (current_time - last_score_time).total_seconds()
-        drought_minutes = drought_seconds / 60
-        drought_str = f"{int(drought_minutes)}:{int(drought_seconds % 60):02d}"
-        
-        if drought_minutes < 3:
-            return "NORMAL", "#44ff44", drought_str
-        elif drought_minutes < 6:
-            return "MODERATE", "#ffaa00", drought_str
-        else:
-            return "LONG", "#ff8800", drought_str
-    except:
-        return "—", "#888888", "—"
-
-def calc_blowout_risk(score_diff, quarter, clock_str):
-    """Calculate blowout risk - uses only score margin + time"""
-    try:
-        parts = clock_str.split(":")
-        minutes = int(parts[0])
-    except:
-        minutes = 15
-    
-    if quarter <= 2:
-        if score_diff >= 21:
-            return "MODERATE", "#ffaa00"
-        else:
-            return "LOW", "#44ff44"
-    elif quarter == 3:
-        if score_diff >= 24:
-            return "HIGH", "#ff8800"
-        elif score_diff >= 17:
-            return "MODERATE", "#ffaa00"
-        else:
-            return "LOW", "#44ff44"
-    else:  # Q4
-        if score_diff >= 17:
-            return "BLOWOUT", "#ff0000"
-        elif score_diff >= 14:
-            return "HIGH", "#ff8800"
-        elif score_diff >= 9:
-            return "MODERATE", "#ffaa00"
-        else:
-            return "LOW", "#44ff44"
-
-def calc_momentum(game_key, possession_team, yards_to_endzone, home_team, away_team):
-    """Calculate momentum state - uses only field position trend"""
-    # Store field position history
-    history_key = f"{game_key}_field_history"
-    if history_key not in st.session_state:
-        st.session_state[history_key] = []
-    
-    if possession_team and yards_to_endzone:
-        st.session_state[history_key].append({
-            "team": possession_team,
-            "yds": yards_to_endzone,
-            "time": datetime.now(eastern)
-        })
-        # Keep last 10 data points
-        st.session_state[history_key] = st.session_state[history_key][-10:]
-    
-    history = st.session_state[history_key]
-    if len(history) < 3:
-        return "NEUTRAL", "#888888"
-    
-    # Check recent trend
-    recent = history[-3:]
-    same_team = all(h["team"] == recent[0]["team"] for h in recent)
-    
-    if same_team and recent[0]["team"]:
-        # Check if advancing (yards decreasing toward 0)
-        if recent[-1]["yds"] < recent[0]["yds"] - 10:
-            return "ADVANCING", "#44ff44"
-        elif recent[-1]["yds"] > recent[0]["yds"] + 5:
-            return "STALLED", "#ff8800"
-    
-    return "NEUTRAL", "#888888"
-
-# ========== FOOTBALL FIELD VISUALIZATION ==========
-def render_football_field(ball_yard, down, distance, possession_team, away_team, home_team, yards_to_endzone=None, poss_text=None):
-    """Render football field with ball position - uses only yard line data"""
-    away_code = KALSHI_CODES.get(away_team, away_team[:3].upper())
-    home_code = KALSHI_CODES.get(home_team, home_team[:3].upper())
-    
-    if not possession_team or not poss_text:
-        return f"""
-        <div style="background:#1a1a1a;padding:15px;border-radius:10px;margin:10px 0;text-align:center">
-            <span style="color:#ffaa00;font-size:1.1em">🏈 Between Plays</span>
-        </div>
-        """
-    
-    ball_yard = max(0, min(100, ball_yard))
-    ball_pct = 10 + (ball_yard / 100) * 80
-    
-    if down and distance:
-        situation = f"{down} & {distance}"
-    else:
-        situation = "—"
-    
-    poss_code = KALSHI_CODES.get(possession_team, possession_team[:3].upper() if possession_team else "???")
-    ball_loc = poss_text if poss_text else ""
-    
-    field_html = f"""
-    <div style="background:#1a1a1a;padding:15px;border-radius:10px;margin:10px 0">
-        <div style="display:flex;justify-content:space-between;margin-bottom:8px">
-            <span style="color:#ffaa00;font-weight:bold">🏈 {poss_code}</span>
-            <span style="color:#aaa">{ball_loc}</span>
-            <span style="color:#fff;font-weight:bold">{situation}</span>
-        </div>
-        <div style="position:relative;height:60px;background:linear-gradient(90deg,#8B0000 0%,#8B0000 10%,#228B22 10%,#228B22 90%,#00008B 90%,#00008B 100%);border-radius:8px;overflow:hidden">
-            <div style="position:absolute;left:10%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:20%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:30%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:40%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:50%;top:0;bottom:0;width:2px;background:rgba(255,255,255,0.6)"></div>
-            <div style="position:absolute;left:60%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:70%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:80%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:90%;top:0;bottom:0;width:1px;background:rgba(255,255,255,0.3)"></div>
-            <div style="position:absolute;left:{ball_pct}%;top:50%;transform:translate(-50%,-50%);font-size:24px;text-shadow:0 0 10px #fff">🏈</div>
-            <div style="position:absolute;left:5%;top:50%;transform:translate(-50%,-50%);color:#fff;font-weight:bold;font-size:12px">{away_code}</div>
-            <div style="position:absolute;left:95%;top:50%;transform:translate(-50%,-50%);color:#fff;font-weight:bold;font-size:12px">{home_code}</div>
-        </div>
-        <div style="display:flex;justify-content:space-between;margin-top:5px;color:#888;font-size:11px">
-            <span>← {away_code}</span>
-            <span>10</span>
-            <span>20</span>
-            <span>30</span>
-            <span>40</span>
-            <span>50</span>
-            <span>40</span>
-            <span>30</span>
-            <span>20</span>
-            <span>10</span>
-            <span>{home_code} →</span>
-        </div>
-    </div>
-    """
-    return field_html
-
-# ========== SIGNAL FEED DISPLAY ==========
-def render_signal_feed(g, game_key):
-    """Render the SaaS-safe signal feed - NO play text, NO player names"""
-    now_time = datetime.now(eastern)
-    
-    # Calculate all signals
-    field_pressure, field_color = calc_field_pressure(
-        g.get('yards_to_endzone'), 
-        g.get('possession_team'), 
-        g.get('home_team')
-    )
-    
-    down_stress, down_color = calc_down_stress(g.get('down'), g.get('distance'))
-    
-    score_diff = abs(g['home_score'] - g['away_score'])
-    is_home_trailing = g['home_score'] < g['away_score']
-    is_away_trailing = g['away_score'] < g['home_score']
-    poss_team = g.get('possession_team')
-    is_trailing = (poss_team == g['home_team'] and is_home_trailing) or \
-                  (poss_team == g['away_team'] and is_away_trailing)
-    
-    clock_pressure, clock_color = calc_clock_pressure(
-        g['period'], 
-        g['clock'], 
-        score_diff if is_trailing else -score_diff,
-        is_trailing
-    )
-    
-    drought_status, drought_color, drought_time = calc_scoring_drought(
-        game_key, 
-        g['total'], 
-        now_time
-    )
-    
-    blowout_status, blowout_color = calc_blowout_risk(score_diff, g['period'], g['clock'])
-    
-    momentum_status, momentum_color = calc_momentum(
-        game_key,
-        g.get('possession_team'),
-        g.get('yards_to_endzone'),
-        g.get('home_team'),
-        g.get('away_team')
-    )
-    
-    # Build signal feed HTML
-    signal_html = f"""
-    <div style="background:#0d1117;padding:15px;border-radius:10px;margin:10px 0;border:1px solid #30363d">
-        <div style="color:#58a6ff;font-weight:bold;margin-bottom:12px;font-size:1.1em">📡 LIVE SIGNAL FEED</div>
-        
-        <div style="display:grid;grid-template-columns:1fr 1fr;gap:10px">
-            <div style="background:#161b22;padding:10px;border-radius:8px">
-                <div style="color:#888;font-size:0.8em">Field Position</div>
-                <div style="color:{field_color};font-weight:bold;font-size:1.1em">{field_pressure}</div>
-            </div>
-            
-            <div style="background:#161b22;padding:10px;border-radius:8px">
-                <div style="color:#888;font-size:0.8em">Down Stress</div>
-                <div style="color:{down_color};font-weight:bold;font-size:1.1em">{down_stress}</div>
-            </div>
-            
-            <div style="background:#161b22;padding:10px;border-radius:8px">
-                <div style="color:#888;font-size:0.8em">Clock Pressure</div>
-                <div style="color:{clock_color};font-weight:bold;font-size:1.1em">{clock_pressure}</div>
-            </div>
-            
-            <div style="background:#161b22;padding:10px;border-radius:8px">
-                <div style="color:#888;font-size:0.8em">Scoring Drought</div>
-                <div style="color:{drought_color};font-weight:bold;font-size:1.1em">{drought_status}</div>
-                <div style="color:#888;font-size:0.8em">{drought_time}</div>
-            </div>
-            
-            <div style="background:#161b22;padding:10px;border-radius:8px">
-                <div style="color:#888;font-size:0.8em">Momentum</div>
-                <div style="color:{momentum_color};font-weight:bold;font-size:1.1em">{momentum_status}</div>
-            </div>
-            
-            <div style="background:#161b22;padding:10px;border-radius:8px">
-                <div style="color:#888;font-size:0.8em">Blowout Risk</div>
-                <div style="color:{blowout_color};font-weight:bold;font-size:1.1em">{blowout_status}</div>
-            </div>
-        </div>
-    </div>
-    """
-    return signal_html
-
-# ========== ESPN DATA ==========
-def fetch_espn_scores():
-    url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-    try:
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
-        games = {}
-        for event in data.get("events", []):
-            event_id = event.get("id", "")
-            comp = event.get("competitions", [{}])[0]
-            competitors = comp.get("competitors", [])
-            if len(competitors) < 2:
-                continue
-            home_team, away_team, home_score, away_score = None, None, 0, 0
-            home_id, away_id = None, None
-            for c in competitors:
-                name = c.get("team", {}).get("displayName", "")
-                team_name = TEAM_ABBREVS.get(name, name)
-                team_id = c.get("team", {}).get("id", "")
-                score = int(c.get("score", 0) or 0)
-                if c.get("homeAway") == "home":
-                    home_team, home_score, home_id = team_name, score, team_id
-                else:
-                    away_team, away_score, away_id = team_name, score, team_id
-            
-            status_obj = event.get("status", {})
-            status_type = status_obj.get("type", {}).get("name", "STATUS_SCHEDULED")
-            clock = status_obj.get("displayClock", "")
-            period = status_obj.get("period", 0)
-            
-            situation = comp.get("situation", {})
-            down = situation.get("down")
-            distance = situation.get("distance")
-            yard_line = situation.get("yardLine", 50)
-            yards_to_endzone = situation.get("yardsToEndzone", 50)
-            possession_id = situation.get("possession", "")
-            is_red_zone = situation.get("isRedZone", False)
-            poss_text = situation.get("possessionText", "")
-            
-            if possession_id == home_id:
-                possession_team = home_team
-                is_home_possession = True
-            elif possession_id == away_id:
-                possession_team = away_team
-                is_home_possession = False
-            else:
-                possession_team = None
-                is_home_possession = None
-            
-            if yards_to_endzone is not None and is_home_possession is not None:
-                if is_home_possession:
-                    ball_yard = yards_to_endzone
-                else:
-                    ball_yard = 100 - yards_to_endzone
-            else:
-                ball_yard = 50
-            
-            game_date_str = event.get("date", "")
-            try:
-                game_date = datetime.fromisoformat(game_date_str.replace("Z", "+00:00"))
-            except:
-                game_date = datetime.now(eastern)
-            
-            game_key = f"{away_team}@{home_team}"
-            games[game_key] = {
-                "event_id": event_id,
-                "away_team": away_team, "home_team": home_team,
-                "away_score": away_score, "home_score": home_score,
-                "away_id": away_id, "home_id": home_id,
-                "total": away_score + home_score,
-                "period": period, "clock": clock, "status_type": status_type,
-                "game_date": game_date,
-                "down": down, "distance": distance, "yard_line": yard_line,
-                "yards_to_endzone": yards_to_endzone,
-                "ball_yard": ball_yard, "possession_team": possession_team,
-                "is_red_zone": is_red_zone, "poss_text": poss_text
-            }
-        return games
-    except Exception as e:
-        st.error(f"Data fetch error: {e}")
-        return {}
-
-def fetch_espn_injuries():
-    injuries = {}
-    try:
-        url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/injuries"
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
-        for team_data in data.get("injuries", []):
-            team_name = team_data.get("displayName", "")
-            team_key = TEAM_ABBREVS.get(team_name, team_name)
-            if not team_key:
-                continue
-            injuries[team_key] = []
-            for player in team_data.get("injuries", []):
-                athlete = player.get("athlete", {})
-                name = athlete.get("displayName", "")
-                status = player.get("status", "")
-                position = athlete.get("position", {}).get("abbreviation", "")
-                if name:
-                    injuries[team_key].append({"name": name, "status": status, "position": position})
-    except:
-        pass
-    return injuries
-
-# ========== ML SCORING ==========
-def get_injury_score(team, injuries):
-    team_injuries = injuries.get(team, [])
-    stars = STAR_PLAYERS.get(team, [])
-    score = 0
-    out_players = []
-    qb_out = False
-    
-    for inj in team_injuries:
-        name = inj.get("name", "")
-        status = inj.get("status", "").upper()
-        position = inj.get("position", "").upper()
-        is_star = any(star.lower() in name.lower() for star in stars)
-        is_qb = position == "QB"
-        
-        if "OUT" in status:
-            if is_qb:
-                score += 5.0
-                qb_out = True
-                out_players.append(f"🚨 {name} (QB)")
-            elif is_star:
-                score += 2.0
-                out_players.append(name)
-    
-    return score, out_players, qb_out
-
-def calc_ml_score(home_team, away_team, injuries):
-    home = TEAM_STATS.get(home_team, {})
-    away = TEAM_STATS.get(away_team, {})
-    
-    score_home, score_away = 0, 0
-    reasons_home, reasons_away = [], []
-    
-    home_dvoa = home.get('dvoa', 0)
-    away_dvoa = away.get('dvoa', 0)
-    dvoa_diff = home_dvoa - away_dvoa
-    if dvoa_diff > 8:
-        score_home += 1.0
-        reasons_home.append(f"📊 DVOA +{home_dvoa:.1f}")
-    elif dvoa_diff < -8:
-        score_away += 1.0
-        reasons_away.append(f"📊 DVOA +{away_dvoa:.1f}")
-    
-    home_def = home.get('def_rank', 16)
-    away_def = away.get('def_rank', 16)
-    if home_def <= 5:
-        score_home += 1.0
-        reasons_home.append(f"🛡️ #{home_def} DEF")
-    if away_def <= 5:
-        score_away += 1.0
-        reasons_away.append(f"🛡️ #{away_def} DEF")
-    
-    score_home += 1.0
-    
-    home_inj, home_out, home_qb_out = get_injury_score(home_team, injuries)
-    away_inj, away_out, away_qb_out = get_injury_score(away_team, injuries)
-    
-    if away_qb_out:
-        score_home += 2.5
-        reasons_home.append("🏥 QB Out")
-    if home_qb_out:
-        score_away += 2.5
-        reasons_away.append("🏥 QB Out")
-    
-    home_hw = home.get('home_win_pct', 0.5)
-    if home_hw > 0.65:
-        score_home += 0.8
-        reasons_home.append(f"🏠 {int(home_hw*100)}%")
-    
-    total = score_home + score_away
-    if total > 0:
-        home_final = round((score_home / total) * 10, 1)
-        away_final = round((score_away / total) * 10, 1)
-    else:
-        home_final, away_final = 5.0, 5.0
-    
-    if home_final >= away_final:
-        return home_team, home_final, reasons_home[:4], home_out, away_out
-    else:
-        return away_team, away_final, reasons_away[:4], home_out, away_out
-
-def get_signal_tier(score):
-    if score >= 8.0:
-        return "🟢 STRONG BUY", "#00ff00"
-    elif score >= 6.5:
-        return "🔵 BUY", "#00aaff"
-    elif score >= 5.5:
-        return "🟡 LEAN", "#ffff00"
-    else:
-        return "⚪ TOSS-UP", "#888888"
-
 # ========== FETCH DATA ==========
-games = fetch_espn_scores()
+rerun.phase("fetch")
+if os.environ.get("NFL_POLLER", "1") == "1":
+    scoreboard_poller = start_scoreboard_poller()
+else:
+    scoreboard_poller = None
+feeds = fetch_feeds(("scoreboard", "injuries"), deadline=float(os.environ.get("NFL_FETCH_DEADLINE", 5)))
+games = feeds.values["scoreboard"]
 game_list = sorted(list(games.keys()))
-injuries = fetch_espn_injuries()
-now = datetime.now(eastern)
+injuries = get_injury_index(feeds.values["injuries"], feeds.versions["injuries"])
+now = virtual_now(eastern)
+game_state = get_engine()
+game_state.sync(feeds.versions["scoreboard"], games, now.timestamp())
+# alert rules follow the position book; re-indexed only when it (or the toggle) changes,
+# or when the engine dropped them after the session sat idle for NFL_ALERT_IDLE
+alert_engine = get_alert_engine()
+alert_rules_key = (st.session_state.portfolio.version, st.session_state.alerts_on)
+if st.session_state.get("alert_rules_key") != alert_rules_key or not alert_engine.touch(st.session_state["sid"]):
+    alert_engine.set_rules(st.session_state["sid"], position_rules(st.session_state["sid"], st.session_state.portfolio)
+                           if st.session_state.alerts_on else ())
+    st.session_state.alert_rules_key = alert_rules_key
+alert_engine.sync(feeds.versions["scoreboard"], games, now.timestamp())
+quotes = get_quotes([g.ticker for g in games.values() if g.phase != FINAL],
+                    deadline=float(os.environ.get("NFL_KALSHI_DEADLINE", 1)))
+
+
+def current_scoreboard():
+    """(games, version) of the newest scoreboard snapshot, without waiting on ESPN"""
+    if SCORES_CACHE.peek() is None:
+        return games, feeds.versions["scoreboard"]
+    # with a snapshot in hand this never blocks; an expired one refreshes in the background
+    snap = SCORES_CACHE.get_snapshot(load_scoreboard)
+    return snap.value, snap.version
+
+
+def feed_age(seconds):
+    return f"{seconds:.0f}s" if seconds < 90 else f"{seconds / 60:.0f} min"
+
+
+def stale_note():
+    """' | ⚠️ scores N min old' while scoreboard refreshes are failing, else ''"""
+    snap = SCORES_CACHE.peek()
+    if snap is None or SCORES_CACHE.last_error is None or time.time() < snap.expires_at:
+        return ""
+    return f" | ⚠️ scores {feed_age(time.time() - snap.fetched_at)} old"
+
+
+def game_phases(games):
+    return {k: g.phase for k, g in games.items()}
+
+
+def session_cached(name, key, build):
+    """This session's last build of a section, rebuilt only when `key` changes"""
+    hit = st.session_state.get(name)
+    if hit is None or hit[0] != key:
+        hit = st.session_state[name] = (key, build())
+    return hit[1]
+
+
+script_phases = game_phases(games)
+
+scoreboard_stats = SCORES_CACHE.stats()
+if scoreboard_stats["restored"]:
+    st.caption(f"💾 Saved scoreboard from {scoreboard_stats['age'] / 60:.0f} min ago — live scores load in the background")
+
+if "scoreboard" in feeds.stale:
+    # while ESPN's circuit is open nothing is sent upstream until the retry time
+    circuit = get_client().circuits().get(endpoint(SCOREBOARD_URL))
+    retry = f" · retrying in {max(1, circuit['retry_in'])}s" if circuit and circuit["state"] == "open" else ""
+    if games and "scoreboard" in feeds.errors:
+        st.warning(f"⚠️ ESPN unavailable — showing scores from {feed_age(scoreboard_stats['age'])} ago{retry}")
+    elif games:
+        st.warning("⏳ ESPN is slow — showing the last scoreboard snapshot")
+    elif "scoreboard" in feeds.errors:
+        st.error(f"Data fetch error: {feeds.errors['scoreboard']}{retry}")
+    else:
+        st.warning("⏳ Waiting on ESPN — scores will appear on the next refresh")
 
 # ========== SIDEBAR ==========
+rerun.phase("sidebar")
 with st.sidebar:
     st.header("⚡ LiveState")
     st.caption("Pre-resolution stress detection")
@@ -701,244 +165,271 @@ with st.sidebar:
     st.header("📖 ML LEGEND")
     st.markdown("🟢 **STRONG** → 8.0+\n\n🔵 **BUY** → 6.5-7.9\n\n🟡 **LEAN** → 5.5-6.4")
     st.divider()
+    for c in (SCORES_CACHE.stats(), INJURIES_CACHE.stats()):
+        age = f"{c['age']:.0f}s" if c['age'] is not None else "—"
+        st.caption(f"📦 {c['name']}: {c['hits'] + c['stale_hits']} hit / {c['misses']} miss / age {age}")
+    if scoreboard_poller:
+        p = scoreboard_poller.stats()
+        st.caption(f"🛰️ poller: {p['mode']} · next poll {p['next_in']}s")
+    if REPLAY_PATH:
+        st.caption(f"⏯️ replay {REPLAY_SPEED:g}× · {now.strftime('%a %I:%M:%S %p ET')}")
+    h = get_client().stats()
+    st.caption(f"🌐 http: {h['requests']} req · {h['not_modified_rate']:.0%} 304 · {h['wire_bytes'] / 1024:.0f} KB" +
+               (f" · {h['failures']} failed" if h["failures"] else "") +
+               (f" · {h['hedged']} hedged ({h['hedge_wins']} won)" if h["hedged"] else "") +
+               (f" · ⛔ {h['open_circuits']} circuit open" if h["open_circuits"] else ""))
+    st.toggle("🔔 Alerts for my games", key="alerts_on", help="Red zone, 4th down, overtime and picks falling BEHIND")
+    a = alert_engine.stats()
+    st.caption(f"🔔 alerts: {a['rules']} rules · {a['delivered']} sent · {a['suppressed']} held back")
+    r = render_stats()
+    st.caption(f"🖼️ render: field {r['field']['hit_rate']:.0%} hit · feed {r['signal_feed']['hit_rate']:.0%} hit")
+    if METRICS_ENABLED and ADMIN_KEY and st.query_params.get("admin") == ADMIN_KEY:
+        with st.expander("⏱️ Timings (recent reruns)"):
+            st.table(metrics_snapshot())
     st.caption("v2.0 NFL EDGE (SaaS)")
 
 # ========== TITLE ==========
 st.title("🏈 NFL EDGE FINDER")
 st.caption("Live Signal Feed + Pre-game ML Picks")
 
-# ========== LIVESTATE ==========
-live_games = {k: v for k, v in games.items() if v['period'] > 0 and v['status_type'] != "STATUS_FINAL"}
-final_games = {k: v for k, v in games.items() if v['status_type'] == "STATUS_FINAL"}
-
-if live_games or final_games:
+hdr1, hdr2, hdr3 = st.columns([3, 1, 1])
+hdr1.caption(auto_status)
+if hdr2.button("🔄 Auto" if not st.session_state.auto_refresh else "⏹️ Stop", use_container_width=True, key="auto_live"):
+    st.session_state.auto_refresh = not st.session_state.auto_refresh
+    st.rerun()
+if hdr3.button("🔄 Now", use_container_width=True, key="refresh_live"):
+    st.query_params["r"] = str(int(time.time()))
+    st.rerun()
+
+# ========== LIVE SECTIONS ==========
+# LiveState and ACTIVE POSITIONS run as one fragment on a one-second tick instead
+# of a full-page refresh. The fragment holds no widgets: each section is captions
+# plus one HTML element. Only a new snapshot version re-syncs the engines and
+# rebuilds the position cards; ticks in between re-emit this session's last HTML.
+# LiveState is rebuilt once a second while games are live, for the drought clock. A
+# kickoff or a final changes ML PICKS and the position picker too, so that
+# promotes the tick to a full rerun. Position controls run with the page.
+rerun.phase("live")
+GAMES_PER_PAGE = int(os.environ.get("NFL_POSITIONS_GAMES_PER_PAGE", 8))
+POSITIONS_PER_PAGE = int(os.environ.get("NFL_POSITIONS_PER_PAGE", 20))
+
+
+def status_line(now):
+    return f"🕒 {now.strftime('%I:%M:%S %p ET')} | v2.0{stale_note()}"
+
+
+def live_state_html(live_games, final_games, now):
+    """Final cards, then each live game's card, field, signal feed and trade link, as one HTML string"""
+    parts = [render_final_card(g) for g in final_games.values()]
+    for (game_key, g), labels in zip(live_games.items(), evaluate_labels(list(live_games.values()))):
+        parts.append(render_live_card(g, live_state(g)))
+        parts.append(render_football_field(g))
+        # SIGNAL FEED (replaces play-by-play)
+        parts.append(render_signal_feed(labels, game_state.drought(g.event_id, now.timestamp()),
+                                        game_state.momentum(g.event_id)))
+        parts.append(render_trade_link(f"🔗 Trade {game_key.replace('@', ' @ ')}", market_url(g.ticker)))
+    return HtmlBlock("".join(parts))
+
+
+def off_board_refs(portfolio, games):
+    """{game_key: (game_key, event_id, kickoff)} for held games no longer on the scoreboard"""
+    refs = {}
+    for key, book in portfolio.by_game.items():
+        if key not in games:
+            pos = next(iter(book.positions.values()))
+            refs[key] = (key, pos.get("event_id"), pos.get("kickoff"))
+    return refs
+
+
+def positions_view(portfolio, games, quotes, off_board, resolved):
+    """Summary captions, ordered books and the current page's cards for one scoreboard/quotes/book version"""
+    # games off the current board (earlier weeks, postseason) come from the background resolver
+    board = games
+    if off_board:
+        board = {**{key: g for key, ref in off_board.items() if (g := resolved.find(key, ref[1])) is not None},
+                 **games}
+    exposure = portfolio.exposure(board)
+    marks = {}
+    for key in portfolio.by_game:
+        g = board.get(key)
+        if g is not None and g.phase != FINAL:
+            marks[key] = game_marks(g, quotes)
+    open_mtm = [m for m in (portfolio.by_game[key].mark_to_market(game) for key, game in marks.items()) if m is not None]
+    teams = sorted(portfolio.by_team().items(), key=lambda t: t[1], reverse=True)[:4]
+    days = sorted(portfolio.by_day(board, eastern).items())
+
+    books = portfolio.books(board)
+    pages = -(-len(books) // GAMES_PER_PAGE)
+    page = min(st.session_state.positions_page, pages - 1)
+    shown = books[page * GAMES_PER_PAGE:(page + 1) * GAMES_PER_PAGE]
+    cards = []
+    for book in shown:
+        g = board.get(book.game_key)
+        book_marks = marks.get(book.game_key, {})
+        if len(book) == 1:
+            cards.append(render_position_card(next(iter(book.positions.values())), g, book_marks))
+        else:
+            cards.append(render_book_card(book, g, book_marks))
+        cards.append(render_trade_link("🔗 Trade on Kalshi", game_url(g, book.game_key)))
+    return {
+        "board": board, "marks": marks, "books": books, "shown": shown, "page": page, "pages": pages,
+        "cards": HtmlBlock("".join(cards)),
+        "summary": (f"💼 {exposure.positions} positions · {exposure.contracts} contracts · cost ${exposure.cost:,.2f} · "
+                    f"realized {signed(exposure.realized)} · at risk ${exposure.open_cost:,.2f}" +
+                    (f" · MTM {signed(sum(open_mtm))}" if open_mtm else "")),
+        "split": ("🎯 " + " · ".join(f"{team} ${cost:,.2f}" for team, cost in teams) +
+                  (" | 📅 " + " · ".join(f"{day:%a %m/%d} ${cost:,.2f}" for day, cost in days) if days else "")),
+    }
+
+
+def live_state_section(live_games, final_games, version, now):
+    if not live_games and not final_games:
+        return
     st.subheader("⚡ LiveState — Live Signal Feed")
     st.caption("Derived signals only • No play descriptions • SaaS-safe")
-    
-    hdr1, hdr2, hdr3 = st.columns([3, 1, 1])
-    hdr1.caption(f"{auto_status} | {now.strftime('%I:%M:%S %p ET')} | v2.0")
-    if hdr2.button("🔄 Auto" if not st.session_state.auto_refresh else "⏹️ Stop", use_container_width=True, key="auto_live"):
-        st.session_state.auto_refresh = not st.session_state.auto_refresh
-        st.rerun()
-    if hdr3.button("🔄 Now", use_container_width=True, key="refresh_live"):
-        st.query_params["r"] = str(int(time.time()))
-        st.rerun()
-    
-    # FINAL GAMES
-    for game_key, g in final_games.items():
-        parts = game_key.split("@")
-        winner = parts[1] if g['home_score'] > g['away_score'] else parts[0]
-        winner_code = KALSHI_CODES.get(winner, winner[:3].upper())
-        
-        st.markdown(f"""
-        <div style="background:linear-gradient(135deg,#1a2e1a,#0a1e0a);padding:18px;border-radius:12px;border:2px solid #44ff44;margin-bottom:15px">
-            <div style="text-align:center">
-                <b style="color:#fff;font-size:1.4em">{g['away_team']} {g['away_score']} @ {g['home_team']} {g['home_score']}</b>
-                <span style="color:#44ff44;margin-left:20px;font-size:1.2em">✅ RESOLVED</span>
-            </div>
-            <div style="background:#000;padding:12px;border-radius:8px;margin-top:12px;text-align:center">
-                <span style="color:#44ff44;font-size:1.2em">FINAL | {winner_code} WIN | Uncertainty resolved</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # LIVE GAMES
-    for game_key, g in live_games.items():
-        quarter = g['period']
-        clock_str = g['clock']
-        away_score = g['away_score']
-        home_score = g['home_score']
-        score_diff = abs(home_score - away_score)
-        
-        if score_diff >= 17:
-            score_pressure = "Blowout"
-        elif score_diff >= 9:
-            score_pressure = "Two Poss"
-        else:
-            score_pressure = "One Poss"
-        
-        if quarter >= 5:
-            state_label = "MAX UNCERTAINTY"
-            state_color = "#ff0000"
-            expected_leak = "3-7¢"
-            q_display = "🏈 OVERTIME"
-            clock_pressure = "🚨 OVERTIME"
-        elif quarter == 4 and score_diff <= 8:
-            state_label = "ELEVATED"
-            state_color = "#ffaa00"
-            expected_leak = "1-4¢"
-            q_display = f"Q{quarter}"
-            clock_pressure = "Q4 Crunch"
-        else:
-            state_label = "NORMAL"
-            state_color = "#44ff44"
-            expected_leak = "—"
-            q_display = f"Q{quarter}"
-            clock_pressure = f"Q{quarter}"
-        
-        st.markdown(f"""
-        <div style="background:linear-gradient(135deg,#1a1a2e,#0a0a1e);padding:18px;border-radius:12px;border:2px solid {state_color};margin-bottom:15px">
-            <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:12px">
-                <div style="flex:1"></div>
-                <div style="text-align:center;flex:2">
-                    <b style="color:#fff;font-size:1.4em">{g['away_team']} {away_score} @ {g['home_team']} {home_score}</b>
-                </div>
-                <div style="text-align:right;flex:1">
-                    <b style="color:{state_color};font-size:1.4em">{state_label}</b>
-                    <div style="color:#888;font-size:0.85em">Price Move: {expected_leak}</div>
-                </div>
-            </div>
-            <div style="background:#000;padding:15px;border-radius:8px;text-align:center">
-                <span style="color:{state_color};font-size:1.3em;font-weight:bold">{q_display} {clock_str}</span>
-            </div>
-            <div style="text-align:center;margin-top:12px">
-                <span style="color:{state_color};font-size:1.1em">{clock_pressure}</span> • 
-                <span style="color:#ffaa44;font-size:1.1em">{score_pressure}</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Football field
-        parts = game_key.split("@")
-        field_html = render_football_field(
-            g.get('ball_yard', 50),
-            g.get('down'),
-            g.get('distance'),
-            g.get('possession_team'),
-            parts[0],
-            parts[1],
-            g.get('yards_to_endzone'),
-            g.get('poss_text')
-        )
-        st.markdown(field_html, unsafe_allow_html=True)
-        
-        # SIGNAL FEED (replaces play-by-play)
-        signal_html = render_signal_feed(g, game_key)
-        st.markdown(signal_html, unsafe_allow_html=True)
-        
-        kalshi_url = build_kalshi_ml_url(parts[0], parts[1], g.get('game_date'))
-        st.link_button(f"🔗 Trade {game_key.replace('@', ' @ ')}", kalshi_url, use_container_width=True)
-    
+    st.caption(status_line(now))
+    # the drought clock ticks every second, so live games re-render on each whole second
+    key = (version, int(now.timestamp())) if live_games else version
+    st.html(session_cached("live_state_html", key, lambda: live_state_html(live_games, final_games, now)))
     st.divider()
 
-# ========== ACTIVE POSITIONS ==========
-st.subheader("📈 ACTIVE POSITIONS")
 
-if not live_games and not final_games:
-    hdr1, hdr2, hdr3 = st.columns([3, 1, 1])
-    hdr1.caption(f"{auto_status} | {now.strftime('%I:%M:%S %p ET')} | v2.0")
-    if hdr2.button("🔄 Auto" if not st.session_state.auto_refresh else "⏹️ Stop", use_container_width=True, key="auto_pos"):
-        st.session_state.auto_refresh = not st.session_state.auto_refresh
+def positions_section(games, version, now, show_status):
+    """Exposure summary and one card per held game on the current page"""
+    st.subheader("📈 ACTIVE POSITIONS")
+    if show_status:
+        st.caption(status_line(now))
+
+    portfolio = st.session_state.portfolio
+    if not len(portfolio):
+        st.info("No positions — add below")
+        return
+    # called every tick so expired quotes refresh; the view is rebuilt only when something it shows changed
+    live_quotes = get_quotes([g.ticker for g in games.values() if g.phase != FINAL], deadline=0)
+    off_board = off_board_refs(portfolio, games)
+    resolved, resolved_version = (want_games(st.session_state["sid"], off_board.values()) if off_board
+                                  else (None, 0))
+    view = session_cached("positions_view", (version, quotes_version(), portfolio.version,
+                                             resolved_version, st.session_state.positions_page),
+                          lambda: positions_view(portfolio, games, live_quotes, off_board, resolved))
+    st.caption(view["summary"])
+    st.caption(view["split"])
+    if view["pages"] > 1:
+        first = view["page"] * GAMES_PER_PAGE
+        st.caption(f"Games {first + 1}–{first + len(view['shown'])} of {len(view['books'])}")
+    st.html(view["cards"])
+
+
+@st.fragment(run_every=live_every)
+def live_sections():
+    games, version = current_scoreboard()
+    now = virtual_now(eastern)
+    if st.session_state.get("live_version") != version:
+        game_state.sync(version, games, now.timestamp())
+        alert_engine.sync(version, games, now.timestamp())
+        if game_phases(games) != script_phases:
+            st.rerun()
+        st.session_state.live_version = version
+    for alert in drain_alerts(st.session_state["sid"]):
+        st.toast(alert.text)
+    live_games = {k: v for k, v in games.items() if v.phase == LIVE}
+    final_games = {k: v for k, v in games.items() if v.phase == FINAL}
+    with span("live_state"):
+        live_state_section(live_games, final_games, version, now)
+    with span("positions"):
+        positions_section(games, version, now, show_status=not live_games and not final_games)
+
+
+def position_card(pos, g, parts, marks):
+    """One position's card with its trade/edit/delete buttons (and edit form when open)"""
+    pos_id = pos['id']
+    st.markdown(render_position_card(pos, g, marks), unsafe_allow_html=True)
+
+    btn1, btn2, btn3 = st.columns([3, 1, 1])
+    btn1.link_button("🔗 Trade on Kalshi", game_url(g, pos['game']), use_container_width=True)
+    if btn2.button("✏️", key=f"edit_{pos_id}"):
+        st.session_state.editing_position = pos_id if st.session_state.editing_position != pos_id else None
         st.rerun()
-    if hdr3.button("🔄 Refresh", use_container_width=True, key="refresh_pos"):
-        st.query_params["r"] = str(int(time.time()))
+    if btn3.button("🗑️", key=f"del_{pos_id}"):
+        st.session_state.portfolio.remove(pos_id)
+        position_store.delete(st.session_state["sid"], pos_id)
         st.rerun()
 
-if st.session_state.positions:
-    for idx, pos in enumerate(st.session_state.positions):
-        game_key = pos['game']
-        g = games.get(game_key)
-        price = pos.get('price', 50)
-        contracts = pos.get('contracts', 1)
-        cost = round(price * contracts / 100, 2)
-        potential_win = round((100 - price) * contracts / 100, 2)
-        
-        if g:
-            pick = pos.get('pick', '')
-            parts = game_key.split("@")
-            away_team, home_team = parts[0], parts[1]
-            home_score, away_score = g['home_score'], g['away_score']
-            pick_score = home_score if pick == home_team else away_score
-            opp_score = away_score if pick == home_team else home_score
-            lead = pick_score - opp_score
-            is_final = g['status_type'] == "STATUS_FINAL"
-            game_status = "FINAL" if is_final else f"Q{g['period']} {g['clock']}" if g['period'] > 0 else "SCHEDULED"
-            
-            if is_final:
-                won = pick_score > opp_score
-                status_label = "✅ WON!" if won else "❌ LOST"
-                status_color = "#00ff00" if won else "#ff0000"
-                pnl = f"+${potential_win:.2f}" if won else f"-${cost:.2f}"
-                pnl_color = "#00ff00" if won else "#ff0000"
-            elif g['period'] > 0:
-                if lead >= 14:
-                    status_label, status_color = "🟢 CRUISING", "#00ff00"
-                elif lead >= 7:
-                    status_label, status_color = "🟢 LEADING", "#00ff00"
-                elif lead >= 1:
-                    status_label, status_color = "🟡 AHEAD", "#ffff00"
-                elif lead >= -7:
-                    status_label, status_color = "🟠 CLOSE", "#ff8800"
-                else:
-                    status_label, status_color = "🔴 BEHIND", "#ff0000"
-                pnl, pnl_color = f"Win: +${potential_win:.2f}", "#888"
-            else:
-                status_label, status_color = "⏳ SCHEDULED", "#888"
-                lead = 0
-                pnl, pnl_color = f"Win: +${potential_win:.2f}", "#888"
-            
-            st.markdown(f"""<div style='background:linear-gradient(135deg,#1a1a2e,#16213e);padding:15px;border-radius:10px;border:2px solid {status_color};margin-bottom:10px'>
-            <div style='display:flex;justify-content:space-between'>
-            <div><b style='color:#fff;font-size:1.2em'>{game_key.replace('@', ' @ ')}</b> <span style='color:#888'>{game_status}</span></div>
-            <b style='color:{status_color};font-size:1.3em'>{status_label}</b>
-            </div>
-            <div style='margin-top:10px;color:#aaa'>🎯 Pick: <b style='color:#fff'>{pick}</b> | 💵 {contracts}x @ {price}¢ (${cost:.2f}) | 📊 {pick_score}-{opp_score} | Lead: <b style='color:{status_color}'>{lead:+d}</b> | <span style='color:{pnl_color}'>{pnl}</span></div></div>""", unsafe_allow_html=True)
-            
-            btn1, btn2, btn3 = st.columns([3, 1, 1])
-            kalshi_url = build_kalshi_ml_url(parts[0], parts[1], g.get('game_date'))
-            btn1.link_button("🔗 Trade on Kalshi", kalshi_url, use_container_width=True)
-            if btn2.button("✏️", key=f"edit_{idx}"):
-                st.session_state.editing_position = idx if st.session_state.editing_position != idx else None
-                st.rerun()
-            if btn3.button("🗑️", key=f"del_{idx}"):
-                st.session_state.positions.pop(idx)
-                save_positions(st.session_state.positions)
-                st.rerun()
-            
-            if st.session_state.editing_position == idx:
-                e1, e2, e3 = st.columns(3)
-                new_price = e1.number_input("Entry ¢", min_value=1, max_value=99, value=pos.get('price', 50), key=f"price_{idx}")
-                new_contracts = e2.number_input("Contracts", min_value=1, value=pos.get('contracts', 1), key=f"contracts_{idx}")
-                pick_options = [parts[1], parts[0]]
-                current_pick = pos.get('pick', parts[1])
-                pick_idx = pick_options.index(current_pick) if current_pick in pick_options else 0
-                new_pick = e3.radio("Pick", pick_options, index=pick_idx, horizontal=True, key=f"pick_{idx}")
-                
-                if st.button("💾 Save", key=f"save_{idx}", type="primary"):
-                    st.session_state.positions[idx]['price'] = new_price
-                    st.session_state.positions[idx]['contracts'] = new_contracts
-                    st.session_state.positions[idx]['pick'] = new_pick
-                    st.session_state.editing_position = None
-                    save_positions(st.session_state.positions)
-                    st.rerun()
-    
+    if st.session_state.editing_position == pos_id:
+        e1, e2, e3 = st.columns(3)
+        new_price = e1.number_input("Entry ¢", min_value=1, max_value=99, value=pos.get('price', 50), key=f"price_{pos_id}")
+        new_contracts = e2.number_input("Contracts", min_value=1, value=pos.get('contracts', 1), key=f"contracts_{pos_id}")
+        pick_options = [parts[1], parts[0]]
+        current_pick = pos.get('pick', parts[1])
+        pick_idx = pick_options.index(current_pick) if current_pick in pick_options else 0
+        new_pick = e3.radio("Pick", pick_options, index=pick_idx, horizontal=True, key=f"pick_{pos_id}")
+
+        if st.button("💾 Save", key=f"save_{pos_id}", type="primary"):
+            st.session_state.portfolio.update(pos_id, price=new_price, contracts=new_contracts, pick=new_pick)
+            st.session_state.editing_position = None
+            position_store.update(st.session_state["sid"], pos_id,
+                                  price=new_price, contracts=new_contracts, pick=new_pick)
+            st.rerun()
+
+
+def position_controls():
+    """Paging, per-game position management and Clear All, outside the live tick"""
+    portfolio = st.session_state.portfolio
+    if not len(portfolio):
+        return
+    # the fragment ran just above in this same script run, so its view is current
+    view = st.session_state.positions_view[1]
+    page, pages = view["page"], view["pages"]
+    if pages > 1:
+        pg1, pg2 = st.columns(2)
+        if pg1.button("◀ Previous games", use_container_width=True, disabled=page == 0, key="pos_prev"):
+            st.session_state.positions_page = page - 1
+            st.rerun()
+        if pg2.button("Next games ▶", use_container_width=True, disabled=page == pages - 1, key="pos_next"):
+            st.session_state.positions_page = page + 1
+            st.rerun()
+
+    options = [None] + [book.game_key for book in view["shown"]]
+    if st.session_state.managing_game not in options:
+        st.session_state.managing_game = None
+    st.selectbox("📂 Manage positions", options, key="managing_game",
+                 format_func=lambda k: "—" if k is None else f"{k.replace('@', ' @ ')} ({len(portfolio.by_game[k])})")
+    game_key = st.session_state.managing_game
+    if game_key is not None:
+        # per-position cards and their widgets exist only for the game being managed
+        book = portfolio.by_game[game_key]
+        g = view["board"].get(game_key)
+        parts = game_key.split("@")
+        row_pages = -(-len(book) // POSITIONS_PER_PAGE)
+        row_page = 0
+        if row_pages > 1:
+            row_page = st.number_input(f"Page (of {row_pages})", min_value=1, max_value=row_pages,
+                                       key=f"manage_page_{game_key}") - 1
+        first = row_page * POSITIONS_PER_PAGE
+        for pos in islice(book.positions.values(), first, first + POSITIONS_PER_PAGE):
+            position_card(pos, g, parts, view["marks"].get(game_key, {}))
+
     if st.button("🗑️ Clear All", use_container_width=True):
-        st.session_state.positions = []
-        save_positions(st.session_state.positions)
+        portfolio.clear()
+        position_store.clear(st.session_state["sid"])
         st.rerun()
-else:
-    st.info("No positions — add below")
 
+
+live_sections()
+position_controls()
 st.divider()
 
 # ========== ML PICKS ==========
+rerun.phase("ml_picks")
 st.subheader("🎯 PRE-GAME ML PICKS")
 
+scheduled = [g for g in games.values() if g.status_type == "STATUS_SCHEDULED"]
 ml_results = []
-for game_key, g in games.items():
-    if g['status_type'] != "STATUS_SCHEDULED":
-        continue
-    away = g["away_team"]
-    home = g["home_team"]
-    try:
-        pick, score, reasons, home_out, away_out = calc_ml_score(home, away, injuries)
-        tier, color = get_signal_tier(score)
-        ml_results.append({
-            "pick": pick, "score": score, "color": color, "reasons": reasons,
-            "away": away, "home": home, "game_date": g.get('game_date'), "game_key": game_key
-        })
-    except:
-        continue
+for g, p in zip(scheduled, score_slate([(g.home_team, g.away_team) for g in scheduled], injuries)):
+    ml_results.append({
+        "pick": p.pick, "score": p.score, "color": p.color, "reasons": p.reasons, "game": g,
+        "edge": pick_edge(p.score, team_quote(quotes, g, p.pick)) if p.pick else None
+    })
 
 ml_results.sort(key=lambda x: x["score"], reverse=True)
 
@@ -947,47 +438,27 @@ if ml_results:
         if r["score"] < 5.5:
             continue
         
+        g = r["game"]
         pick_team = r["pick"]
-        pick_code = KALSHI_CODES.get(pick_team, pick_team[:3].upper())
-        opponent = r["away"] if pick_team == r["home"] else r["home"]
-        reasons_str = " • ".join(r["reasons"])
-        
-        away_code = KALSHI_CODES.get(r["away"], "XXX")
-        home_code = KALSHI_CODES.get(r["home"], "XXX")
-        date_str = r["game_date"].strftime("%y%b%d").upper() if r["game_date"] else datetime.now(eastern).strftime("%y%b%d").upper()
-        ticker = f"KXNFLGAME-{date_str}{away_code}{home_code}"
-        this_url = f"https://kalshi.com/markets/KXNFLGAME/{ticker}"
-        
-        # Format game date/time
-        if r["game_date"]:
-            game_dt = r["game_date"].astimezone(eastern)
-            game_time_str = game_dt.strftime("%a %b %d • %I:%M %p ET")
-        else:
-            game_time_str = ""
-        
-        st.markdown(f"""<div style="background:linear-gradient(135deg,#0f172a,#020617);padding:8px 12px;margin-bottom:2px;border-radius:6px;border-left:3px solid {r['color']}">
-        <b style="color:#fff">{pick_team}</b> <span style="color:#666">vs {opponent}</span> 
-        <span style="color:#38bdf8">{r['score']}/10</span> 
-        <span style="color:#777;font-size:0.8em">{reasons_str}</span>
-        <div style="color:#888;font-size:0.75em;margin-top:4px">📅 {game_time_str}</div></div>""", unsafe_allow_html=True)
-        
-        st.link_button(f"BUY {pick_code}", this_url, use_container_width=True)
+        is_home = pick_team == g.home_team
+        st.markdown(render_ml_pick(pick_team, g.away_team if is_home else g.home_team, r["score"], r["color"],
+                                   r["reasons"], g.kickoff_label, r["edge"]), unsafe_allow_html=True)
+        st.link_button(f"BUY {g.home_code if is_home else g.away_code}", market_url(g.ticker), use_container_width=True)
 else:
     st.info("No scheduled games with picks")
 
 st.divider()
 
 # ========== ADD POSITION ==========
+rerun.phase("add_position")
 st.subheader("➕ ADD POSITION")
 
 game_options = ["Select..."] + [gk.replace("@", " @ ") for gk in game_list]
 selected_game = st.selectbox("Game", game_options)
 
 if selected_game != "Select...":
-    parts = selected_game.replace(" @ ", "@").split("@")
-    g = games.get(f"{parts[0]}@{parts[1]}")
-    game_date = g.get('game_date') if g else None
-    st.link_button("🔗 View on Kalshi", build_kalshi_ml_url(parts[0], parts[1], game_date), use_container_width=True)
+    game_key = selected_game.replace(" @ ", "@")
+    st.link_button("🔗 View on Kalshi", game_url(games.get(game_key), game_key), use_container_width=True)
 
 p1, p2, p3 = st.columns(3)
 with p1:
@@ -1003,37 +474,39 @@ if st.button("✅ ADD", use_container_width=True, type="primary"):
         st.error("Select a game!")
     else:
         game_key = selected_game.replace(" @ ", "@")
-        st.session_state.positions.append({
+        g = games.get(game_key)
+        st.session_state.portfolio.add(position_store.add(st.session_state["sid"], {
             "game": game_key,
             "type": "ml",
             "pick": st.session_state.selected_ml_pick,
             "price": price_paid,
             "contracts": contracts,
             "cost": round(price_paid * contracts / 100, 2),
-            "added_at": now.strftime("%a %I:%M %p")
-        })
-        save_positions(st.session_state.positions)
+            "added_at": now.strftime("%a %I:%M %p"),
+            # lets the position find its game's slate once the game leaves the board
+            "event_id": g.event_id if g else None,
+            "kickoff": g.game_date.isoformat() if g and g.game_date else None,
+        }))
         st.rerun()
 
 st.divider()
 
 # ========== ALL GAMES ==========
-st.subheader("📺 ALL GAMES")
-if games:
-    cols = st.columns(4)
-    for i, (k, g) in enumerate(games.items()):
-        with cols[i % 4]:
-            st.write(f"**{g['away_team']}** {g['away_score']}")
-            st.write(f"**{g['home_team']}** {g['home_score']}")
-            if g['status_type'] == "STATUS_FINAL":
-                status = "FINAL"
-            elif g['period'] > 0:
-                status = f"Q{g['period']} {g['clock']}"
-            else:
-                status = "SCHEDULED"
-            st.caption(f"{status} | {g['total']} pts")
-else:
-    st.info("No games this week")
+rerun.phase("all_games")
+
+
+@st.fragment(run_every=live_every)
+def all_games():
+    games, version = current_scoreboard()
+    st.subheader("📺 ALL GAMES")
+    if games:
+        st.html(session_cached("all_games_html", version, lambda: render_game_grid(games.values())))
+    else:
+        st.info("No games this week")
+
+
+all_games()
 
 st.divider()
 st.caption("⚠️ Derived signals only. Not financial advice. v2.0 SaaS-Safe")
+rerun.finish()
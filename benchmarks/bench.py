@@ -0,0 +1,324 @@
+"""Hot-path benchmark suite over recorded ESPN fixtures.
+
+    python benchmarks/bench.py                                   # table of results
+    python benchmarks/bench.py --json out.json                   # also write machine-readable results
+    python benchmarks/bench.py --baseline base.json --threshold 0.25   # exit 1 on regressions
+    python benchmarks/bench.py --only parse render --no-app      # substring filter, skip AppTest
+
+Cases: scoreboard parse per fixture, injury index build, ML scoring over each
+slate (memo cleared), each live signal function plus the table path, field and
+signal-feed rendering (cold and cached), portfolio indexing and valuation over
+a 5,000-position book, alert diffing against 30,000 rules, and full script
+runs through Streamlit's headless AppTest with the network stubbed to serve
+the fixtures.
+
+Fixtures in benchmarks/fixtures are ESPN-format response bodies: an
+early-window Sunday slate, a bye week, a slate with an overtime game, and an
+empty week. To refresh one from a live capture, write a body from an
+NFL_RECORD recording (nfl_edge.replay.read_recording) over it.
+
+Regressions are judged on the best-of-rounds time, which is far less noisy
+than the median on a shared machine.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from itertools import chain
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("NFL_DISK_CACHE", "")  # every run starts cold
+
+import numpy as np
+
+from nfl_edge import render, scoring, signals
+from nfl_edge.alerts import AlertEngine, Rule
+from nfl_edge.portfolio import Portfolio
+from nfl_edge.espn import INJURIES_CACHE, SCORES_CACHE, load_injuries, load_scoreboard, parse_injuries, parse_scoreboard
+from nfl_edge.httpclient import json_loads
+from nfl_edge.injuries import InjuryIndex
+
+FIXTURES_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+SLATES = ("sunday_early", "bye_week", "overtime", "empty_week")
+REPEAT = 5
+BOOK_SIZE = 5000
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def measure(fn, repeat=REPEAT, number=None):
+    """Per-call seconds for `repeat` rounds of `number` calls (auto-sized to ~0.2s when None)"""
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    samples = [t / number for t in timer.repeat(repeat, number)]
+    return {"median_us": round(statistics.median(samples) * 1e6, 2),
+            "min_us": round(min(samples) * 1e6, 2), "runs": repeat * number}
+
+
+# ========== CASES ==========
+def core_cases(bodies, injuries_body):
+    """(name, fn) for everything that runs without Streamlit"""
+    injuries = InjuryIndex(parse_injuries(json_loads(injuries_body)))
+    yield "injuries/index", lambda: InjuryIndex(parse_injuries(json_loads(injuries_body)))
+
+    for slate, body in bodies.items():
+        yield f"parse/{slate}", lambda body=body: parse_scoreboard(json_loads(body))
+
+        games = list(parse_scoreboard(json_loads(body)).values())
+        if games:
+            matchups = [(g.home_team, g.away_team) for g in games]
+
+            def cold_score(matchups=matchups):
+                scoring._memo.clear()
+                scoring.score_slate(matchups, injuries)
+            yield f"ml_score/{slate}", cold_score
+
+        live = [g for g in games if g.phase == "live"]
+        if not live:
+            continue
+        for name, fn in signal_functions(live):
+            yield f"signal/{name}/{slate}", fn
+        yield f"signal/reference/{slate}", lambda live=live: reference_labels(live)
+        yield f"signal/tables/{slate}", lambda live=live: signals.evaluate_labels(live)
+        yield f"signal/vectorized/{slate}", lambda live=live: signals._labels_from_index(signals.evaluate(live))
+
+        labels = signals.evaluate_labels(live)
+        feed_args = [(s, ("NORMAL", "#44ff44", "2:10"), ("NEUTRAL", "#888888")) for s in labels]
+
+        def render_fields(live=live):
+            for g in live:
+                render.render_football_field(g)
+
+        def render_feeds(feed_args=feed_args):
+            for args in feed_args:
+                render.render_signal_feed(*args)
+
+        def cold(fn, cached):
+            def run():
+                cached.cache_clear()
+                fn()
+            return run
+        yield f"render/field/cold/{slate}", cold(render_fields, render._football_field)
+        yield f"render/field/cached/{slate}", render_fields
+        yield f"render/signal_feed/cold/{slate}", cold(render_feeds, render._signal_feed)
+        yield f"render/signal_feed/cached/{slate}", render_feeds
+
+
+def synthetic_book(games, size=BOOK_SIZE):
+    """`size` position rows spread round-robin over the slate's games"""
+    keys = list(games)
+    book = []
+    for i in range(size):
+        g = games[keys[i % len(keys)]]
+        book.append({"id": i + 1, "game": g.game_key, "type": "ml", "pick": g.home_team if i % 3 else g.away_team,
+                     "price": 20 + i % 60, "contracts": 1 + i % 20, "cost": 0.0, "added_at": None})
+    return book
+
+
+def portfolio_cases(bodies):
+    games = parse_scoreboard(json_loads(bodies[SLATES[0]]))
+    book = synthetic_book(games)
+    portfolio = Portfolio(book)
+    yield f"portfolio/build/{BOOK_SIZE}", lambda: Portfolio(book)
+    yield f"portfolio/value/{BOOK_SIZE}", lambda: [b.value(games.get(b.game_key)) for b in portfolio.books(games)]
+    yield f"portfolio/exposure/{BOOK_SIZE}", lambda: (portfolio.exposure(games), portfolio.by_team(),
+                                                      portfolio.by_day(games))
+
+
+def alert_cases(bodies, users=5000):
+    """Alert sync with 3 rules per user per game they hold, alternating two snapshot versions"""
+    games = parse_scoreboard(json_loads(bodies[SLATES[0]]))
+    live = [g for g in games.values() if g.phase == "live"]
+    if not live:
+        return
+    engine = AlertEngine()
+    keys = list(games)
+    for u in range(users):
+        held = (keys[u % len(keys)], keys[(u * 7 + 3) % len(keys)])
+        engine.set_rules(f"u{u}", [Rule(f"u{u}:{event}:{k}", f"u{u}", event, k, None)
+                                   for k in held for event in ("red_zone", "fourth_down", "overtime")])
+    flipped = dict(games)
+    flipped[live[0].game_key] = live[0]._replace(is_red_zone=not live[0].is_red_zone, down=4)
+    versions = [games, flipped]
+    state = {"version": 0}
+
+    def sync():
+        state["version"] += 1
+        engine.sync(state["version"], versions[state["version"] % 2], now=float(state["version"]))
+    yield f"alerts/sync/{len(engine.rules)}rules", sync
+    yield f"alerts/sync_unchanged/{len(engine.rules)}rules", lambda: engine.sync(state["version"], games)
+
+
+def reference_labels(live):
+    """What evaluate_labels() returns, built from the reference functions"""
+    out = []
+    for g in live:
+        margin = abs(g.home_score - g.away_score)
+        trailing = (g.possession_team == g.home_team and g.home_score < g.away_score) or \
+                   (g.possession_team == g.away_team and g.away_score < g.home_score)
+        out.append(signals.Signals(signals.calc_field_pressure(g.yards_to_endzone, g.possession_team, g.home_team),
+                                   signals.calc_down_stress(g.down, g.distance),
+                                   signals.calc_clock_pressure(g.period, g.seconds_remaining,
+                                                               margin if trailing else -margin, trailing),
+                                   signals.calc_blowout_risk(margin, g.period)))
+    return out
+
+
+def signal_functions(live):
+    """One slate-wide loop per reference signal function"""
+    margins = [abs(g.home_score - g.away_score) for g in live]
+    trailing = [(g.possession_team == g.home_team and g.home_score < g.away_score) or
+                (g.possession_team == g.away_team and g.away_score < g.home_score) for g in live]
+    yield "field_pressure", lambda: [signals.calc_field_pressure(g.yards_to_endzone, g.possession_team, g.home_team)
+                                     for g in live]
+    yield "down_stress", lambda: [signals.calc_down_stress(g.down, g.distance) for g in live]
+    yield "clock_pressure", lambda: [signals.calc_clock_pressure(g.period, g.seconds_remaining, m if t else -m, t)
+                                     for g, m, t in zip(live, margins, trailing)]
+    yield "blowout_risk", lambda: [signals.calc_blowout_risk(m, g.period) for g, m in zip(live, margins)]
+
+
+def app_cases(bodies, injuries_body):
+    """Full app.py runs through AppTest, with requests stubbed to serve the fixtures"""
+    import requests
+    from requests.models import Response
+    from streamlit.testing.v1 import AppTest
+
+    current = {"scoreboard": bodies[SLATES[0]]}
+
+    def fake_request(session, method, url, **kwargs):
+        r = Response()
+        r.status_code, r.url, r.encoding = 200, url, "utf-8"
+        if "kalshi" in url:
+            r._content = b'{"markets":[]}'
+        else:
+            r._content = injuries_body if "injuries" in url else current["scoreboard"]
+        r.raw = io.BytesIO(r._content)  # the client streams bodies
+        r.headers["Content-Type"] = "application/json"
+        return r
+
+    os.environ.setdefault("NFL_POLLER", "0")
+    os.chdir(tempfile.mkdtemp(prefix="nfl-bench-"))
+    requests.sessions.Session.request = fake_request
+
+    app_path = os.path.join(ROOT, "app.py")
+    from nfl_edge.positions import get_store
+    store = get_store()
+
+    def first_run():
+        AppTest.from_file(app_path, default_timeout=60).run()
+    yield "app/first_run", first_run, 3
+
+    for slate, body in bodies.items():
+        current["scoreboard"] = body
+        SCORES_CACHE.refresh(load_scoreboard)
+        INJURIES_CACHE.refresh(load_injuries)
+        at = AppTest.from_file(app_path, default_timeout=60)
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"app raised on {slate}: {at.exception[0].value}")
+        yield f"app/rerun/{slate}", at.run, REPEAT
+
+    current["scoreboard"] = bodies[SLATES[0]]
+    games = SCORES_CACHE.refresh(load_scoreboard)
+    for pos in synthetic_book(games):
+        store.add("bench-book", pos)
+    at = AppTest.from_file(app_path, default_timeout=60)
+    at.query_params["sid"] = "bench-book"
+    at.run()
+    yield f"app/rerun/book{BOOK_SIZE}", at.run, REPEAT
+
+
+# ========== REPORTING ==========
+def metadata():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                             text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        rev = None
+    return {
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": rev,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "orjson": json_loads is not json.loads,
+    }
+
+
+def compare(results, baseline, threshold):
+    """[(case, base_us, now_us, ratio)] for cases slower than baseline by more than threshold"""
+    regressions = []
+    for case, now in results.items():
+        base = baseline.get(case)
+        if not base or not base["min_us"]:
+            continue
+        ratio = now["min_us"] / base["min_us"]
+        if ratio > 1 + threshold:
+            regressions.append((case, base["min_us"], now["min_us"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--json", help="write results to this path")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=float(os.environ.get("NFL_BENCH_THRESHOLD", 0.2)),
+                        help="allowed slowdown vs baseline, as a fraction (default 0.2)")
+    parser.add_argument("--only", nargs="*", help="run only cases whose name contains one of these")
+    parser.add_argument("--no-app", action="store_true", help="skip the AppTest page runs")
+    args = parser.parse_args()
+    # the app cases run from a scratch directory
+    json_path = os.path.abspath(args.json) if args.json else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    bodies = {slate: load_fixture(f"{slate}.scoreboard.json") for slate in SLATES}
+    injuries_body = load_fixture("injuries.json")
+
+    def wanted(name):
+        return not args.only or any(part in name for part in args.only)
+
+    results = {}
+    for name, fn in chain(core_cases(bodies, injuries_body), portfolio_cases(bodies), alert_cases(bodies)):
+        if wanted(name):
+            results[name] = measure(fn)
+    if not args.no_app:
+        start = time.perf_counter()
+        for name, fn, repeat in app_cases(bodies, injuries_body):
+            if wanted(name):
+                results[name] = measure(fn, repeat=repeat, number=1)
+        print(f"app cases took {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    print(f"{'case':<42}{'median us':>12}{'min us':>12}")
+    for name, r in results.items():
+        print(f"{name:<42}{r['median_us']:>12.1f}{r['min_us']:>12.1f}")
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2)
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for case, base, now, ratio in regressions:
+            print(f"REGRESSION {case}: {base:.1f}us -> {now:.1f}us ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%} vs {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Scoreboard parse benchmark: Game records vs the old per-game dict path.
+
+    python benchmarks/bench_parse.py [n_games]
+
+Reports decode+parse time per slate and memory retained by the parsed slate.
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytz
+
+from nfl_edge.espn import parse_scoreboard
+from nfl_edge.httpclient import json_loads
+from nfl_edge.teams import TEAM_ABBREVS
+
+eastern = pytz.timezone("US/Eastern")
+
+
+def make_payload(n_games):
+    """Synthetic ESPN scoreboard with a mix of live, final and scheduled games"""
+    names = list(TEAM_ABBREVS)
+    kickoff = datetime(2025, 9, 14, 17, 0, tzinfo=timezone.utc)
+    events = []
+    for i in range(n_games):
+        away, home = names[(2 * i) % len(names)], names[(2 * i + 1) % len(names)]
+        if i >= len(names) // 2:  # keep game keys unique on oversized slates
+            away, home = f"{away} {i}", f"{home} {i}"
+        live = i % 3 == 0
+        status = "STATUS_IN_PROGRESS" if live else ("STATUS_FINAL" if i % 3 == 1 else "STATUS_SCHEDULED")
+        comp = {"competitors": [
+            {"homeAway": "home", "score": str(7 * (i % 4)), "team": {"displayName": home, "id": str(2 * i + 1)}},
+            {"homeAway": "away", "score": str(3 * (i % 5)), "team": {"displayName": away, "id": str(2 * i)}},
+        ]}
+        if live:
+            comp["situation"] = {"down": 1 + i % 4, "distance": 1 + i % 10, "yardLine": 35, "yardsToEndzone": 35,
+                                 "possession": str(2 * i + 1), "isRedZone": False, "possessionText": "HOME 35"}
+        events.append({
+            "id": str(401000000 + i),
+            "date": (kickoff + timedelta(hours=3 * (i % 3))).strftime("%Y-%m-%dT%H:%MZ"),
+            "status": {"displayClock": "7:42", "period": 3 if live else (4 if i % 3 == 1 else 0),
+                       "type": {"name": status}},
+            "competitions": [comp],
+        })
+    return json.dumps({"events": events}).encode()
+
+
+def legacy_parse(data):
+    """The pre-Game dict parser, kept verbatim as the baseline"""
+    games = {}
+    for event in data.get("events", []):
+        event_id = event.get("id", "")
+        comp = event.get("competitions", [{}])[0]
+        competitors = comp.get("competitors", [])
+        if len(competitors) < 2:
+            continue
+        home_team, away_team, home_score, away_score = None, None, 0, 0
+        home_id, away_id = None, None
+        for c in competitors:
+            name = c.get("team", {}).get("displayName", "")
+            team_name = TEAM_ABBREVS.get(name, name)
+            team_id = c.get("team", {}).get("id", "")
+            score = int(c.get("score", 0) or 0)
+            if c.get("homeAway") == "home":
+                home_team, home_score, home_id = team_name, score, team_id
+            else:
+                away_team, away_score, away_id = team_name, score, team_id
+        status_obj = event.get("status", {})
+        status_type = status_obj.get("type", {}).get("name", "STATUS_SCHEDULED")
+        clock = status_obj.get("displayClock", "")
+        period = status_obj.get("period", 0)
+        situation = comp.get("situation", {})
+        down = situation.get("down")
+        distance = situation.get("distance")
+        yard_line = situation.get("yardLine", 50)
+        yards_to_endzone = situation.get("yardsToEndzone", 50)
+        possession_id = situation.get("possession", "")
+        is_red_zone = situation.get("isRedZone", False)
+        poss_text = situation.get("possessionText", "")
+        if possession_id == home_id:
+            possession_team, is_home_possession = home_team, True
+        elif possession_id == away_id:
+            possession_team, is_home_possession = away_team, False
+        else:
+            possession_team, is_home_possession = None, None
+        if yards_to_endzone is not None and is_home_possession is not None:
+            ball_yard = yards_to_endzone if is_home_possession else 100 - yards_to_endzone
+        else:
+            ball_yard = 50
+        try:
+            game_date = datetime.fromisoformat(event.get("date", "").replace("Z", "+00:00"))
+        except ValueError:
+            game_date = datetime.now(eastern)
+        games[f"{away_team}@{home_team}"] = {
+            "event_id": event_id, "away_team": away_team, "home_team": home_team,
+            "away_score": away_score, "home_score": home_score, "away_id": away_id, "home_id": home_id,
+            "total": away_score + home_score, "period": period, "clock": clock, "status_type": status_type,
+            "game_date": game_date, "down": down, "distance": distance, "yard_line": yard_line,
+            "yards_to_endzone": yards_to_endzone, "ball_yard": ball_yard, "possession_team": possession_team,
+            "is_red_zone": is_red_zone, "poss_text": poss_text,
+        }
+    return games
+
+
+def retained_bytes(fn, payload):
+    data = json.loads(payload)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn(data)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    payload = make_payload(n_games)
+    cases = [
+        ("dict + json", lambda: legacy_parse(json.loads(payload)), legacy_parse),
+        ("Game + json", lambda: parse_scoreboard(json.loads(payload)), parse_scoreboard),
+    ]
+    if json_loads is not json.loads:
+        cases.append(("Game + orjson", lambda: parse_scoreboard(json_loads(payload)), parse_scoreboard))
+
+    print(f"{n_games} games, payload {len(payload) / 1024:.1f} KB")
+    print(f"{'path':<16}{'us/slate':>12}{'bytes/slate':>14}{'bytes/game':>12}")
+    for label, run, parse in cases:
+        number, total = timeit.Timer(run).autorange()
+        mem = retained_bytes(parse, payload)
+        print(f"{label:<16}{total / number * 1e6:>12.1f}{mem:>14}{mem // max(n_games, 1):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Local stand-in for ESPN's scoreboard and injuries feeds, with injected faults.
+
+    python benchmarks/espn_stub.py --port 8800 --latency 0.05 --tail-rate 0.05 --tail-latency 1
+    NFL_ESPN_API=http://127.0.0.1:8800/apis/site/v2/sports/football/nfl streamlit run app.py
+
+Serves a fixture slate (--fixture) and the injuries fixture, with a strong
+ETag so revalidation gets 304s. Each request sleeps --latency seconds; a
+--tail-rate share of them sleep --tail-latency instead (hedging territory), a
+--hang-rate share sleep --hang seconds (past the client's budget) and an
+--error-rate share answer 500. Faults can be changed while it runs:
+
+    curl '127.0.0.1:8800/_faults?error_rate=1'     # outage: every request fails
+    curl '127.0.0.1:8800/_faults?error_rate=0'     # recovery
+    curl '127.0.0.1:8800/_faults'                  # current settings and request counts
+
+    python -m nfl_edge.httpclient http://127.0.0.1:8800/apis/site/v2/sports/football/nfl/scoreboard -n 200
+    NFL_HEDGE=1 python -m nfl_edge.httpclient http://127.0.0.1:8800/apis/site/v2/sports/football/nfl/scoreboard -n 200
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FAULTS = ("latency", "tail_rate", "tail_latency", "hang_rate", "hang", "error_rate")
+
+
+def load_bodies(fixture):
+    bodies = {}
+    for route, name in (("scoreboard", f"{fixture}.scoreboard.json"), ("injuries", "injuries.json")):
+        with open(os.path.join(FIXTURES, name), "rb") as f:
+            body = f.read()
+        bodies[route] = (body, '"%s"' % hashlib.md5(body).hexdigest())
+    return bodies
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    bodies = {}
+    faults = {}
+    counts = {}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/_faults":
+            self._faults(parse_qs(url.query))
+            return
+        route = url.path.rsplit("/", 1)[-1]
+        if route not in self.bodies:
+            self.send_error(404)
+            return
+        self._count("requests")
+        f = self.faults
+        roll = random.random()
+        if roll < f["hang_rate"]:
+            self._count("hung")
+            time.sleep(f["hang"])
+        elif roll < f["hang_rate"] + f["tail_rate"]:
+            self._count("tail")
+            time.sleep(f["tail_latency"])
+        else:
+            time.sleep(f["latency"])
+        if random.random() < f["error_rate"]:
+            self._count("errors")
+            self._send(500, b'{"error":"injected"}')
+            return
+        body, etag = self.bodies[route]
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag)
+            return
+        self._send(200, body, etag)
+
+    def _faults(self, query):
+        for key, values in query.items():
+            if key in FAULTS:
+                self.faults[key] = float(values[0])
+        self._send(200, json.dumps({"faults": self.faults, "counts": self.counts}).encode())
+
+    def _count(self, key):
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass  # the client gave up (budget spent or hedge won)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_stub(port=8800, fixture="sunday_early", latency=0.0, tail_rate=0.0, tail_latency=1.0,
+              hang_rate=0.0, hang=30.0, error_rate=0.0):
+    faults = {"latency": latency, "tail_rate": tail_rate, "tail_latency": tail_latency,
+              "hang_rate": hang_rate, "hang": hang, "error_rate": error_rate}
+    handler = type("Handler", (StubHandler,), {"bodies": load_bodies(fixture), "faults": faults, "counts": {}})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--fixture", default="sunday_early", help="benchmarks/fixtures/<name>.scoreboard.json")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-latency", type=float, default=1.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang", type=float, default=30.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    server = make_stub(args.port, args.fixture, args.latency, args.tail_rate, args.tail_latency,
+                       args.hang_rate, args.hang, args.error_rate)
+    print(f"stub ESPN on http://127.0.0.1:{args.port}/apis/site/v2/sports/football/nfl "
+          f"({args.latency * 1000:.0f}ms latency)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
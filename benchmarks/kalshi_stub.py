@@ -0,0 +1,89 @@
+"""Local stand-in for Kalshi's GET /markets, with injected latency.
+
+    python benchmarks/kalshi_stub.py --port 8700 --latency 0.2
+    NFL_KALSHI_API=http://127.0.0.1:8700/trade-api/v2 python -m nfl_edge.kalshi benchmarks/fixtures/sunday_early.scoreboard.json
+
+Answers ?event_ticker=A,B,... with one market per team (<event>-<code>), with
+prices derived from the ticker so runs are repeatable. Every request sleeps
+--latency seconds, so a batched fetch of a full slate should take about one
+latency; sixteen sequential fetches would take sixteen.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nfl_edge.teams import KALSHI_CODES
+
+CODES = set(KALSHI_CODES.values())
+
+
+def market(event_ticker, code, home):
+    seed = int(hashlib.md5(event_ticker.encode()).hexdigest()[:4], 16)
+    home_bid = 25 + seed % 50
+    bid = home_bid if home else 97 - home_bid
+    return {"ticker": f"{event_ticker}-{code}", "event_ticker": event_ticker, "status": "active",
+            "yes_bid": bid, "yes_ask": bid + 2, "last_price": bid + 1}
+
+
+def markets(event_ticker):
+    # KXNFLGAME-25SEP07BUFKC: 7-character date, then the away and home team codes
+    teams = event_ticker.split("-", 1)[1][7:]
+    for split in (2, 3):
+        away, home = teams[:split], teams[split:]
+        if away in CODES and home in CODES:
+            return [market(event_ticker, away, False), market(event_ticker, home, True)]
+    return []
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    requests = 0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if not url.path.endswith("/markets"):
+            self.send_error(404)
+            return
+        type(self).requests += 1
+        time.sleep(self.latency)
+        tickers = [t for t in parse_qs(url.query).get("event_ticker", [""])[0].split(",") if t]
+        body = json.dumps({"markets": [m for t in tickers for m in markets(t)], "cursor": ""}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_stub(port=8700, latency=0.0):
+    handler = type("Handler", (StubHandler,), {"latency": latency})
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    server = make_stub(args.port, args.latency)
+    print(f"stub Kalshi on http://127.0.0.1:{args.port}/trade-api/v2 ({args.latency * 1000:.0f}ms latency)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
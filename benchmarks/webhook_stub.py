@@ -0,0 +1,47 @@
+"""Local webhook receiver for the alert engine's WebhookSink.
+
+    python benchmarks/webhook_stub.py --port 8701
+    NFL_ALERTS_WEBHOOK=http://127.0.0.1:8701/alerts streamlit run app.py
+
+Prints each alert it receives as one JSON line and answers 204.
+"""
+import argparse
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = 0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        type(self).received += 1
+        sys.stdout.write(body.decode("utf-8", "replace") + "\n")
+        sys.stdout.flush()
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def make_stub(port=8701):
+    return ThreadingHTTPServer(("127.0.0.1", port), type("Handler", (WebhookHandler,), {}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--port", type=int, default=8701)
+    args = parser.parse_args()
+    server = make_stub(args.port)
+    print(f"webhook stub on http://127.0.0.1:{args.port}/alerts", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
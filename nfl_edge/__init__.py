@@ -0,0 +1 @@
+"""Process-level building blocks for the NFL Edge Finder Streamlit app."""
@@ -0,0 +1,348 @@
+"""Alerts on game-state changes, matched against indexed per-user rules.
+
+Each scoreboard version is diffed once per process (like the game-state
+engine): every game is reduced to a small Facts tuple, and only games whose
+facts changed since the previous version produce events (red zone, 4th down,
+overtime, a side falling behind by more than a score, kickoff, score, final).
+The first sighting of a game only sets its baseline, so a restart doesn't
+replay alerts.
+
+Rules are indexed by (event, game_key, team), with None as a wildcard, so an
+event costs at most four dict lookups however many rules exist. Matches are
+deduplicated per (rule, game, event) for NFL_ALERT_DEDUP seconds and capped
+at NFL_ALERT_RATE alerts per user per minute, then handed to every sink:
+QueueSink (drained by the page as toasts), FileSink (JSON lines, when
+NFL_ALERTS_FILE is set) and WebhookSink (POSTs from a background thread, when
+NFL_ALERTS_WEBHOOK is set; benchmarks/webhook_stub.py is a local receiver).
+
+Sessions end without telling anyone, so a user whose page hasn't run (set
+rules, drained its queue) for NFL_ALERT_IDLE seconds is dropped on the next
+sync: its rules, rate-limit window and queued alerts go. touch() reports
+whether a returning page needs to register its rules again. Facts of games
+off the board for EXPIRE_AFTER go the same way, as game-state tracks do.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+import requests
+
+from nfl_edge.gamestate import EXPIRE_AFTER
+from nfl_edge.models import FINAL, LIVE
+
+DEDUP_WINDOW = int(os.environ.get("NFL_ALERT_DEDUP", 120))
+RATE_LIMIT = int(os.environ.get("NFL_ALERT_RATE", 10))  # per user per minute
+IDLE_EXPIRY = int(os.environ.get("NFL_ALERT_IDLE", 1800))  # seconds without a page run before a user is dropped
+SWEEP_EVERY = 60
+ALERTS_FILE = os.environ.get("NFL_ALERTS_FILE")
+ALERTS_WEBHOOK = os.environ.get("NFL_ALERTS_WEBHOOK")
+BEHIND_BY = 7  # same cut as the 🔴 BEHIND position status
+
+EVENTS = ("red_zone", "fourth_down", "overtime", "behind", "kickoff", "score", "final")
+
+Rule = namedtuple("Rule", ["rule_id", "user_id", "event", "game_key", "team"])
+Alert = namedtuple("Alert", ["user_id", "rule_id", "event", "game_key", "team", "text", "at"])
+Facts = namedtuple("Facts", ["red_zone", "fourth_down", "overtime", "behind", "started", "total", "final"])
+
+TEXT = {
+    "red_zone": "🚨 {team} in the red zone — {game}",
+    "fourth_down": "⚠️ 4th down for {team} — {game}",
+    "overtime": "⏱️ Overtime — {game}",
+    "behind": "🔴 {team} now BEHIND — {game}",
+    "kickoff": "🏈 Kickoff — {game}",
+    "score": "🔔 Score change — {game}",
+    "final": "🏁 Final — {game}",
+}
+
+
+def game_facts(g):
+    final = g.phase == FINAL
+    live = g.phase == LIVE
+    margin = g.home_score - g.away_score
+    behind = None
+    if live:
+        behind = g.home_team if margin < -BEHIND_BY else g.away_team if margin > BEHIND_BY else None
+    return Facts(live and bool(g.is_red_zone), live and g.down == 4, g.period >= 5, behind,
+                 g.period > 0 or final, g.total, final)
+
+
+def diff_facts(old, new, g):
+    """[(event, team)] for the transitions from `old` to `new`"""
+    events = []
+    if new.red_zone and not old.red_zone:
+        events.append(("red_zone", g.possession_team))
+    if new.fourth_down and not old.fourth_down:
+        events.append(("fourth_down", g.possession_team))
+    if new.overtime and not old.overtime:
+        events.append(("overtime", None))
+    if new.behind and new.behind != old.behind:
+        events.append(("behind", new.behind))
+    if new.started and not old.started:
+        events.append(("kickoff", None))
+    if new.total != old.total:
+        events.append(("score", None))
+    if new.final and not old.final:
+        events.append(("final", None))
+    return events
+
+
+# ========== SINKS ==========
+# a sink is anything with send(alerts): one call per sync with that sync's alerts;
+# sinks holding per-user state may also define forget(user_ids) for expired users
+class QueueSink:
+    """Per-user in-memory queues the page drains on each run"""
+
+    def __init__(self, maxlen=50):
+        self.maxlen = maxlen
+        self._queues = {}
+        self._lock = threading.Lock()
+
+    def send(self, alerts):
+        with self._lock:
+            for alert in alerts:
+                q = self._queues.get(alert.user_id)
+                if q is None:
+                    q = self._queues[alert.user_id] = deque(maxlen=self.maxlen)
+                q.append(alert)
+
+    def drain(self, user_id):
+        with self._lock:
+            q = self._queues.pop(user_id, None)
+        return list(q) if q else []
+
+    def forget(self, user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                self._queues.pop(user_id, None)
+
+    def __len__(self):
+        return len(self._queues)
+
+
+class FileSink:
+    """Appends one JSON object per alert"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, alerts):
+        lines = "".join(json.dumps(a._asdict(), separators=(",", ":")) + "\n" for a in alerts)
+        with self._lock:
+            try:
+                with open(self.path, "a") as f:
+                    f.write(lines)
+            except OSError:
+                pass
+
+
+class WebhookSink:
+    """POSTs each alert as JSON from a background thread; a slow receiver never blocks a sync"""
+
+    def __init__(self, url, timeout=2):
+        self.url = url
+        self.timeout = timeout
+        self.sent = 0
+        self.failed = 0
+        self._session = requests.Session()
+        self._queue = queue.Queue(maxsize=1000)
+        threading.Thread(target=self._loop, name="alerts-webhook", daemon=True).start()
+
+    def send(self, alerts):
+        for alert in alerts:
+            try:
+                self._queue.put_nowait(alert)
+            except queue.Full:
+                self.failed += 1
+
+    def _loop(self):
+        while True:
+            alert = self._queue.get()
+            try:
+                self._session.post(self.url, json=alert._asdict(), timeout=self.timeout).raise_for_status()
+                self.sent += 1
+            except Exception:
+                self.failed += 1
+
+
+# ========== ENGINE ==========
+class AlertEngine:
+    def __init__(self, sinks=()):
+        self.sinks = list(sinks)
+        self.version = None
+        self.facts = {}     # event_id -> Facts
+        self.facts_at = {}  # event_id -> time its game was last on the board
+        self.rules = {}     # rule_id -> Rule
+        self.index = {}     # (event, game_key, team) -> {rule_id: Rule}
+        self.by_user = {}   # user_id -> set(rule_id)
+        self.sent = {}      # (rule_id, event_id, event) -> last alert time
+        self.recent = {}    # user_id -> deque of alert times in the last minute
+        self.seen = {}      # user_id -> monotonic time its page last ran
+        self.swept = time.monotonic()
+        self.delivered = 0
+        self.suppressed = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    # ---- rules ----
+    def set_rules(self, user_id, rules):
+        """Replace all of `user_id`'s rules"""
+        with self._lock:
+            self.seen[user_id] = time.monotonic()
+            self._drop_rules(user_id)
+            ids = set()
+            for rule in rules:
+                self.rules[rule.rule_id] = rule
+                self.index.setdefault((rule.event, rule.game_key, rule.team), {})[rule.rule_id] = rule
+                ids.add(rule.rule_id)
+            if ids:
+                self.by_user[user_id] = ids
+
+    def touch(self, user_id):
+        """Mark `user_id`'s page as alive; False if its rules expired (or were never set)"""
+        with self._lock:
+            if user_id not in self.seen:
+                return False
+            self.seen[user_id] = time.monotonic()
+            return True
+
+    # caller holds self._lock
+    def _drop_rules(self, user_id):
+        for rule_id in self.by_user.pop(user_id, ()):
+            rule = self.rules.pop(rule_id)
+            bucket = self.index.get((rule.event, rule.game_key, rule.team))
+            if bucket is not None:
+                bucket.pop(rule_id, None)
+                if not bucket:
+                    del self.index[(rule.event, rule.game_key, rule.team)]
+
+    # caller holds self._lock
+    def _expire_idle(self):
+        """Drop users whose page hasn't run for IDLE_EXPIRY seconds; returns their ids"""
+        now = time.monotonic()
+        if now - self.swept < SWEEP_EVERY:
+            return []
+        self.swept = now
+        idle = [user_id for user_id, seen in self.seen.items() if now - seen >= IDLE_EXPIRY]
+        for user_id in idle:
+            self._drop_rules(user_id)
+            del self.seen[user_id]
+            self.recent.pop(user_id, None)
+        self.expired += len(idle)
+        return idle
+
+    def _matching(self, event, game_key, team):
+        # each rule sits in exactly one bucket; the set folds the keys together when team is None
+        for key in {(event, game_key, team), (event, game_key, None), (event, None, team), (event, None, None)}:
+            bucket = self.index.get(key)
+            if bucket:
+                yield from bucket.values()
+
+    # ---- snapshots ----
+    def sync(self, version, games, now=None):
+        """Diff a scoreboard version against the last one; return the alerts delivered.
+
+        The same or an older version is a no-op: a session syncing the board its
+        script run saw must not diff the facts backwards and forwards again.
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            if self.version is not None and version <= self.version:
+                return []
+            self.version = version
+            expired = self._expire_idle()
+            if len(self.facts) > len(games):  # some games have left the board
+                for event_id in [e for e, t in self.facts_at.items() if now - t > EXPIRE_AFTER]:
+                    del self.facts[event_id], self.facts_at[event_id]
+            if len(self.sent) > 4 * len(self.rules) + 1000:
+                self.sent = {k: t for k, t in self.sent.items() if now - t < DEDUP_WINDOW}
+            pending = []
+            for g in games.values():
+                facts = game_facts(g)
+                old = self.facts.get(g.event_id)
+                self.facts[g.event_id] = facts
+                self.facts_at[g.event_id] = now
+                if old is None or old == facts:
+                    continue
+                for event, team in diff_facts(old, facts, g):
+                    for rule in self._matching(event, g.game_key, team):
+                        alert = self._admit(rule, g, event, team, now)
+                        if alert is not None:
+                            pending.append(alert)
+        if expired:
+            for sink in self.sinks:
+                if hasattr(sink, "forget"):
+                    sink.forget(expired)
+        if pending:
+            for sink in self.sinks:
+                sink.send(pending)
+        return pending
+
+    # caller holds self._lock
+    def _admit(self, rule, g, event, team, now):
+        key = (rule.rule_id, g.event_id, event)
+        last = self.sent.get(key)
+        if last is not None and now - last < DEDUP_WINDOW:
+            self.suppressed += 1
+            return None
+        recent = self.recent.get(rule.user_id)
+        if recent is None:
+            recent = self.recent[rule.user_id] = deque()
+        while recent and now - recent[0] >= 60:
+            recent.popleft()
+        if len(recent) >= RATE_LIMIT:
+            self.suppressed += 1
+            return None
+        recent.append(now)
+        self.sent[key] = now
+        self.delivered += 1
+        text = TEXT[event].format(team=team or "", game=g.game_key.replace("@", " @ "))
+        return Alert(rule.user_id, rule.rule_id, event, g.game_key, team, text, now)
+
+    def stats(self):
+        return {"rules": len(self.rules), "users": len(self.by_user), "games": len(self.facts),
+                "delivered": self.delivered, "suppressed": self.suppressed, "expired": self.expired}
+
+
+def position_rules(user_id, portfolio, events=("red_zone", "fourth_down", "overtime")):
+    """Rules for a position book: game events on every held game, BEHIND for every held pick"""
+    rules = []
+    for game_key, book in portfolio.by_game.items():
+        for event in events:
+            rules.append(Rule(f"{user_id}:{event}:{game_key}", user_id, event, game_key, None))
+        for pick in book.sides:
+            if pick:
+                rules.append(Rule(f"{user_id}:behind:{game_key}:{pick}", user_id, "behind", game_key, pick))
+    return rules
+
+
+_engine = None
+_queue_sink = None
+_engine_lock = threading.Lock()
+
+
+def get_alert_engine():
+    """Return the process-wide AlertEngine, with its sinks from the environment"""
+    global _engine, _queue_sink
+    with _engine_lock:
+        if _engine is None:
+            _queue_sink = QueueSink()
+            _engine = AlertEngine([_queue_sink])
+            if ALERTS_FILE:
+                _engine.add_sink(FileSink(ALERTS_FILE))
+            if ALERTS_WEBHOOK:
+                _engine.add_sink(WebhookSink(ALERTS_WEBHOOK))
+        return _engine
+
+
+def drain(user_id):
+    """Alerts queued for `user_id` since the last drain; also keeps its rules from expiring"""
+    get_alert_engine().touch(user_id)
+    return _queue_sink.drain(user_id)
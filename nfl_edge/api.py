@@ -0,0 +1,180 @@
+"""Headless JSON API over the same cached data layer as the Streamlit page.
+
+    python -m nfl_edge.api --port 8600
+
+    GET /games    every parsed game
+    GET /live     LiveState + signal-feed values for in-progress games
+    GET /picks    pre-game ML picks, best first
+    GET /healthz  feed versions and ages
+
+Bodies are serialized once per (scoreboard version, injuries version) and
+served with a strong ETag, so polling clients that send If-None-Match get a
+bodyless 304 until the data actually changes. The scoreboard poller keeps the
+caches warm, so the read path is a cache peek, a dict lookup and a socket
+write. Time-varying values (the scoring drought) are exposed as timestamps so
+they don't change the body every second.
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nfl_edge.espn import INJURIES_CACHE, SCORES_CACHE, load_injuries, load_scoreboard, start_scoreboard_poller
+from nfl_edge.gamestate import get_engine
+from nfl_edge.injuries import get_injury_index
+from nfl_edge.models import LIVE, game_to_dict
+from nfl_edge.replay import virtual_now
+from nfl_edge.scoring import score_slate
+from nfl_edge.signals import evaluate_labels, live_state
+
+
+def build_games(games, injuries):
+    return {"games": [game_to_dict(g) for g in games.values()]}
+
+
+def build_live(games, injuries):
+    engine = get_engine()
+    live = [g for g in games.values() if g.phase == LIVE]
+    out = []
+    for g, s in zip(live, evaluate_labels(live)):
+        state = live_state(g)
+        momentum, momentum_color = engine.momentum(g.event_id)
+        out.append({
+            "event_id": g.event_id, "game_key": g.game_key,
+            "away_team": g.away_team, "home_team": g.home_team, "away_score": g.away_score, "home_score": g.home_score,
+            "period": g.period, "clock": g.clock,
+            "state": state._asdict(),
+            "signals": {
+                "field_pressure": {"label": s.field[0], "color": s.field[1]},
+                "down_stress": {"label": s.down[0], "color": s.down[1]},
+                "clock_pressure": {"label": s.clock[0], "color": s.clock[1]},
+                "blowout_risk": {"label": s.blowout[0], "color": s.blowout[1]},
+                "momentum": {"label": momentum, "color": momentum_color},
+                "last_score_at": engine.last_score_at(g.event_id),
+            },
+            "kalshi_ticker": g.ticker,
+        })
+    return {"live": out}
+
+
+def build_picks(games, injuries):
+    scheduled = [g for g in games.values() if g.status_type == "STATUS_SCHEDULED"]
+    picks = score_slate([(g.home_team, g.away_team) for g in scheduled], injuries)
+    out = [{
+        "game_key": g.game_key, "away_team": g.away_team, "home_team": g.home_team,
+        "kickoff": g.game_date.isoformat() if g.game_date else None,
+        "pick": p.pick, "pick_code": (g.home_code if p.pick == g.home_team else g.away_code) if p.pick else None,
+        "score": p.score, "tier": p.tier, "reasons": list(p.reasons),
+        "home_out": list(p.home_out), "away_out": list(p.away_out),
+        "kalshi_ticker": g.ticker,
+    } for g, p in zip(scheduled, picks)]
+    out.sort(key=lambda r: r["score"], reverse=True)
+    return {"picks": out}
+
+
+ROUTES = {"/games": build_games, "/live": build_live, "/picks": build_picks}
+
+# feed versions restart at 1 with the process, so ETags carry a boot token
+BOOT = f"{os.getpid():x}{int(time.time()):x}"
+
+
+class ResponseCache:
+    """Serialized bodies per route, rebuilt only when a feed version changes"""
+
+    def __init__(self):
+        self._bodies = {}  # path -> (key, etag, body)
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        scores = SCORES_CACHE.get_snapshot(load_scoreboard)
+        injuries = INJURIES_CACHE.get_snapshot(load_injuries)
+        key = (scores.version, injuries.version)
+        hit = self._bodies.get(path)
+        if hit is not None and hit[0] == key:
+            return hit[1], hit[2]
+        with self._lock:
+            hit = self._bodies.get(path)
+            if hit is None or hit[0] != key:
+                get_engine().sync(scores.version, scores.value, virtual_now(timezone.utc).timestamp())
+                index = get_injury_index(injuries.value, injuries.version)
+                body = json.dumps(ROUTES[path](scores.value, index), separators=(",", ":"),
+                                  ensure_ascii=False).encode()
+                hit = self._bodies[path] = (key, f'"{path[1:]}-{BOOT}-{key[0]}-{key[1]}"', body)
+        return hit[1], hit[2]
+
+
+def healthz():
+    body = {}
+    for c in (SCORES_CACHE.stats(), INJURIES_CACHE.stats()):
+        body[c["name"]] = {"version": c["version"], "age": c["age"], "errors": c["errors"]}
+    return json.dumps(body).encode()
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: pollers reuse one connection
+    # one buffered write per response, sent immediately; otherwise Nagle holds
+    # the body behind the headers until the client's delayed ACK (~40ms)
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+    responses_cache = None
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/") or "/"
+        if path == "/healthz":
+            self._send(200, healthz())
+            return
+        if path not in ROUTES:
+            self._send(404, b'{"error":"not found"}')
+            return
+        try:
+            etag, body = self.responses_cache.get(path)
+        except Exception as e:
+            self._send(503, json.dumps({"error": str(e)}).encode())
+            return
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag)
+        else:
+            self._send(200, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_server(host="0.0.0.0", port=8600):
+    handler = type("Handler", (ApiHandler,), {"responses_cache": ResponseCache()})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+    start_scoreboard_poller()
+    server = make_server(args.host, args.port)
+    print(f"serving on http://{args.host}:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Historical backtest for calc_ml_score picks and signal tiers.
+
+Archive layout (one directory per season, files may be gzipped):
+
+    <archive>/<season>/week-01.scoreboard.json   raw ESPN scoreboard after the week is final
+    <archive>/<season>/week-01.injuries.json     raw ESPN injuries captured before kickoff (optional)
+    <archive>/<season>/team_stats.json           TEAM_STATS for that season (optional, else current)
+
+Seasons are replayed in parallel worker processes. Each season's graded picks
+are cached under <archive>/.backtest_cache keyed by (season, model version,
+archive fingerprint), so a rerun only replays seasons whose inputs or scoring
+code changed.
+
+    python -m nfl_edge.backtest data/archive --prices 50 55 60 --workers 4
+"""
+import argparse
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from nfl_edge import injuries as injuries_module
+from nfl_edge import scoring
+from nfl_edge.espn import parse_injuries, parse_scoreboard
+from nfl_edge.httpclient import json_loads
+from nfl_edge.injuries import InjuryIndex
+from nfl_edge.models import FINAL
+from nfl_edge.scoring import DEFAULT_STATS, StatsTable, score_slate
+from nfl_edge.teams import STAR_PLAYERS, TEAM_STATS
+
+WEEK_FILE = re.compile(r"^(week-\d+)\.(scoreboard|injuries)\.json(\.gz)?$")
+CACHE_DIR = ".backtest_cache"
+CALIBRATION_BUCKETS = (5.0, 6.0, 7.0, 8.0, 9.0)
+
+
+def read_json(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def model_version():
+    """Changes whenever the scoring code, the star list or the default team ratings change"""
+    src = inspect.getsource(scoring) + inspect.getsource(injuries_module)
+    src += json.dumps(STAR_PLAYERS, sort_keys=True)
+    # seasons without a team_stats.json are scored with the current TEAM_STATS
+    src += json.dumps(TEAM_STATS, sort_keys=True)
+    return hashlib.sha1(src.encode()).hexdigest()[:12]
+
+
+def season_fingerprint(season_dir):
+    h = hashlib.sha1()
+    for name in sorted(os.listdir(season_dir)):
+        st = os.stat(os.path.join(season_dir, name))
+        h.update(f"{name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()[:12]
+
+
+def season_weeks(season_dir):
+    """{week: {"scoreboard": path, "injuries": path}} in week order"""
+    weeks = {}
+    for name in sorted(os.listdir(season_dir)):
+        m = WEEK_FILE.match(name)
+        if m:
+            weeks.setdefault(m.group(1), {})[m.group(2)] = os.path.join(season_dir, name)
+    return weeks
+
+
+def replay_season(season_dir):
+    """Grade every final game of a season; runs inside a worker process"""
+    season = os.path.basename(season_dir.rstrip(os.sep))
+    stats_path = os.path.join(season_dir, "team_stats.json")
+    stats = StatsTable(read_json(stats_path)) if os.path.exists(stats_path) else DEFAULT_STATS
+
+    records = []
+    for week, files in season_weeks(season_dir).items():
+        if "scoreboard" not in files:
+            continue
+        games = [g for g in parse_scoreboard(read_json(files["scoreboard"])).values()
+                 if g.phase == FINAL]
+        injuries = parse_injuries(read_json(files["injuries"])) if "injuries" in files else {}
+        picks = score_slate([(g.home_team, g.away_team) for g in games], InjuryIndex(injuries), stats)
+        for g, p in zip(games, picks):
+            if g.home_score == g.away_score:
+                won = None
+            else:
+                won = (p.pick == g.home_team) == (g.home_score > g.away_score)
+            records.append({
+                "season": season, "week": week, "game": g.game_key,
+                "pick": p.pick, "score": p.score, "tier": p.tier, "won": won,
+            })
+    return records
+
+
+def run_backtest(archive, seasons=None, workers=None):
+    """Return graded pick records for the requested seasons, using the cache where valid"""
+    seasons = seasons or sorted(d for d in os.listdir(archive)
+                                if os.path.isdir(os.path.join(archive, d)) and not d.startswith("."))
+    cache_dir = os.path.join(archive, CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    version = model_version()
+
+    results, todo = {}, {}
+    for season in seasons:
+        season_dir = os.path.join(archive, season)
+        cache_path = os.path.join(cache_dir, f"{season}-{version}-{season_fingerprint(season_dir)}.json")
+        if os.path.exists(cache_path):
+            results[season] = read_json(cache_path)
+        else:
+            todo[season] = (season_dir, cache_path)
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            dirs = [season_dir for season_dir, _ in todo.values()]
+            for season, records in zip(todo, pool.map(replay_season, dirs)):
+                results[season] = records
+                cache_path = todo[season][1]
+                with open(cache_path + ".tmp", "w") as f:
+                    json.dump(records, f)
+                os.replace(cache_path + ".tmp", cache_path)
+
+    return [r for season in seasons for r in results[season]]
+
+
+def summarize(records, prices=(50,), min_score=5.5):
+    """Hit rate, per-tier hit rate, calibration and flat-stake P&L per entry price"""
+    decided = [r for r in records if r["won"] is not None]
+
+    def rate(rows):
+        return round(sum(r["won"] for r in rows) / len(rows), 3) if rows else None
+
+    tiers = {}
+    for r in decided:
+        tiers.setdefault(r["tier"], []).append(r)
+
+    calibration = []
+    edges = CALIBRATION_BUCKETS + (10.01,)
+    for lo, hi in zip(edges, edges[1:]):
+        rows = [r for r in decided if lo <= r["score"] < hi]
+        if rows:
+            calibration.append({
+                "bucket": f"{lo:.0f}-{min(hi, 10):.0f}",
+                "n": len(rows),
+                "predicted": round(sum(r["score"] for r in rows) / len(rows) / 10, 3),
+                "observed": rate(rows),
+            })
+
+    bets = [r for r in decided if r["score"] >= min_score]
+    pnl = {}
+    for price in prices:
+        total = sum((100 - price) / 100 if r["won"] else -price / 100 for r in bets)
+        staked = len(bets) * price / 100
+        pnl[price] = {"bets": len(bets), "pnl": round(total, 2), "roi": round(total / staked, 3) if staked else None}
+
+    return {
+        "games": len(records),
+        "decided": len(decided),
+        "hit_rate": rate(decided),
+        "brier": round(sum((r["score"] / 10 - r["won"]) ** 2 for r in decided) / len(decided), 4) if decided else None,
+        "by_tier": {tier: {"n": len(rows), "hit_rate": rate(rows)} for tier, rows in sorted(tiers.items())},
+        "calibration": calibration,
+        "pnl": pnl,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("archive")
+    parser.add_argument("--seasons", nargs="*")
+    parser.add_argument("--prices", nargs="*", type=int, default=[50])
+    parser.add_argument("--min-score", type=float, default=5.5)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    records = run_backtest(args.archive, args.seasons, args.workers)
+    print(json.dumps(summarize(records, args.prices, args.min_score), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
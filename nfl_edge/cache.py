@@ -0,0 +1,175 @@
+"""Process-wide feed cache shared by every Streamlit session.
+
+Streamlit re-executes app.py on every rerun, but imported modules live for the
+whole server process, so caches registered here are shared across sessions.
+"""
+import threading
+import time
+from collections import namedtuple
+
+Snapshot = namedtuple("Snapshot", ["value", "version", "fetched_at", "expires_at"])
+
+
+class _Flight:
+    """One in-flight load that concurrent callers wait on"""
+    __slots__ = ("done", "snapshot", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.snapshot = None
+        self.error = None
+
+
+class FeedCache:
+    """TTL cache with single-flight loads and stale-while-revalidate.
+
+    - fresh snapshot: returned immediately (hit)
+    - expired snapshot: returned immediately, one background refresh started (stale hit)
+    - no snapshot: callers block on a single shared load (miss)
+    """
+
+    def __init__(self, name, ttl, max_stale=None):
+        self.name = name
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._flight = None
+        self._version = 0
+        self._restored_version = 0
+        self.on_publish = None  # called as on_publish(snapshot) for each new version
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.errors = 0
+        self.last_error = None  # error of the latest load; cleared when a load succeeds
+        self.failing_since = None
+
+    def get(self, loader):
+        return self.get_snapshot(loader).value
+
+    def get_snapshot(self, loader):
+        now = time.time()
+        with self._lock:
+            snap = self._snapshot
+            if snap is not None and now < snap.expires_at:
+                self.hits += 1
+                return snap
+            if snap is not None and (self.max_stale is None or now - snap.fetched_at < self.max_stale):
+                self.stale_hits += 1
+                flight, leader = self._begin()
+                if leader:
+                    threading.Thread(target=self._run, args=(flight, loader, None),
+                                     name=f"feedcache-{self.name}", daemon=True).start()
+                return snap
+            self.misses += 1
+            flight, leader = self._begin()
+        return self._finish(flight, leader, loader, None)
+
+    def refresh(self, loader, ttl=None):
+        """Force a load (joining any in-flight one) and return the new value.
+
+        `ttl` may be a callable taking the loaded value, so the publisher can
+        decide how long a snapshot stays fresh from its contents.
+        """
+        with self._lock:
+            flight, leader = self._begin()
+        return self._finish(flight, leader, loader, ttl).value
+
+    def put(self, value, ttl=None):
+        """Publish `value`; re-publishing the current object keeps its version"""
+        now = time.time()
+        with self._lock:
+            changed = self._snapshot is None or value is not self._snapshot.value
+            if changed:
+                self._version += 1
+            snap = self._snapshot = Snapshot(value, self._version, now, now + (self.ttl if ttl is None else ttl))
+        if changed and self.on_publish is not None:
+            self.on_publish(snap)
+        return snap
+
+    def restore(self, value, fetched_at, expires_at):
+        """Seed an empty cache with a value saved by an earlier process"""
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            self._version += 1
+            self._restored_version = self._version
+            self._snapshot = Snapshot(value, self._version, fetched_at, expires_at)
+            return self._snapshot
+
+    def peek(self):
+        return self._snapshot
+
+    def stats(self):
+        snap = self._snapshot
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "errors": self.errors,
+            "version": snap.version if snap else 0,
+            "age": round(time.time() - snap.fetched_at, 1) if snap else None,
+            "inflight": self._flight is not None,
+            "failing_for": round(time.time() - self.failing_since) if self.failing_since else None,
+            "restored": snap is not None and snap.version == self._restored_version,
+        }
+
+    # caller must hold self._lock
+    def _begin(self):
+        if self._flight is not None:
+            return self._flight, False
+        self._flight = _Flight()
+        return self._flight, True
+
+    def _finish(self, flight, leader, loader, ttl):
+        if leader:
+            self._run(flight, loader, ttl)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.snapshot
+
+    def _run(self, flight, loader, ttl):
+        try:
+            value = loader()
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                self.errors += 1
+                self.last_error = e
+                if self.failing_since is None:
+                    self.failing_since = time.time()
+        else:
+            flight.snapshot = self.put(value, ttl(value) if callable(ttl) else ttl)
+            with self._lock:
+                self.last_error = self.failing_since = None
+        finally:
+            with self._lock:
+                self.loads += 1
+                self._flight = None
+            flight.done.set()
+
+
+# ========== REGISTRY ==========
+_caches = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(name, ttl, max_stale=None):
+    """Return the process-wide cache for `name`, creating it on first use"""
+    with _registry_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = _caches[name] = FeedCache(name, ttl, max_stale)
+        return cache
+
+
+def all_stats():
+    with _registry_lock:
+        caches = list(_caches.values())
+    return [c.stats() for c in caches]
@@ -0,0 +1,72 @@
+"""Last good feed values on disk, so a fresh process renders before ESPN answers.
+
+persist() seeds a FeedCache from NFL_DISK_CACHE/<name>.json.gz at startup and
+saves every newly published value there (gzipped JSON, written to a temp file
+and renamed into place). The restored snapshot keeps its original fetch time,
+so stats() ages and the page's "saved" note are honest. It stays fresh for as
+long as the publisher's schedule says it would have: a slate that was all
+final is not refetched until the board could have rolled over; anything else
+is served stale once while the first real load runs in the background.
+
+Disabled when NFL_DISK_CACHE is empty, and under replay so recorded sessions
+never mix with saved live data.
+"""
+import gzip
+import json
+import os
+
+from nfl_edge.httpclient import json_loads
+from nfl_edge.replay import REPLAY_PATH
+
+DISK_CACHE_DIR = "" if REPLAY_PATH else os.environ.get("NFL_DISK_CACHE", "nfl_cache")
+
+
+def _path(name):
+    return os.path.join(DISK_CACHE_DIR, f"{name}.json.gz")
+
+
+def save(name, value, fetched_at):
+    path = _path(name)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump({"fetched_at": fetched_at, "value": value}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load(name):
+    """(value, fetched_at) or None"""
+    try:
+        with gzip.open(_path(name), "rb") as f:
+            state = json_loads(f.read())
+        return state["value"], float(state["fetched_at"])
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        return None
+
+
+def persist(cache, dump=None, restore=None, fresh_for=None):
+    """Restore `cache` from disk now and save each new version it publishes.
+
+    `dump`/`restore` convert between the cached value and JSON; `fresh_for`
+    maps a restored value to the seconds it stays fresh after its fetch time
+    (default: the cache's TTL).
+    """
+    if not DISK_CACHE_DIR:
+        return
+    saved = load(cache.name)
+    if saved is not None:
+        data, fetched_at = saved
+        try:
+            value = restore(data) if restore else data
+        except (KeyError, TypeError, ValueError):
+            value = None
+        if value is not None:
+            ttl = fresh_for(value) if fresh_for else cache.ttl
+            cache.restore(value, fetched_at, fetched_at + ttl)
+    cache.on_publish = lambda snap: save(cache.name, dump(snap.value) if dump else snap.value, snap.fetched_at)
@@ -0,0 +1,123 @@
+"""ESPN data layer: scoreboard/injury loaders and their process-wide caches"""
+import os
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+from nfl_edge.cache import get_cache
+from nfl_edge.diskcache import persist
+from nfl_edge.feeds import register_feed
+from nfl_edge.httpclient import get_client
+from nfl_edge.poller import ensure_poller, next_poll_delay
+from nfl_edge.models import Game, eastern, enrich, game_from_dict, game_to_dict
+from nfl_edge.teams import TEAM_ABBREVS
+
+ESPN_API = os.environ.get("NFL_ESPN_API", "https://site.api.espn.com/apis/site/v2/sports/football/nfl")
+SCOREBOARD_URL = f"{ESPN_API}/scoreboard"
+INJURIES_URL = f"{ESPN_API}/injuries"
+
+_EMPTY = {}  # shared default for missing nested objects; never mutated
+
+SCORES_CACHE = get_cache("scoreboard", ttl=int(os.environ.get("NFL_SCORES_TTL", 15)))
+INJURIES_CACHE = get_cache("injuries", ttl=int(os.environ.get("NFL_INJURIES_TTL", 300)))
+
+
+def load_scoreboard():
+    return get_client().get_parsed(SCOREBOARD_URL, parse_scoreboard)
+
+
+@lru_cache(maxsize=256)
+def _kickoff(date_str):
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
+def parse_scoreboard(data):
+    """Build {game_key: Game} in one pass, resolving each nested object once"""
+    games = {}
+    for event in data.get("events") or ():
+        comps = event.get("competitions")
+        comp = comps[0] if comps else _EMPTY
+        competitors = comp.get("competitors") or ()
+        if len(competitors) < 2:
+            continue
+        home_team, away_team, home_score, away_score = None, None, 0, 0
+        home_id, away_id = None, None
+        for c in competitors:
+            team = c.get("team") or _EMPTY
+            name = team.get("displayName", "")
+            if c.get("homeAway") == "home":
+                home_team, home_score, home_id = TEAM_ABBREVS.get(name, name), int(c.get("score") or 0), team.get("id", "")
+            else:
+                away_team, away_score, away_id = TEAM_ABBREVS.get(name, name), int(c.get("score") or 0), team.get("id", "")
+
+        status_obj = event.get("status") or _EMPTY
+        status_type = (status_obj.get("type") or _EMPTY).get("name", "STATUS_SCHEDULED")
+        clock = status_obj.get("displayClock", "")
+
+        situation = comp.get("situation") or _EMPTY
+        yards_to_endzone = situation.get("yardsToEndzone", 50)
+        possession_id = situation.get("possession", "")
+        if possession_id == home_id:
+            possession_team = home_team
+            ball_yard = yards_to_endzone if yards_to_endzone is not None else 50
+        elif possession_id == away_id:
+            possession_team = away_team
+            ball_yard = 100 - yards_to_endzone if yards_to_endzone is not None else 50
+        else:
+            possession_team = None
+            ball_yard = 50
+
+        try:
+            game_date = _kickoff(event.get("date", ""))
+        except (AttributeError, ValueError):
+            game_date = datetime.now(eastern)
+
+        game_key = f"{away_team}@{home_team}"
+        # positional in Game field order: ~2x cheaper than keyword construction
+        period = status_obj.get("period", 0)
+        games[game_key] = Game(
+            event.get("id", ""), game_key, away_team, home_team, away_id, home_id,
+            away_score, home_score, away_score + home_score, period, clock, status_type, game_date,
+            situation.get("down"), situation.get("distance"), situation.get("yardLine", 50), yards_to_endzone,
+            ball_yard, possession_team, situation.get("isRedZone", False), situation.get("possessionText", ""),
+            *enrich(away_team, home_team, period, clock, status_type, game_date),
+        )
+    return MappingProxyType(games)
+
+
+def load_injuries():
+    return get_client().get_parsed(INJURIES_URL, parse_injuries)
+
+
+def parse_injuries(data):
+    injuries = {}
+    for team_data in data.get("injuries", []):
+        team_name = team_data.get("displayName", "")
+        team_key = TEAM_ABBREVS.get(team_name, team_name)
+        if not team_key:
+            continue
+        injuries[team_key] = []
+        for player in team_data.get("injuries", []):
+            athlete = player.get("athlete", {})
+            name = athlete.get("displayName", "")
+            status = player.get("status", "")
+            position = athlete.get("position", {}).get("abbreviation", "")
+            if name:
+                injuries[team_key].append({"name": name, "status": status, "position": position})
+    return injuries
+
+
+def start_scoreboard_poller():
+    """Keep SCORES_CACHE warm from a background thread (once per process)"""
+    return ensure_poller("scoreboard", SCORES_CACHE, load_scoreboard)
+
+
+# restored slates stay fresh as long as the poller would have left them alone
+persist(SCORES_CACHE,
+        dump=lambda games: [game_to_dict(g) for g in games.values()],
+        restore=lambda rows: MappingProxyType({d["game_key"]: game_from_dict(d) for d in rows}),
+        fresh_for=lambda games: next_poll_delay(games)[0])
+persist(INJURIES_CACHE)
+
+register_feed("scoreboard", SCORES_CACHE, load_scoreboard)
+register_feed("injuries", INJURIES_CACHE, load_injuries)
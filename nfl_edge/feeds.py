@@ -0,0 +1,57 @@
+"""Concurrent fan-out over independent upstream feeds.
+
+Each feed is a (FeedCache, loader) pair registered by name. fetch_feeds()
+loads any number of them in parallel under one overall deadline; feeds that
+miss the deadline or fail fall back to their last good snapshot and are
+reported as stale. Loads that overrun keep going in the background and land in
+the cache for the next rerun. An expired snapshot whose refreshes keep failing
+(upstream down, circuit open) is reported as stale too, with the error.
+"""
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from nfl_edge.metrics import span
+
+FeedResult = namedtuple("FeedResult", ["values", "versions", "stale", "errors"])
+
+_feeds = {}
+_feeds_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="feeds")
+
+
+def register_feed(name, cache, loader, empty=None):
+    """Register a feed; `empty` is returned when it has never loaded"""
+    with _feeds_lock:
+        _feeds[name] = (cache, loader, {} if empty is None else empty)
+
+
+def _timed_get(name, cache, loader):
+    with span(f"fetch_{name}"):
+        return cache.get_snapshot(loader)
+
+
+def fetch_feeds(names, deadline):
+    with _feeds_lock:
+        specs = {name: _feeds[name] for name in names}
+    futures = {name: _executor.submit(_timed_get, name, cache, loader) for name, (cache, loader, _) in specs.items()}
+    wait(futures.values(), timeout=deadline)
+
+    values, versions, stale, errors = {}, {}, set(), {}
+    for name, future in futures.items():
+        cache, _, empty = specs[name]
+        if future.done() and future.exception() is None:
+            snap = future.result()
+            error = cache.last_error
+            if error is not None and time.time() >= snap.expires_at:
+                stale.add(name)
+                errors[name] = error
+        else:
+            if future.done():
+                errors[name] = future.exception()
+            snap = cache.peek()
+            stale.add(name)
+        values[name] = snap.value if snap else empty
+        versions[name] = snap.version if snap else 0
+    return FeedResult(values, versions, stale, errors)
@@ -0,0 +1,170 @@
+"""Process-wide game state engine for history-based live signals.
+
+Scoring drought and momentum need history across polls. Each session used to
+keep its own copy in st.session_state, so every viewer saw a different answer
+and a new tab started from scratch. Here each scoreboard snapshot is ingested
+once per process, history lives in bounded ring buffers keyed by ESPN
+event_id, and every session reads the same derived signals. State is
+checkpointed to disk so a restart doesn't reset it.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+CHECKPOINT_PATH = os.environ.get("NFL_GAMESTATE_PATH", "nfl_gamestate.json")
+CHECKPOINT_EVERY = 30
+FIELD_HISTORY = 10
+SCORE_HISTORY = 20
+EXPIRE_AFTER = 36 * 3600
+
+
+class GameTrack:
+    """History for one event: score changes and field position samples"""
+    __slots__ = ("last_total", "last_score_time", "scored_version", "seen_at", "scores", "field", "momentum")
+
+    def __init__(self, total, now):
+        self.last_total = total
+        self.last_score_time = now
+        self.scored_version = None
+        self.seen_at = now
+        self.scores = deque(maxlen=SCORE_HISTORY)  # (time, total)
+        self.field = deque(maxlen=FIELD_HISTORY)  # (team, yards_to_endzone, time)
+        self.momentum = ("NEUTRAL", "#888888")
+
+    def to_dict(self):
+        return {
+            "last_total": self.last_total, "last_score_time": self.last_score_time, "seen_at": self.seen_at,
+            "scores": list(self.scores), "field": list(self.field), "momentum": list(self.momentum),
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        track = cls(d["last_total"], d["last_score_time"])
+        track.seen_at = d["seen_at"]
+        track.scores.extend(tuple(s) for s in d["scores"])
+        track.field.extend(tuple(f) for f in d["field"])
+        track.momentum = tuple(d["momentum"])
+        return track
+
+
+def momentum_from(field):
+    """Calculate momentum state - uses only field position trend"""
+    if len(field) < 3:
+        return "NEUTRAL", "#888888"
+
+    recent = list(field)[-3:]
+    same_team = all(f[0] == recent[0][0] for f in recent)
+
+    if same_team and recent[0][0]:
+        # Check if advancing (yards decreasing toward 0)
+        if recent[-1][1] < recent[0][1] - 10:
+            return "ADVANCING", "#44ff44"
+        elif recent[-1][1] > recent[0][1] + 5:
+            return "STALLED", "#ff8800"
+
+    return "NEUTRAL", "#888888"
+
+
+class GameStateEngine:
+    def __init__(self, checkpoint_path=CHECKPOINT_PATH):
+        self.checkpoint_path = checkpoint_path
+        self.version = None
+        self.tracks = {}
+        self._lock = threading.Lock()
+        self._checkpointed_at = 0
+        self._load()
+
+    def sync(self, version, games, now=None):
+        """Ingest a scoreboard snapshot once; the same or an older version is a no-op.
+
+        Versions only grow, so a session syncing the board its script run saw
+        after another session already ingested a newer one must not replay it.
+        """
+        if self.version is not None and version <= self.version:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            if self.version is not None and version <= self.version:
+                return
+            for g in games.values():
+                if g.period <= 0 or not g.event_id:
+                    continue
+                track = self.tracks.get(g.event_id)
+                if track is None:
+                    track = self.tracks[g.event_id] = GameTrack(g.total, now)
+                elif g.total != track.last_total:
+                    track.last_total = g.total
+                    track.last_score_time = now
+                    track.scored_version = version
+                    track.scores.append((now, g.total))
+                track.seen_at = now
+                if g.possession_team and g.yards_to_endzone:
+                    track.field.append((g.possession_team, g.yards_to_endzone, now))
+                    track.momentum = momentum_from(track.field)
+            self.version = version
+            for event_id in [e for e, t in self.tracks.items() if now - t.seen_at > EXPIRE_AFTER]:
+                del self.tracks[event_id]
+            if now - self._checkpointed_at >= CHECKPOINT_EVERY:
+                self._checkpoint(now)
+
+    def drought(self, event_id, now=None):
+        """Time since last score - uses only score + clock"""
+        track = self.tracks.get(event_id)
+        if track is None:
+            return "TRACKING", "#888888", "—"
+        if track.scored_version is not None and track.scored_version == self.version:
+            return "JUST SCORED", "#44ff44", "0:00"
+
+        drought_seconds = max(0, (time.time() if now is None else now) - track.last_score_time)
+        drought_minutes = drought_seconds / 60
+        drought_str = f"{int(drought_minutes)}:{int(drought_seconds % 60):02d}"
+
+        if drought_minutes < 3:
+            return "NORMAL", "#44ff44", drought_str
+        elif drought_minutes < 6:
+            return "MODERATE", "#ffaa00", drought_str
+        else:
+            return "LONG", "#ff8800", drought_str
+
+    def last_score_at(self, event_id):
+        """Epoch seconds of the last observed score change, None before tracking starts"""
+        track = self.tracks.get(event_id)
+        return track.last_score_time if track else None
+
+    def momentum(self, event_id):
+        track = self.tracks.get(event_id)
+        return track.momentum if track else ("NEUTRAL", "#888888")
+
+    def _checkpoint(self, now):
+        state = {"tracks": {e: t.to_dict() for e, t in self.tracks.items()}}
+        tmp = self.checkpoint_path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.checkpoint_path)
+            self._checkpointed_at = now
+        except OSError:
+            pass
+
+    def _load(self):
+        try:
+            with open(self.checkpoint_path) as f:
+                state = json.load(f)
+            self.tracks = {e: GameTrack.from_dict(d) for e, d in state.get("tracks", {}).items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            self.tracks = {}
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide GameStateEngine"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = GameStateEngine()
+        return _engine
@@ -0,0 +1,343 @@
+"""Shared connection-pooled HTTP client for upstream feeds.
+
+Keeps TCP/TLS connections alive between polls, asks for gzip, and revalidates
+with ETag / Last-Modified so an unchanged feed costs a 304 and no parsing.
+
+Every request runs under a total budget (NFL_HTTP_TIMEOUT seconds, connect
+and body included): the caller stops waiting at the deadline, and the worker
+thread's own socket timeouts and body reads stop there too, so a hung upstream
+can't pin pooled connections past it. Requests also go through a circuit
+breaker per endpoint (scheme, host
+and path). NFL_BREAKER_FAILURES failures in a row open the circuit: calls
+then fail at once with CircuitOpen instead of waiting on a dead upstream,
+and the caches keep serving their last good snapshot. After a backoff
+(NFL_BREAKER_BASE seconds, doubling per re-open up to NFL_BREAKER_MAX, with
+jitter) one trial request goes through; success closes the circuit.
+
+With NFL_HEDGE=1 a request still unanswered after the endpoint's recent p95
+latency is sent a second time and the first good answer wins, which cuts
+the tail when a few requests stall.
+
+benchmarks/espn_stub.py injects latency, tails, errors and outages for
+trying this out:
+
+    python -m nfl_edge.httpclient http://127.0.0.1:8800/apis/site/v2/sports/football/nfl/scoreboard -n 200
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+USER_AGENT = "nfl-edge-finder/2.0"
+REQUEST_TIMEOUT = float(os.environ.get("NFL_HTTP_TIMEOUT", 4))          # total budget per request
+CONNECT_TIMEOUT = float(os.environ.get("NFL_HTTP_CONNECT_TIMEOUT", 2))
+BREAKER_FAILURES = int(os.environ.get("NFL_BREAKER_FAILURES", 3))
+BREAKER_BASE = float(os.environ.get("NFL_BREAKER_BASE", 5))
+BREAKER_MAX = float(os.environ.get("NFL_BREAKER_MAX", 300))
+HEDGE = os.environ.get("NFL_HEDGE") == "1"
+HEDGE_MIN = float(os.environ.get("NFL_HEDGE_MIN", 0.05))  # never hedge sooner than this
+HEDGE_SAMPLES = 20                                        # latencies needed before hedging
+LATENCY_WINDOW = 200
+BODY_CHUNK = 16 * 1024  # body reads check the deadline between chunks
+
+
+class CircuitOpen(requests.RequestException):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+
+def _remaining(key, deadline):
+    """Seconds left before `deadline`; raises Timeout once it has passed"""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.Timeout(f"{key}: request budget spent")
+    return remaining
+
+
+def backoff(attempt, base, cap):
+    """Seconds before retry number `attempt` (1-based): exponential, halved by jitter at most"""
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def endpoint(url):
+    """Circuit key for a URL: scheme, host and path (query strings share a circuit)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def _counts_as_failure(error):
+    # a 404 or 400 is the caller's problem, not a sign the upstream is down
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return True
+
+
+class CircuitBreaker:
+    """closed -> open after `threshold` failures in a row -> half-open after a backoff.
+
+    Half-open lets one trial call through: success closes the circuit, failure
+    re-opens it for about twice as long as last time.
+    """
+
+    def __init__(self, name, threshold=BREAKER_FAILURES, base=BREAKER_BASE, cap=BREAKER_MAX):
+        self.name = name
+        self.threshold = threshold
+        self.base = base
+        self.cap = cap
+        self.state = "closed"
+        self.failures = 0    # in a row
+        self.opens = 0       # in a row, drives the backoff
+        self.open_until = 0.0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() >= self.open_until:
+                self.state = "half-open"
+                return True
+            self.rejected += 1
+            return False
+
+    def success(self):
+        with self._lock:
+            self.state, self.failures, self.opens = "closed", 0, 0
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half-open" or self.failures >= self.threshold:
+                self.opens += 1
+                self.state = "open"
+                self.open_until = time.monotonic() + backoff(self.opens, self.base, self.cap)
+
+    def retry_in(self):
+        return max(0.0, self.open_until - time.monotonic()) if self.state == "open" else 0.0
+
+    def stats(self):
+        return {"state": self.state, "failures": self.failures, "opens": self.opens,
+                "retry_in": round(self.retry_in()), "rejected": self.rejected}
+
+
+class HttpClient:
+    def __init__(self, pool_size=8, recorder=None, hedge=HEDGE):
+        self.recorder = recorder
+        self.hedge = hedge
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": USER_AGENT})
+        self._lock = threading.Lock()
+        self._validators = {}  # url -> (etag, last_modified, parsed)
+        self._circuits = {}    # endpoint -> CircuitBreaker
+        self._latencies = {}   # endpoint -> recent successful request durations
+        # requests run here so a budget can be enforced and a hedge raced against them
+        self._executor = ThreadPoolExecutor(max_workers=2 * pool_size, thread_name_prefix="http")
+        self.requests = 0
+        self.not_modified = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.failures = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def circuit(self, url):
+        key = endpoint(url)
+        with self._lock:
+            breaker = self._circuits.get(key)
+            if breaker is None:
+                breaker = self._circuits[key] = CircuitBreaker(key)
+            return breaker
+
+    def circuits(self):
+        with self._lock:
+            return {key: breaker.stats() for key, breaker in self._circuits.items()}
+
+    def get_parsed(self, url, parse, timeout=None):
+        """GET `url` and return parse(json) within `timeout` seconds; a 304 returns the previous result.
+
+        Raises CircuitOpen without touching the network while the endpoint's circuit is open.
+        """
+        breaker = self.circuit(url)
+        if not breaker.allow():
+            raise CircuitOpen(f"{breaker.name} unavailable, retrying in {breaker.retry_in():.0f}s")
+        try:
+            parsed = self._race(endpoint(url), url, parse, REQUEST_TIMEOUT if timeout is None else timeout)
+        except Exception as e:
+            if _counts_as_failure(e):
+                with self._lock:
+                    self.failures += 1
+                breaker.failure()
+            else:
+                breaker.success()
+            raise
+        breaker.success()
+        return parsed
+
+    def _race(self, key, url, parse, budget):
+        """Run one request, plus a hedge once it outlives the endpoint's p95; first good answer wins"""
+        deadline = time.monotonic() + budget
+        futures = [self._executor.submit(self._fetch, key, url, parse, deadline)]
+        hedge_after = self.hedge_delay(key) if self.hedge else None
+        if hedge_after is not None and hedge_after < budget:
+            done, _ = wait(futures, timeout=hedge_after)
+            if not done:
+                with self._lock:
+                    self.hedged += 1
+                futures.append(self._executor.submit(self._fetch, key, url, parse, deadline))
+        pending, error = set(futures), None
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    if future is not futures[0]:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                error = future.exception()
+        # a request that overran gives up its connection at the same deadline (see _fetch)
+        if error is not None and not pending:
+            raise error
+        raise requests.Timeout(f"{key}: no response within {budget:g}s")
+
+    def hedge_delay(self, key):
+        """Seconds after which a request to `key` is hedged: its recent p95, None until there is history"""
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < HEDGE_SAMPLES:
+            return None
+        return max(HEDGE_MIN, samples[int(0.95 * (len(samples) - 1))])
+
+    def _fetch(self, key, url, parse, deadline):
+        """One GET that ends by `deadline` (monotonic), connect and body included"""
+        started = time.monotonic()
+        headers = {}
+        with self._lock:
+            cached = self._validators.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        remaining = _remaining(key, deadline)
+        resp = self.session.get(url, headers=headers, stream=True, timeout=(min(CONNECT_TIMEOUT, remaining), remaining))
+        with resp:
+            if resp.status_code == 304 and cached:
+                with self._lock:
+                    self.requests += 1
+                    self.not_modified += 1
+                    self._observe(key, time.monotonic() - started)
+                return cached[2]
+            resp.raise_for_status()
+            # the read timeout bounds each socket read, so a trickling body is cut off at the deadline here
+            chunks = []
+            for chunk in resp.iter_content(BODY_CHUNK):
+                chunks.append(chunk)
+                _remaining(key, deadline)
+            body = b"".join(chunks)
+        if self.recorder:
+            self.recorder.record(url, body)
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += int(resp.headers.get("Content-Length") or len(body))
+            self.body_bytes += len(body)
+            self._observe(key, time.monotonic() - started)
+        parsed = parse(json_loads(body))
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._lock:
+                self._validators[url] = (etag, last_modified, parsed)
+        return parsed
+
+    # caller holds self._lock
+    def _observe(self, key, seconds):
+        window = self._latencies.get(key)
+        if window is None:
+            window = self._latencies[key] = deque(maxlen=LATENCY_WINDOW)
+        window.append(seconds)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "not_modified_rate": round(self.not_modified / self.requests, 3) if self.requests else 0.0,
+            "wire_bytes": self.wire_bytes,
+            "body_bytes": self.body_bytes,
+            "failures": self.failures,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "open_circuits": sum(1 for c in self.circuits().values() if c["state"] != "closed"),
+        }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide HttpClient (a ReplayClient when NFL_REPLAY is set)"""
+    global _client
+    from nfl_edge import replay
+
+    if replay.REPLAY_PATH:
+        return replay.get_replay_client()
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(recorder=replay.Recorder(replay.RECORD_PATH) if replay.RECORD_PATH else None)
+        return _client
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hammer one URL through HttpClient and report latency, "
+                                                 "hedges and circuit-breaker rejections")
+    parser.add_argument("url")
+    parser.add_argument("-n", type=int, default=200, help="requests to send")
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between requests")
+    parser.add_argument("--hedge", action="store_true", default=HEDGE, help="hedge after the p95 (or NFL_HEDGE=1)")
+    args = parser.parse_args()
+
+    client = HttpClient(hedge=args.hedge)
+    latencies, outcomes = [], {}
+    for _ in range(args.n):
+        started = time.perf_counter()
+        try:
+            client.get_parsed(args.url, lambda data: None)
+            outcome = "ok"
+        except CircuitOpen:
+            outcome = "circuit open"
+        except Exception as e:
+            outcome = type(e).__name__
+        latencies.append(time.perf_counter() - started)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        time.sleep(args.interval)
+    latencies.sort()
+    for q in (0.5, 0.95, 0.99, 1.0):
+        print(f"p{q * 100:g}".ljust(6), f"{latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000:8.1f}ms")
+    print("outcomes", outcomes)
+    print("client", {k: v for k, v in client.stats().items() if k in ("requests", "failures", "hedged", "hedge_wins")})
+    print("circuit", client.circuit(args.url).stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Injury index: per-team injury scores computed once per injuries snapshot.
+
+calc_ml_score used to rescan every injury and re-lowercase every star name for
+each team on each rerun. Here the star lists are compiled into one regex per
+team at import, and (score, out_players, qb_out) is computed for every team
+once when a new injuries snapshot arrives.
+"""
+import itertools
+import re
+
+from nfl_edge.teams import STAR_PLAYERS
+
+# substring semantics match the old `star.lower() in name.lower()` scan exactly
+STAR_PATTERNS = {
+    team: re.compile("|".join(re.escape(star.lower()) for star in stars))
+    for team, stars in STAR_PLAYERS.items() if stars
+}
+
+NO_INJURIES = (0, (), False)
+
+_versions = itertools.count(1)
+
+
+def score_team(team, team_injuries):
+    star_pattern = STAR_PATTERNS.get(team)
+    score = 0
+    out_players = []
+    qb_out = False
+
+    for inj in team_injuries:
+        if "OUT" not in inj.get("status", "").upper():
+            continue
+        name = inj.get("name", "")
+        if inj.get("position", "").upper() == "QB":
+            score += 5.0
+            qb_out = True
+            out_players.append(f"🚨 {name} (QB)")
+        elif star_pattern and star_pattern.search(name.lower()):
+            score += 2.0
+            out_players.append(name)
+
+    return score, tuple(out_players), qb_out
+
+
+class InjuryIndex:
+    """Immutable per-snapshot lookup of team -> (score, out_players, qb_out).
+
+    `version` is unique per index in this process, so scoring memos can key
+    on it; `feed_version` is the injuries cache snapshot it was built from.
+    """
+    __slots__ = ("version", "feed_version", "source", "_scores")
+
+    def __init__(self, injuries, feed_version=0):
+        self.version = next(_versions)
+        self.feed_version = feed_version
+        self.source = injuries
+        self._scores = {team: score_team(team, team_injuries) for team, team_injuries in injuries.items()}
+
+    def team_score(self, team):
+        return self._scores.get(team, NO_INJURIES)
+
+
+_current = None
+
+
+def get_injury_index(injuries, feed_version):
+    """Return the index for this snapshot, rebuilding only when the feed changed"""
+    global _current
+    index = _current
+    if index is None or index.feed_version != feed_version or index.source is not injuries:
+        index = _current = InjuryIndex(injuries, feed_version)
+    return index
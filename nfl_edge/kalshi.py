@@ -0,0 +1,222 @@
+"""Kalshi market data: batched quote fetches and model-vs-market edge.
+
+Every Game carries its event ticker (KXNFLGAME-<date><away><home>); the event
+holds one yes/no market per team, <event ticker>-<team code>. fetch_quotes()
+asks for up to BATCH events per GET /markets call and runs the batches
+concurrently over one pooled client under a token-bucket rate limit, so a
+16-game slate costs two parallel requests: one round trip. get_quotes() caches
+the slate's quotes for NFL_KALSHI_TTL seconds and serves stale quotes while a
+refresh runs, like the ESPN feeds.
+
+Edge is the model probability (ML score / 10, the calibration the backtest
+grades) minus the ask for the pick. Positions mark to the bid: what the
+contracts would fetch if sold now.
+
+    python -m nfl_edge.kalshi benchmarks/fixtures/sunday_early.scoreboard.json
+
+Point NFL_KALSHI_API at benchmarks/kalshi_stub.py to run against a local stub.
+"""
+import argparse
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from nfl_edge.cache import get_cache
+from nfl_edge.httpclient import HttpClient
+from nfl_edge.models import eastern
+from nfl_edge.replay import virtual_now
+from nfl_edge.teams import kalshi_ticker
+
+ENABLED = os.environ.get("NFL_KALSHI", "1") == "1"
+KALSHI_API = os.environ.get("NFL_KALSHI_API", "https://api.elections.kalshi.com/trade-api/v2")
+BATCH = int(os.environ.get("NFL_KALSHI_BATCH", 10))   # event tickers per /markets call
+RATE = float(os.environ.get("NFL_KALSHI_RATE", 10))   # requests per second
+TTL = int(os.environ.get("NFL_KALSHI_TTL", 5))
+TIMEOUT = 3
+
+Quote = namedtuple("Quote", ["ticker", "yes_bid", "yes_ask", "last_price", "status"])
+Edge = namedtuple("Edge", ["model", "price", "edge"])
+
+QUOTES_CACHE = get_cache("kalshi", ttl=TTL)
+
+
+class RateLimiter:
+    """Token bucket: `rate` tokens per second, bursts of up to `rate`"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_for = (1 - self.tokens) / self.rate
+            time.sleep(wait_for)
+
+
+_limiter = RateLimiter(RATE)
+# batch fetches get their own pool: a refresh blocks on its batches, so sharing
+# one pool would let waiting refreshes take every worker and starve them
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kalshi")
+_batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kalshi-batch")
+_pending = None  # future of the cold load in flight, shared by every caller
+_pending_lock = threading.Lock()
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_kalshi_client():
+    """Pooled client for the Kalshi API, separate from the ESPN one"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(pool_size=4)
+        return _client
+
+
+def _cents(market, key):
+    value = market.get(key)
+    if value is None:
+        dollars = market.get(f"{key}_dollars")
+        return round(float(dollars) * 100) if dollars not in (None, "") else None
+    return int(value) or None
+
+
+def parse_markets(data):
+    """{market ticker: Quote}; prices in cents, None when the book is empty"""
+    return {m["ticker"]: Quote(m["ticker"], _cents(m, "yes_bid"), _cents(m, "yes_ask"), _cents(m, "last_price"),
+                               m.get("status", ""))
+            for m in data.get("markets") or () if m.get("ticker")}
+
+
+def _fetch_batch(event_tickers):
+    _limiter.acquire()
+    url = f"{KALSHI_API}/markets?event_ticker={','.join(event_tickers)}&limit=200"
+    return get_kalshi_client().get_parsed(url, parse_markets, timeout=TIMEOUT)
+
+
+def fetch_quotes(event_tickers):
+    """{market ticker: Quote} for every market in these events, BATCH events per request"""
+    event_tickers = list(event_tickers)
+    batches = [event_tickers[i:i + BATCH] for i in range(0, len(event_tickers), BATCH)]
+    quotes = {}
+    for future in [_batch_executor.submit(_fetch_batch, b) for b in batches]:
+        quotes.update(future.result())
+    return quotes
+
+
+def get_quotes(event_tickers, deadline=1.0):
+    """Cached {market ticker: Quote} for a slate; {} until the first load lands"""
+    tickers = tuple(sorted(set(event_tickers)))
+    if not ENABLED or not tickers:
+        return {}
+
+    def loader():
+        return tickers, fetch_quotes(tickers)
+
+    snap = QUOTES_CACHE.peek()
+    if snap is not None and snap.value[0] == tickers:
+        try:
+            return QUOTES_CACHE.get_snapshot(loader).value[1]
+        except Exception:
+            return snap.value[1]
+    # first load, or the slate changed: wait up to `deadline`, then let it land in the background
+    future = _cold_load(loader)
+    wait([future], timeout=deadline)
+    if future.done() and future.exception() is None:
+        loaded, quotes = future.result()
+        if loaded == tickers:
+            return quotes
+    return {}
+
+
+def quotes_version():
+    """Version of the cached quotes; changes whenever a load lands"""
+    snap = QUOTES_CACHE.peek()
+    return snap.version if snap is not None else 0
+
+
+def _cold_load(loader):
+    """One background load at a time; callers arriving while it runs wait on the same future"""
+    global _pending
+    with _pending_lock:
+        if _pending is None or _pending.done():
+            _pending = _executor.submit(QUOTES_CACHE.refresh, loader)
+        return _pending
+
+
+def market_url(event_ticker):
+    return f"https://kalshi.com/markets/KXNFLGAME/{event_ticker}"
+
+
+def game_url(g, game_key):
+    """Kalshi page for a game's ML event; a game off the board (g None) is taken to be today's"""
+    if g is not None:
+        return market_url(g.ticker)
+    away_team, home_team = game_key.split("@")
+    return market_url(kalshi_ticker(away_team, home_team, virtual_now(eastern)))
+
+
+def market_ticker(g, team):
+    """Ticker of `team`'s yes market within the game's event"""
+    return f"{g.ticker}-{g.home_code if team == g.home_team else g.away_code}"
+
+
+def team_quote(quotes, g, team):
+    return quotes.get(market_ticker(g, team))
+
+
+def pick_edge(score, quote):
+    """Edge of an ML pick against the ask for it, or None without a quote"""
+    if quote is None or quote.yes_ask is None:
+        return None
+    model, price = score / 10, quote.yes_ask / 100
+    return Edge(model, price, model - price)
+
+
+def mark_price(quote):
+    """Cents a yes contract would fetch now: the bid, else the last trade"""
+    if quote is None:
+        return None
+    return quote.yes_bid if quote.yes_bid is not None else quote.last_price
+
+
+def game_marks(g, quotes):
+    """{team: cents its yes contract would sell for now}, from the game's quotes"""
+    if g is None:
+        return {}
+    return {team: mark_price(team_quote(quotes, g, team)) for team in (g.away_team, g.home_team)}
+
+
+def main():
+    from nfl_edge.espn import parse_scoreboard
+    from nfl_edge.httpclient import json_loads
+
+    parser = argparse.ArgumentParser(description="Fetch Kalshi quotes for a scoreboard's games")
+    parser.add_argument("scoreboard", help="ESPN scoreboard JSON file")
+    args = parser.parse_args()
+    with open(args.scoreboard, "rb") as f:
+        games = parse_scoreboard(json_loads(f.read()))
+    start = time.perf_counter()
+    quotes = fetch_quotes(g.ticker for g in games.values())
+    elapsed = time.perf_counter() - start
+    for g in games.values():
+        for team in (g.away_team, g.home_team):
+            q = team_quote(quotes, g, team)
+            print(f"{market_ticker(g, team):<36}", f"bid {q.yes_bid} ask {q.yes_ask} last {q.last_price}" if q else "—")
+    print(f"{len(games)} games, {len(quotes)} markets in {elapsed * 1000:.0f}ms "
+          f"({-(-len(games) // BATCH)} requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Per-rerun span timing with rolling percentiles and Prometheus text export.
+
+Off unless NFL_METRICS=1. When off, span() hands back one shared no-op
+context manager and rerun_timer() a no-op timer, so instrumented code pays
+only a function call.
+
+When on, each span keeps its last WINDOW durations for p50/p95/p99 plus a
+running count and sum. prometheus_text() renders them (with the feed cache
+counters) as a Prometheus summary. The text is written atomically to
+NFL_METRICS_PATH, for node_exporter's textfile collector, and can also be
+served at http://<host>:NFL_METRICS_PORT/metrics.
+"""
+import contextlib
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nfl_edge.cache import all_stats
+
+ENABLED = os.environ.get("NFL_METRICS") == "1"
+METRICS_PATH = os.environ.get("NFL_METRICS_PATH")
+METRICS_PORT = int(os.environ.get("NFL_METRICS_PORT", 0))
+WINDOW = int(os.environ.get("NFL_METRICS_WINDOW", 1000))
+WRITE_EVERY = 15
+QUANTILES = (0.5, 0.95, 0.99)
+
+_NOOP = contextlib.nullcontext()
+
+
+class Histogram:
+    """Rolling window of durations plus lifetime count and sum"""
+    __slots__ = ("samples", "count", "total")
+
+    def __init__(self):
+        self.samples = deque(maxlen=WINDOW)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def quantiles(self):
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {q: 0.0 for q in QUANTILES}
+        return {q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in QUANTILES}
+
+
+_histograms = {}
+_lock = threading.Lock()
+
+
+def observe(name, seconds):
+    if not ENABLED:
+        return
+    with _lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = Histogram()
+        h.observe(seconds)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def span(name):
+    """Context manager timing one block under `name`"""
+    return _Span(name) if ENABLED else _NOOP
+
+
+class RerunTimer:
+    """Sequential phases of one script run: phase() closes the previous one"""
+
+    def __init__(self):
+        self.start = self.mark = time.perf_counter()
+        self.current = None
+
+    def phase(self, name):
+        now = time.perf_counter()
+        if self.current:
+            observe(self.current, now - self.mark)
+        self.current, self.mark = name, now
+
+    def finish(self):
+        self.phase(None)
+        observe("rerun", self.mark - self.start)
+        _maybe_write(time.time())
+
+
+class _NoopTimer:
+    def phase(self, name):
+        pass
+
+    def finish(self):
+        pass
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+def rerun_timer():
+    if not ENABLED:
+        return _NOOP_TIMER
+    _ensure_server()
+    return RerunTimer()
+
+
+def snapshot():
+    """[{span, count, p50_ms, p95_ms, p99_ms}] sorted by span name"""
+    with _lock:
+        items = [(name, h.count, h.quantiles()) for name, h in sorted(_histograms.items())]
+    return [{"span": name, "count": count, **{f"p{int(q * 100)}_ms": round(v * 1000, 2) for q, v in qs.items()}}
+            for name, count, qs in items]
+
+
+def prometheus_text():
+    lines = [
+        "# HELP nfl_edge_span_seconds Duration of app phases over the last reruns",
+        "# TYPE nfl_edge_span_seconds summary",
+    ]
+    with _lock:
+        items = [(name, h.quantiles(), h.total, h.count) for name, h in sorted(_histograms.items())]
+    for name, qs, total, count in items:
+        for q, v in qs.items():
+            lines.append(f'nfl_edge_span_seconds{{span="{name}",quantile="{q}"}} {v:.6f}')
+        lines.append(f'nfl_edge_span_seconds_sum{{span="{name}"}} {total:.6f}')
+        lines.append(f'nfl_edge_span_seconds_count{{span="{name}"}} {count}')
+
+    caches = all_stats()
+    for key, kind, help_text in (("hits", "counter", "Fresh cache hits"),
+                                 ("stale_hits", "counter", "Stale cache hits served while refreshing"),
+                                 ("misses", "counter", "Cache misses"),
+                                 ("errors", "counter", "Failed loads")):
+        lines.append(f"# HELP nfl_edge_cache_{key}_total {help_text}")
+        lines.append(f"# TYPE nfl_edge_cache_{key}_total {kind}")
+        for c in caches:
+            lines.append(f'nfl_edge_cache_{key}_total{{cache="{c["name"]}"}} {c[key]}')
+    return "\n".join(lines) + "\n"
+
+
+_written_at = 0
+
+
+def _maybe_write(now):
+    global _written_at
+    if not METRICS_PATH or now - _written_at < WRITE_EVERY:
+        return
+    _written_at = now
+    tmp = METRICS_PATH + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            f.write(prometheus_text())
+        os.replace(tmp, METRICS_PATH)
+    except OSError:
+        pass
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def _ensure_server():
+    global _server
+    if not METRICS_PORT or _server is not None:
+        return
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer(("0.0.0.0", METRICS_PORT), _MetricsHandler)
+            except OSError:
+                _server = False  # port taken (another worker serves it); don't retry every rerun
+                return
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
@@ -0,0 +1,92 @@
+"""Typed records built once per scoreboard snapshot.
+
+A Game holds what ESPN reported followed by the values every consumer derives
+from it (team codes, seconds left, phase, kickoff label, Kalshi ticker).
+enrich() computes those once at ingest, for a fresh parse and for a game read
+back from disk alike, so renderers and scorers only read fields.
+"""
+from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from nfl_edge.teams import eastern, kalshi_ticker, team_code
+
+# Game.phase: SCHEDULED until the first period starts, LIVE until ESPN says final
+SCHEDULED, LIVE, FINAL = "scheduled", "live", "final"
+
+
+class Game(NamedTuple):
+    """One scoreboard game, immutable and slot-sized (no per-instance __dict__)"""
+    event_id: str
+    game_key: str
+    away_team: str
+    home_team: str
+    away_id: str
+    home_id: str
+    away_score: int
+    home_score: int
+    total: int
+    period: int
+    clock: str
+    status_type: str
+    game_date: datetime
+    down: Optional[int]
+    distance: Optional[int]
+    yard_line: Optional[int]
+    yards_to_endzone: Optional[int]
+    ball_yard: int
+    possession_team: Optional[str]
+    is_red_zone: bool
+    poss_text: str
+    # derived by enrich()
+    away_code: str
+    home_code: str
+    seconds_remaining: Optional[int]  # left in the current period, None if clock unreadable
+    phase: str                        # SCHEDULED / LIVE / FINAL
+    kickoff_label: str                # "Sun Sep 07 • 01:00 PM ET"
+    ticker: str                       # Kalshi event ticker
+
+
+REPORTED_FIELDS = Game._fields[:Game._fields.index("away_code")]
+
+
+@lru_cache(maxsize=1024)
+def clock_seconds(clock_str):
+    """'12:34' -> 754, None when unreadable"""
+    try:
+        parts = clock_str.split(":")
+        return int(parts[0]) * 60 + (int(parts[1]) if len(parts) > 1 else 0)
+    except (AttributeError, ValueError):
+        return None
+
+
+def game_phase(status_type, period):
+    if status_type == "STATUS_FINAL":
+        return FINAL
+    return LIVE if period > 0 else SCHEDULED
+
+
+@lru_cache(maxsize=256)
+def kickoff_label(game_date):
+    return game_date.astimezone(eastern).strftime("%a %b %d • %I:%M %p ET") if game_date else ""
+
+
+def enrich(away_team, home_team, period, clock, status_type, game_date):
+    """The derived tail of a Game, in field order"""
+    return (team_code(away_team), team_code(home_team), clock_seconds(clock), game_phase(status_type, period),
+            kickoff_label(game_date), kalshi_ticker(away_team, home_team, game_date))
+
+
+def game_to_dict(g):
+    """JSON-safe dict of a Game (kickoff as an ISO string)"""
+    d = g._asdict()
+    d["game_date"] = g.game_date.isoformat() if g.game_date else None
+    return d
+
+
+def game_from_dict(d):
+    """Inverse of game_to_dict; the derived fields are recomputed rather than read back"""
+    date = d.get("game_date")
+    game_date = datetime.fromisoformat(date) if date else None
+    reported = [game_date if k == "game_date" else d[k] for k in REPORTED_FIELDS]
+    return Game(*reported, *enrich(d["away_team"], d["home_team"], d["period"], d["clock"], d["status_type"], game_date))
@@ -0,0 +1,126 @@
+"""Background poller that keeps a FeedCache warm on a slate-aware schedule.
+
+The page never waits on ESPN while the poller is alive: every published
+snapshot stays fresh until the poller's next scheduled poll, so sessions only
+ever read it. Failed polls retry with exponential backoff (ERROR_INTERVAL
+doubling up to ERROR_MAX) while sessions keep reading the last good snapshot.
+"""
+import os
+import threading
+import time
+from datetime import timezone
+
+from nfl_edge.httpclient import backoff
+from nfl_edge.models import FINAL, LIVE
+from nfl_edge.replay import TIME_SCALE, virtual_now
+
+LIVE_INTERVAL = int(os.environ.get("NFL_POLL_LIVE", 10))
+SCHEDULED_INTERVAL = int(os.environ.get("NFL_POLL_SCHEDULED", 300))
+IDLE_INTERVAL = int(os.environ.get("NFL_POLL_IDLE", 3600))
+ERROR_INTERVAL = 5     # first retry after a failed poll; doubles per failure in a row
+ERROR_MAX = 300
+KICKOFF_LEAD = 120
+GRACE = 5
+
+
+def next_poll_delay(games, now=None):
+    """Return (seconds until next poll, mode) for a scoreboard snapshot.
+
+    live      - any game started and not final: poll every few seconds
+    scheduled - only upcoming games: poll slowly, waking just before kickoff
+    idle      - week over (all final / empty): sleep until the board rolls over
+    """
+    now = now or virtual_now(timezone.utc)
+    next_kickoff = None
+    for g in games.values():
+        if g.phase == FINAL:
+            continue
+        if g.phase == LIVE:
+            return LIVE_INTERVAL, "live"
+        if g.status_type == "STATUS_SCHEDULED":
+            kickoff = g.game_date
+            if next_kickoff is None or kickoff < next_kickoff:
+                next_kickoff = kickoff
+    if next_kickoff is None:
+        return IDLE_INTERVAL, "idle"
+    until_kickoff = (next_kickoff - now).total_seconds() - KICKOFF_LEAD
+    if until_kickoff <= LIVE_INTERVAL:
+        return LIVE_INTERVAL, "pregame"
+    return min(until_kickoff, SCHEDULED_INTERVAL), "scheduled"
+
+
+class Poller:
+    """Daemon thread refreshing `cache` via `loader` on `schedule(value)`"""
+
+    def __init__(self, name, cache, loader, schedule=next_poll_delay):
+        self.name = name
+        self.cache = cache
+        self.loader = loader
+        self.schedule = schedule
+        self.polls = 0
+        self.failures = 0
+        self.failures_in_row = 0
+        self.mode = "starting"
+        self.delay = 0
+        self.next_poll_at = time.time()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name=f"poller-{self.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def wake(self):
+        """Poll now instead of waiting out the current delay"""
+        self._wake.set()
+
+    def _ttl(self, value):
+        delay, self.mode = self.schedule(value)
+        self.delay = delay / TIME_SCALE
+        return self.delay + GRACE
+
+    def _loop(self):
+        snap = self.cache.peek()
+        if snap is not None and snap.expires_at - GRACE > time.time():
+            # seeded from disk and still current (e.g. a finished slate): don't refetch yet
+            self.delay, self.mode = snap.expires_at - GRACE - time.time(), "restored"
+            self.next_poll_at = time.time() + self.delay
+            self._wake.wait(self.delay)
+            self._wake.clear()
+        while True:
+            try:
+                self.cache.refresh(self.loader, ttl=self._ttl)
+                self.polls += 1
+                self.failures_in_row = 0
+            except Exception:
+                self.failures += 1
+                self.failures_in_row += 1
+                self.delay, self.mode = backoff(self.failures_in_row, ERROR_INTERVAL, ERROR_MAX), "error"
+            self.next_poll_at = time.time() + self.delay
+            self._wake.wait(self.delay)
+            self._wake.clear()
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "mode": self.mode,
+            "polls": self.polls,
+            "failures": self.failures,
+            "next_in": max(0, round(self.next_poll_at - time.time())),
+            "alive": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+_pollers = {}
+_pollers_lock = threading.Lock()
+
+
+def ensure_poller(name, cache, loader, schedule=next_poll_delay):
+    """Start the process-wide poller for `name` if it isn't running yet"""
+    with _pollers_lock:
+        poller = _pollers.get(name)
+        if poller is None:
+            poller = _pollers[name] = Poller(name, cache, loader, schedule)
+        return poller.start()
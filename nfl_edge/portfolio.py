@@ -0,0 +1,212 @@
+"""Position book indexed by game, with running per-side totals.
+
+Positions are grouped by game_key and each group keeps per-pick totals
+(positions, contracts, cost, payout), adjusted on every add/edit/delete. A
+score change therefore re-values a game from at most two side totals instead
+of walking its positions, and team/day exposure and mark-to-market roll up
+from the groups. The page renders one card per game and builds per-position
+rows (and their edit widgets) only for the game being managed.
+"""
+from collections import namedtuple
+
+from nfl_edge.models import FINAL, LIVE, SCHEDULED
+
+GameValue = namedtuple("GameValue", ["status_label", "status_color", "game_status", "pnl", "pnl_text", "pnl_color"])
+Exposure = namedtuple("Exposure", ["positions", "contracts", "cost", "payout", "realized", "open_cost"])
+
+NO_GAME = GameValue("❔ OFF BOARD", "#888", "NO DATA", 0.0, "—", "#888")
+
+
+def position_cost(price, contracts):
+    return round(price * contracts / 100, 2)
+
+
+def position_payout(price, contracts):
+    return round((100 - price) * contracts / 100, 2)
+
+
+def lead_status(g, lead):
+    """(label, color) for a pick leading by `lead`; same thresholds as the position cards"""
+    if g.phase == FINAL:
+        return ("✅ WON!", "#00ff00") if lead > 0 else ("❌ LOST", "#ff0000")
+    if g.phase == SCHEDULED:
+        return "⏳ SCHEDULED", "#888"
+    if lead >= 14:
+        return "🟢 CRUISING", "#00ff00"
+    if lead >= 7:
+        return "🟢 LEADING", "#00ff00"
+    if lead >= 1:
+        return "🟡 AHEAD", "#ffff00"
+    if lead >= -7:
+        return "🟠 CLOSE", "#ff8800"
+    return "🔴 BEHIND", "#ff0000"
+
+
+def game_status(g):
+    return "FINAL" if g.phase == FINAL else f"Q{g.period} {g.clock}" if g.phase == LIVE else "SCHEDULED"
+
+
+def pick_lead(g, pick):
+    lead = g.home_score - g.away_score
+    return lead if pick == g.home_team else -lead
+
+
+class GameBook:
+    """Positions on one game plus running totals per pick"""
+    __slots__ = ("game_key", "positions", "sides")
+
+    def __init__(self, game_key):
+        self.game_key = game_key
+        self.positions = {}  # id -> position, in insertion order
+        self.sides = {}      # pick -> [positions, contracts, cost, payout]
+
+    def _apply(self, pos, sign):
+        side = self.sides.get(pos.get("pick"))
+        if side is None:
+            side = self.sides[pos.get("pick")] = [0, 0, 0.0, 0.0]
+        price, contracts = pos.get("price", 50), pos.get("contracts", 1)
+        side[0] += sign
+        side[1] += sign * contracts
+        side[2] += sign * position_cost(price, contracts)
+        side[3] += sign * position_payout(price, contracts)
+        if side[0] == 0:
+            del self.sides[pos.get("pick")]
+
+    def value(self, g):
+        """GameValue for these positions at the game's current score"""
+        if g is None:
+            return NO_GAME
+        if g.phase == SCHEDULED:
+            payout = sum(s[3] for s in self.sides.values())
+            return GameValue("⏳ SCHEDULED", "#888", game_status(g), 0.0, f"Win: +${payout:.2f}", "#888")
+        # P&L if the game ended at the current score: leading picks pay out, the rest lose their cost
+        pnl = 0.0
+        for pick, (_, _, cost, payout) in self.sides.items():
+            pnl += payout if pick_lead(g, pick) > 0 else -cost
+        if len(self.sides) == 1:
+            label, color = lead_status(g, pick_lead(g, next(iter(self.sides))))
+        elif g.phase == FINAL:
+            label, color = ("✅ NET WIN", "#00ff00") if pnl >= 0 else ("❌ NET LOSS", "#ff0000")
+        else:
+            label, color = "⚖️ HEDGED", "#ffaa44"
+        pnl_color = "#00ff00" if pnl >= 0 else "#ff0000"
+        if g.phase == FINAL:
+            text = f"+${pnl:.2f}" if pnl >= 0 else f"-${-pnl:.2f}"
+        else:
+            text = f"If final now: {'+' if pnl >= 0 else '-'}${abs(pnl):.2f}"
+            pnl_color = "#888" if len(self.sides) == 1 else pnl_color
+        return GameValue(label, color, game_status(g), pnl, text, pnl_color)
+
+    def mark_to_market(self, marks):
+        """Unrealized P&L with each pick marked at marks[pick] (cents); None if no side has a mark"""
+        pnl, marked = 0.0, False
+        for pick, (_, contracts, cost, _) in self.sides.items():
+            mark = marks.get(pick)
+            if mark is not None:
+                pnl += contracts * mark / 100 - cost
+                marked = True
+        return round(pnl, 2) if marked else None
+
+    def __len__(self):
+        return len(self.positions)
+
+
+class Portfolio:
+    """One user's positions, indexed by id and by game; `version` bumps on every change"""
+
+    def __init__(self, positions=()):
+        self.by_id = {}
+        self.by_game = {}
+        self.version = 0
+        for pos in positions:
+            self.add(pos)
+
+    def add(self, pos):
+        book = self.by_game.get(pos["game"])
+        if book is None:
+            book = self.by_game[pos["game"]] = GameBook(pos["game"])
+        book.positions[pos["id"]] = pos
+        book._apply(pos, 1)
+        self.by_id[pos["id"]] = pos
+        self.version += 1
+        return pos
+
+    def remove(self, pos_id):
+        pos = self.by_id.pop(pos_id, None)
+        if pos is None:
+            return None
+        book = self.by_game[pos["game"]]
+        del book.positions[pos_id]
+        book._apply(pos, -1)
+        if not book.positions:
+            del self.by_game[pos["game"]]
+        self.version += 1
+        return pos
+
+    def update(self, pos_id, **fields):
+        pos = self.by_id[pos_id]
+        book = self.by_game[pos["game"]]
+        book._apply(pos, -1)
+        pos.update(fields)
+        pos["cost"] = position_cost(pos["price"], pos["contracts"])
+        book._apply(pos, 1)
+        self.version += 1
+        return pos
+
+    def clear(self):
+        self.by_id.clear()
+        self.by_game.clear()
+        self.version += 1
+
+    def books(self, games):
+        """Game books ordered live first, then upcoming, then final/off-board"""
+        def order(book):
+            g = games.get(book.game_key)
+            if g is None:
+                return (3, "")
+            if g.phase == FINAL:
+                return (2, book.game_key)
+            return (0 if g.phase == LIVE else 1, book.game_key)
+        return sorted(self.by_game.values(), key=order)
+
+    def exposure(self, games):
+        """Exposure over the whole book: realized P&L from finals, cost still at risk elsewhere"""
+        positions = contracts = 0
+        cost = payout = realized = open_cost = 0.0
+        for key, book in self.by_game.items():
+            g = games.get(key)
+            for pick, (n, c, side_cost, side_payout) in book.sides.items():
+                positions += n
+                contracts += c
+                cost += side_cost
+                payout += side_payout
+                if g is not None and g.phase == FINAL:
+                    realized += side_payout if pick_lead(g, pick) > 0 else -side_cost
+                else:
+                    open_cost += side_cost
+        return Exposure(positions, contracts, round(cost, 2), round(payout, 2), round(realized, 2), round(open_cost, 2))
+
+    def by_team(self):
+        """{team: cost} of money riding on each team"""
+        teams = {}
+        for book in self.by_game.values():
+            for pick, side in book.sides.items():
+                teams[pick] = teams.get(pick, 0.0) + side[2]
+        return teams
+
+    def by_day(self, games, tz=None):
+        """{kickoff date in `tz`: cost}; games no longer on the board are left out"""
+        days = {}
+        for key, book in self.by_game.items():
+            g = games.get(key)
+            if g is None or g.game_date is None:
+                continue
+            day = (g.game_date.astimezone(tz) if tz else g.game_date).date()
+            days[day] = days.get(day, 0.0) + sum(s[2] for s in book.sides.values())
+        return days
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
@@ -0,0 +1,146 @@
+"""Per-user position store on SQLite in WAL mode.
+
+Every add/edit/delete is a single-row statement in its own transaction, so
+saves cost the same with 10 or 10,000 positions, concurrent sessions never
+clobber each other, and a crash can't leave a half-written file. Statements
+borrow one of NFL_POSITIONS_POOL shared connections, since Streamlit runs each
+rerun on a new thread.
+"""
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DB_PATH = os.environ.get("NFL_POSITIONS_DB", "nfl_positions.db")
+POOL_SIZE = int(os.environ.get("NFL_POSITIONS_POOL", 4))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    game TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT 'ml',
+    pick TEXT,
+    price INTEGER NOT NULL,
+    contracts INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    added_at TEXT,
+    event_id TEXT,
+    kickoff TEXT
+);
+CREATE INDEX IF NOT EXISTS positions_user ON positions (user_id, id);
+"""
+
+FIELDS = ("game", "type", "pick", "price", "contracts", "cost", "added_at", "event_id", "kickoff")
+# columns added after the table first shipped; older databases get them on open
+ADDED_COLUMNS = {"event_id": "TEXT", "kickoff": "TEXT"}
+EDITABLE = ("pick", "price", "contracts")
+
+
+class PositionStore:
+    def __init__(self, path=DB_PATH, pool_size=POOL_SIZE):
+        self.path = path
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue()
+        self._opened = 0
+        self._pool_lock = threading.Lock()
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+
+    @staticmethod
+    def _migrate(conn):
+        # BEGIN IMMEDIATE takes the write lock before reading the columns, so two
+        # processes opening an old database can't both try to add the same one
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            have = {row["name"] for row in conn.execute("PRAGMA table_info(positions)")}
+            for column, kind in ADDED_COLUMNS.items():
+                if column not in have:
+                    conn.execute(f"ALTER TABLE positions ADD COLUMN {column} {kind}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection for one statement.
+
+        Streamlit runs every rerun on a fresh thread, so connections can't be
+        per-thread; up to `pool_size` are opened and shared, one user at a time.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._opened < self.pool_size
+                self._opened += create
+            conn = self._open() if create else self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def list(self, user_id):
+        with self._conn() as conn:
+            rows = conn.execute(
+                f"SELECT id, {', '.join(FIELDS)} FROM positions "
+                "WHERE user_id = ? ORDER BY id", (user_id,))
+            return [dict(row) for row in rows]
+
+    def add(self, user_id, position):
+        """Insert and return the stored position (with its new `id`)"""
+        pos = {f: position.get(f) for f in FIELDS}
+        pos["type"] = pos["type"] or "ml"
+        if pos["cost"] is None:
+            pos["cost"] = round(pos["price"] * pos["contracts"] / 100, 2)
+        with self._conn() as conn:
+            cur = conn.execute(
+                f"INSERT INTO positions (user_id, {', '.join(FIELDS)}) VALUES (?{', ?' * len(FIELDS)})",
+                (user_id, *(pos[f] for f in FIELDS)))
+            pos["id"] = cur.lastrowid
+        return pos
+
+    def update(self, user_id, pos_id, **fields):
+        """Update editable fields of one position; cost follows price/contracts"""
+        fields = {k: v for k, v in fields.items() if k in EDITABLE}
+        if not fields:
+            return
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        # SET expressions see the old row, so feed the new price/contracts into cost explicitly
+        with self._conn() as conn:
+            conn.execute(
+                f"UPDATE positions SET {assignments}, "
+                "cost = ROUND(COALESCE(?, price) * COALESCE(?, contracts) / 100.0, 2) "
+                "WHERE id = ? AND user_id = ?",
+                (*fields.values(), fields.get("price"), fields.get("contracts"), pos_id, user_id))
+
+    def delete(self, user_id, pos_id):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM positions WHERE id = ? AND user_id = ?", (pos_id, user_id))
+
+    def clear(self, user_id):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM positions WHERE user_id = ?", (user_id,))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide PositionStore"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PositionStore()
+        return _store
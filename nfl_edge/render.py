@@ -0,0 +1,337 @@
+"""HTML for every card on the page, memoized on its inputs where games repeat.
+
+Between scoreboard updates most games don't move, so the field, signal-feed,
+game-card and score-tile HTML is cached in bounded LRUs keyed on exactly the
+values each displays. The parts of the markup that never change (page CSS,
+yard lines, yard labels) are built once at import. Position and game-book
+cards depend on the user's book and marks, so they are built per call.
+Sections the live tick redraws (LiveState, ALL GAMES) are joined into one
+element each, with render_trade_link() standing in for link buttons.
+render_stats() reports hit rates for the sidebar.
+
+app.py only lays these out with Streamlit widgets; nothing here imports
+streamlit, so the module is loaded once per process rather than per rerun.
+"""
+import os
+from functools import lru_cache
+
+from nfl_edge.models import FINAL, SCHEDULED
+from nfl_edge.portfolio import game_status, lead_status, pick_lead, position_cost, position_payout
+
+RENDER_CACHE_SIZE = int(os.environ.get("NFL_RENDER_CACHE", 512))
+
+# ========== STATIC FRAGMENTS ==========
+PAGE_CSS = """
+<style>
+.stLinkButton > a {
+    background-color: #00aa00 !important;
+    border-color: #00aa00 !important;
+    color: white !important;
+}
+.stLinkButton > a:hover {
+    background-color: #00cc00 !important;
+    border-color: #00cc00 !important;
+}
+a.trade-link {
+    display: block;
+    padding: 0.4rem 0.75rem;
+    margin-bottom: 1rem;
+    border-radius: 0.5rem;
+    background-color: #00aa00;
+    color: white !important;
+    text-align: center;
+    text-decoration: none;
+}
+a.trade-link:hover {
+    background-color: #00cc00;
+}
+</style>
+"""
+
+YARD_LINES = "\n".join(
+    f'            <div style="position:absolute;left:{x}%;top:0;bottom:0;width:{2 if x == 50 else 1}px;'
+    f'background:rgba(255,255,255,{0.6 if x == 50 else 0.3})"></div>'
+    for x in range(10, 100, 10)
+)
+
+YARD_LABELS = "\n".join(f"            <span>{n}</span>" for n in (10, 20, 30, 40, 50, 40, 30, 20, 10))
+
+BETWEEN_PLAYS = """
+        <div style="background:#1a1a1a;padding:15px;border-radius:10px;margin:10px 0;text-align:center">
+            <span style="color:#ffaa00;font-size:1.1em">🏈 Between Plays</span>
+        </div>
+        """
+
+
+# ========== FOOTBALL FIELD VISUALIZATION ==========
+def render_football_field(g):
+    """Render football field with ball position - uses only yard line data"""
+    if not g.possession_team or not g.poss_text:
+        return BETWEEN_PLAYS
+    poss_code = g.home_code if g.possession_team == g.home_team else g.away_code
+    return _football_field(g.ball_yard, g.down, g.distance, poss_code, g.away_code, g.home_code, g.poss_text)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _football_field(ball_yard, down, distance, poss_code, away_code, home_code, poss_text):
+    ball_yard = max(0, min(100, ball_yard))
+    ball_pct = 10 + (ball_yard / 100) * 80
+
+    if down and distance:
+        situation = f"{down} & {distance}"
+    else:
+        situation = "—"
+
+    ball_loc = poss_text if poss_text else ""
+
+    return f"""
+    <div style="background:#1a1a1a;padding:15px;border-radius:10px;margin:10px 0">
+        <div style="display:flex;justify-content:space-between;margin-bottom:8px">
+            <span style="color:#ffaa00;font-weight:bold">🏈 {poss_code}</span>
+            <span style="color:#aaa">{ball_loc}</span>
+            <span style="color:#fff;font-weight:bold">{situation}</span>
+        </div>
+        <div style="position:relative;height:60px;background:linear-gradient(90deg,#8B0000 0%,#8B0000 10%,#228B22 10%,#228B22 90%,#00008B 90%,#00008B 100%);border-radius:8px;overflow:hidden">
+{YARD_LINES}
+            <div style="position:absolute;left:{ball_pct}%;top:50%;transform:translate(-50%,-50%);font-size:24px;text-shadow:0 0 10px #fff">🏈</div>
+            <div style="position:absolute;left:5%;top:50%;transform:translate(-50%,-50%);color:#fff;font-weight:bold;font-size:12px">{away_code}</div>
+            <div style="position:absolute;left:95%;top:50%;transform:translate(-50%,-50%);color:#fff;font-weight:bold;font-size:12px">{home_code}</div>
+        </div>
+        <div style="display:flex;justify-content:space-between;margin-top:5px;color:#888;font-size:11px">
+            <span>← {away_code}</span>
+{YARD_LABELS}
+            <span>{home_code} →</span>
+        </div>
+    </div>
+    """
+
+
+# ========== SIGNAL FEED DISPLAY ==========
+def render_signal_feed(signals, drought, momentum):
+    """Render the SaaS-safe signal feed - NO play text, NO player names.
+
+    `signals` is a signals.Signals, `drought` is (status, color, time) and
+    `momentum` is (status, color). The drought clock ticks every second, so it
+    is spliced in after the lookup rather than being part of the cache key.
+    """
+    drought_status, drought_color, drought_time = drought
+    head, tail = _signal_feed(signals.field, signals.down, signals.clock, (drought_status, drought_color),
+                              momentum, signals.blowout)
+    return head + drought_time + tail
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _signal_feed(field, down, clock, drought, momentum, blowout):
+    head = f"""
+    <div style="background:#0d1117;padding:15px;border-radius:10px;margin:10px 0;border:1px solid #30363d">
+        <div style="color:#58a6ff;font-weight:bold;margin-bottom:12px;font-size:1.1em">📡 LIVE SIGNAL FEED</div>
+        
+        <div style="display:grid;grid-template-columns:1fr 1fr;gap:10px">
+            <div style="background:#161b22;padding:10px;border-radius:8px">
+                <div style="color:#888;font-size:0.8em">Field Position</div>
+                <div style="color:{field[1]};font-weight:bold;font-size:1.1em">{field[0]}</div>
+            </div>
+            
+            <div style="background:#161b22;padding:10px;border-radius:8px">
+                <div style="color:#888;font-size:0.8em">Down Stress</div>
+                <div style="color:{down[1]};font-weight:bold;font-size:1.1em">{down[0]}</div>
+            </div>
+            
+            <div style="background:#161b22;padding:10px;border-radius:8px">
+                <div style="color:#888;font-size:0.8em">Clock Pressure</div>
+                <div style="color:{clock[1]};font-weight:bold;font-size:1.1em">{clock[0]}</div>
+            </div>
+            
+            <div style="background:#161b22;padding:10px;border-radius:8px">
+                <div style="color:#888;font-size:0.8em">Scoring Drought</div>
+                <div style="color:{drought[1]};font-weight:bold;font-size:1.1em">{drought[0]}</div>
+                <div style="color:#888;font-size:0.8em">"""
+    tail = f"""</div>
+            </div>
+            
+            <div style="background:#161b22;padding:10px;border-radius:8px">
+                <div style="color:#888;font-size:0.8em">Momentum</div>
+                <div style="color:{momentum[1]};font-weight:bold;font-size:1.1em">{momentum[0]}</div>
+            </div>
+            
+            <div style="background:#161b22;padding:10px;border-radius:8px">
+                <div style="color:#888;font-size:0.8em">Blowout Risk</div>
+                <div style="color:{blowout[1]};font-weight:bold;font-size:1.1em">{blowout[0]}</div>
+            </div>
+        </div>
+    </div>
+    """
+    return head, tail
+
+
+# ========== GAME CARDS ==========
+def render_final_card(g):
+    winner_code = g.home_code if g.home_score > g.away_score else g.away_code
+    return _final_card(g.away_team, g.away_score, g.home_team, g.home_score, winner_code)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _final_card(away_team, away_score, home_team, home_score, winner_code):
+    return f"""
+            <div style="background:linear-gradient(135deg,#1a2e1a,#0a1e0a);padding:18px;border-radius:12px;border:2px solid #44ff44;margin-bottom:15px">
+                <div style="text-align:center">
+                    <b style="color:#fff;font-size:1.4em">{away_team} {away_score} @ {home_team} {home_score}</b>
+                    <span style="color:#44ff44;margin-left:20px;font-size:1.2em">✅ RESOLVED</span>
+                </div>
+                <div style="background:#000;padding:12px;border-radius:8px;margin-top:12px;text-align:center">
+                    <span style="color:#44ff44;font-size:1.2em">FINAL | {winner_code} WIN | Uncertainty resolved</span>
+                </div>
+            </div>
+            """
+
+
+def render_live_card(g, state):
+    """Headline card for a live game; `state` is its signals.LiveState"""
+    return _live_card(g.away_team, g.away_score, g.home_team, g.home_score, g.clock, state)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _live_card(away_team, away_score, home_team, home_score, clock, state):
+    state_label, state_color, expected_leak, q_display, clock_pressure, score_pressure = state
+    return f"""
+            <div style="background:linear-gradient(135deg,#1a1a2e,#0a0a1e);padding:18px;border-radius:12px;border:2px solid {state_color};margin-bottom:15px">
+                <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:12px">
+                    <div style="flex:1"></div>
+                    <div style="text-align:center;flex:2">
+                        <b style="color:#fff;font-size:1.4em">{away_team} {away_score} @ {home_team} {home_score}</b>
+                    </div>
+                    <div style="text-align:right;flex:1">
+                        <b style="color:{state_color};font-size:1.4em">{state_label}</b>
+                        <div style="color:#888;font-size:0.85em">Price Move: {expected_leak}</div>
+                    </div>
+                </div>
+                <div style="background:#000;padding:15px;border-radius:8px;text-align:center">
+                    <span style="color:{state_color};font-size:1.3em;font-weight:bold">{q_display} {clock}</span>
+                </div>
+                <div style="text-align:center;margin-top:12px">
+                    <span style="color:{state_color};font-size:1.1em">{clock_pressure}</span> • 
+                    <span style="color:#ffaa44;font-size:1.1em">{score_pressure}</span>
+                </div>
+            </div>
+            """
+
+
+def render_game_tile(g):
+    """Score tile for ALL GAMES: both teams' scores over a status line, as one element"""
+    return _game_tile(g.away_team, g.away_score, g.home_team, g.home_score, game_status(g), g.total)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _game_tile(away_team, away_score, home_team, home_score, status, total):
+    return (f"<div style='margin-bottom:1rem'><b>{away_team}</b> {away_score}<br><b>{home_team}</b> {home_score}<br>"
+            f"<span style='color:#888;font-size:0.875em'>{status} | {total} pts</span></div>")
+
+
+class HtmlBlock(str):
+    """Markup for st.html, which passes _repr_html_() through as is (a plain str is dedented first)"""
+    __slots__ = ()
+
+    def _repr_html_(self):
+        return str(self)
+
+
+def render_game_grid(games):
+    """ALL GAMES as one element: the score tiles in a four-column grid"""
+    tiles = "".join(render_game_tile(g) for g in games)
+    return HtmlBlock(f"<div style='display:grid;grid-template-columns:repeat(4,1fr);column-gap:1rem'>{tiles}</div>")
+
+
+def render_trade_link(label, url):
+    """A link styled like the page's green link buttons, for sections emitted as one HTML element"""
+    return f'<a class="trade-link" href="{url}" target="_blank">{label}</a>'
+
+
+# ========== ML PICKS ==========
+def render_ml_pick(pick, opponent, score, color, reasons, kickoff, edge):
+    """One ML pick row; `edge` is a kalshi.Edge or None without a quote"""
+    if edge:
+        edge_color = "#44ff44" if edge.edge > 0 else "#ff6666"
+        market_str = (f" • 📈 Kalshi {edge.price * 100:.0f}¢ vs model {edge.model:.0%} "
+                      f"<b style='color:{edge_color}'>edge {edge.edge * 100:+.0f}¢</b>")
+    else:
+        market_str = ""
+    return f"""<div style="background:linear-gradient(135deg,#0f172a,#020617);padding:8px 12px;margin-bottom:2px;border-radius:6px;border-left:3px solid {color}">
+        <b style="color:#fff">{pick}</b> <span style="color:#666">vs {opponent}</span> 
+        <span style="color:#38bdf8">{score}/10</span> 
+        <span style="color:#777;font-size:0.8em">{" • ".join(reasons)}</span>
+        <div style="color:#888;font-size:0.75em;margin-top:4px">📅 {kickoff}{market_str}</div></div>"""
+
+
+# ========== POSITION CARDS ==========
+def signed(amount):
+    return f"{'+' if amount >= 0 else '-'}${abs(amount):,.2f}"
+
+
+def render_position_card(pos, g, marks):
+    """Card for one position; `g` is its game (None when off the board), `marks` {team: cents}"""
+    game_key = pos['game']
+    price = pos.get('price', 50)
+    contracts = pos.get('contracts', 1)
+    cost = position_cost(price, contracts)
+    potential_win = position_payout(price, contracts)
+    pick = pos.get('pick', '')
+
+    if g:
+        lead = pick_lead(g, pick)
+        pick_score, opp_score = (g.home_score, g.away_score) if pick == g.home_team else (g.away_score, g.home_score)
+        is_final = g.phase == FINAL
+        status = game_status(g)
+        if g.phase == SCHEDULED:
+            lead = 0
+        status_label, status_color = lead_status(g, lead)
+        if is_final:
+            won = lead > 0
+            pnl = f"+${potential_win:.2f}" if won else f"-${cost:.2f}"
+            pnl_color = "#00ff00" if won else "#ff0000"
+        elif marks.get(pick) is not None:
+            mtm = contracts * marks[pick] / 100 - cost
+            pnl, pnl_color = f"Win: +${potential_win:.2f} · MTM {signed(mtm)}", "#00ff00" if mtm >= 0 else "#ff0000"
+        else:
+            pnl, pnl_color = f"Win: +${potential_win:.2f}", "#888"
+        score = f"{pick_score}-{opp_score} | Lead: <b style='color:{status_color}'>{lead:+d}</b>"
+    else:
+        status, status_label, status_color = "NO DATA", "❔ OFF BOARD", "#888"
+        pnl, pnl_color, score = f"Win: +${potential_win:.2f}", "#888", "—"
+
+    return f"""<div style='background:linear-gradient(135deg,#1a1a2e,#16213e);padding:15px;border-radius:10px;border:2px solid {status_color};margin-bottom:10px'>
+            <div style='display:flex;justify-content:space-between'>
+            <div><b style='color:#fff;font-size:1.2em'>{game_key.replace('@', ' @ ')}</b> <span style='color:#888'>{status}</span></div>
+            <b style='color:{status_color};font-size:1.3em'>{status_label}</b>
+            </div>
+            <div style='margin-top:10px;color:#aaa'>🎯 Pick: <b style='color:#fff'>{pick}</b> | 💵 {contracts}x @ {price}¢ (${cost:.2f}) | 📊 {score} | <span style='color:{pnl_color}'>{pnl}</span></div></div>"""
+
+
+def render_book_card(book, g, marks):
+    """Aggregate card for a portfolio.GameBook holding several positions"""
+    value = book.value(g)
+    score = f"{g.away_score}-{g.home_score}" if g else "—"
+    mtm = book.mark_to_market(marks)
+    mtm_text = f" | MTM {signed(mtm)}" if mtm is not None else ""
+    sides = " · ".join(f"{pick} {n}× {c} ct (${cost:,.2f})" for pick, (n, c, cost, _) in book.sides.items())
+    return f"""<div style='background:linear-gradient(135deg,#1a1a2e,#16213e);padding:15px;border-radius:10px;border:2px solid {value.status_color};margin-bottom:10px'>
+                <div style='display:flex;justify-content:space-between'>
+                <div><b style='color:#fff;font-size:1.2em'>{book.game_key.replace('@', ' @ ')}</b> <span style='color:#888'>{value.game_status}</span></div>
+                <b style='color:{value.status_color};font-size:1.3em'>{value.status_label}</b>
+                </div>
+                <div style='margin-top:10px;color:#aaa'>📦 {len(book)} positions | 🎯 {sides} | 📊 {score} | <span style='color:{value.pnl_color}'>{value.pnl_text}</span>{mtm_text}</div></div>"""
+
+
+def render_stats():
+    """Hit/miss counts and hit rate per cached widget"""
+    stats = {}
+    for name, fn in (("field", _football_field), ("signal_feed", _signal_feed), ("final_card", _final_card),
+                     ("live_card", _live_card), ("game_tile", _game_tile)):
+        info = fn.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0,
+        }
+    return stats
@@ -0,0 +1,124 @@
+"""Record raw upstream payloads and replay them without the network.
+
+    NFL_RECORD=recordings/sunday.jsonl.gz streamlit run app.py
+    NFL_REPLAY=recordings/sunday.jsonl.gz NFL_REPLAY_SPEED=20 streamlit run app.py
+
+Recordings are gzipped JSONL, one {"t", "url", "body"} line per 200 response,
+with the body kept byte-for-byte as ESPN sent it. In replay mode the shared
+HTTP client serves, for each URL, the latest payload recorded at or before a
+virtual clock that runs at NFL_REPLAY_SPEED times real time. The poller and
+the time-based signals read that same clock, so a replayed Sunday behaves like
+the real one, just faster.
+"""
+import bisect
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from nfl_edge.httpclient import json_loads
+
+RECORD_PATH = os.environ.get("NFL_RECORD")
+REPLAY_PATH = os.environ.get("NFL_REPLAY")
+REPLAY_SPEED = float(os.environ.get("NFL_REPLAY_SPEED", 1))
+
+# wall-clock seconds are this many virtual seconds
+TIME_SCALE = REPLAY_SPEED if REPLAY_PATH else 1.0
+
+
+class Recorder:
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def record(self, url, body, t=None):
+        line = json.dumps({"t": time.time() if t is None else t, "url": url, "body": body.decode("utf-8")})
+        with self._lock:
+            # each append is its own gzip member; gzip readers concatenate them transparently
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.records += 1
+
+
+def read_recording(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayClient:
+    """Drop-in for HttpClient.get_parsed that serves a recording on a virtual clock"""
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self._by_url = {}
+        for rec in sorted(read_recording(path), key=lambda r: r["t"]):
+            times, bodies = self._by_url.setdefault(rec["url"], ([], []))
+            times.append(rec["t"])
+            bodies.append(rec["body"].encode("utf-8"))
+        starts = [times[0] for times, _ in self._by_url.values()]
+        self.start_t = min(starts) if starts else time.time()
+        self.start_wall = time.time()
+        self._parsed = {}  # url -> (record index, parsed)
+        self.requests = 0
+        self.not_modified = 0
+        self.body_bytes = 0
+
+    def virtual_time(self):
+        return self.start_t + (time.time() - self.start_wall) * self.speed
+
+    def get_parsed(self, url, parse, timeout=None):
+        if url not in self._by_url:
+            raise LookupError(f"no recording for {url}")
+        times, bodies = self._by_url[url]
+        i = max(0, bisect.bisect_right(times, self.virtual_time()) - 1)
+        self.requests += 1
+        last = self._parsed.get(url)
+        if last and last[0] == i:
+            self.not_modified += 1
+            return last[1]
+        self.body_bytes += len(bodies[i])
+        parsed = parse(json_loads(bodies[i]))
+        self._parsed[url] = (i, parsed)
+        return parsed
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "not_modified_rate": round(self.not_modified / self.requests, 3) if self.requests else 0.0,
+            "wire_bytes": 0,
+            "body_bytes": self.body_bytes,
+            "failures": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "open_circuits": 0,
+        }
+
+    def circuits(self):
+        return {}
+
+
+_replay_client = None
+_replay_lock = threading.Lock()
+
+
+def get_replay_client():
+    """Return the process-wide ReplayClient for NFL_REPLAY"""
+    global _replay_client
+    with _replay_lock:
+        if _replay_client is None:
+            _replay_client = ReplayClient(REPLAY_PATH, REPLAY_SPEED)
+        return _replay_client
+
+
+def virtual_now(tz):
+    """datetime.now(tz), or the replay clock when replaying"""
+    if REPLAY_PATH:
+        return datetime.fromtimestamp(get_replay_client().virtual_time(), tz)
+    return datetime.now(tz)
@@ -0,0 +1,159 @@
+"""Pre-game ML scoring, batched across a whole slate with NumPy.
+
+score_slate() scores any number of (home, away) matchups in one vectorized
+pass over team-stat arrays and memoizes each result on
+(matchup, stats version, injury index version), so reruns and repeated
+what-if runs only pay for matchups they haven't seen.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from nfl_edge.injuries import NO_INJURIES
+from nfl_edge.teams import TEAM_STATS
+
+MLPick = namedtuple("MLPick", ["pick", "score", "reasons", "home_out", "away_out",
+                               "tier", "color", "home_score", "away_score"])
+
+TIERS = (
+    (8.0, "🟢 STRONG BUY", "#00ff00"),
+    (6.5, "🔵 BUY", "#00aaff"),
+    (5.5, "🟡 LEAN", "#ffff00"),
+)
+TOSS_UP = ("⚪ TOSS-UP", "#888888")
+_TIER_LABELS = [(label, color) for _, label, color in TIERS] + [TOSS_UP]
+_TIER_CUTS = np.array([cut for cut, _, _ in TIERS])
+
+
+def get_signal_tier(score):
+    for cut, label, color in TIERS:
+        if score >= cut:
+            return label, color
+    return TOSS_UP
+
+
+class StatsTable:
+    """TEAM_STATS as aligned arrays; the last row holds the defaults for unknown teams"""
+
+    def __init__(self, team_stats):
+        self.teams = sorted(team_stats)
+        self.index = {team: i for i, team in enumerate(self.teams)}
+        rows = [team_stats[t] for t in self.teams] + [{}]
+        self.dvoa = np.array([r.get('dvoa', 0) for r in rows], dtype=float)
+        self.def_rank = np.array([r.get('def_rank', 16) for r in rows], dtype=np.int64)
+        self.home_win_pct = np.array([r.get('home_win_pct', 0.5) for r in rows], dtype=float)
+        self.version = hashlib.sha1(json.dumps(team_stats, sort_keys=True).encode()).hexdigest()[:12]
+
+    def lookup(self, teams):
+        unknown = len(self.teams)
+        return np.fromiter((self.index.get(t, unknown) for t in teams), dtype=np.intp, count=len(teams))
+
+
+DEFAULT_STATS = StatsTable(TEAM_STATS)
+
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+MEMO_SIZE = 4096
+
+
+def score_slate(matchups, injuries, stats=DEFAULT_STATS):
+    """Score [(home_team, away_team), ...]; returns MLPicks in the same order"""
+    keys = [(home, away, stats.version, injuries.version) for home, away in matchups]
+    results = [None] * len(keys)
+    with _memo_lock:
+        for i, key in enumerate(keys):
+            hit = _memo.get(key)
+            if hit is not None:
+                _memo.move_to_end(key)
+                results[i] = hit
+    todo = [i for i, r in enumerate(results) if r is None]
+    if todo:
+        fresh = _score_batch([matchups[i] for i in todo], injuries, stats)
+        with _memo_lock:
+            for i, pick in zip(todo, fresh):
+                results[i] = _memo[keys[i]] = pick
+            while len(_memo) > MEMO_SIZE:
+                _memo.popitem(last=False)
+    return results
+
+
+SlateArrays = namedtuple("SlateArrays", [
+    "home_dvoa", "away_dvoa", "dvoa_home", "dvoa_away", "home_def", "away_def", "def_home", "def_away",
+    "home_hw", "hw_home", "home_qb_out", "away_qb_out", "home_final", "away_final", "home_pick", "tier_idx",
+])
+
+
+def score_arrays(homes, aways, home_qb_out, away_qb_out, stats=DEFAULT_STATS):
+    """Vectorized core: every intermediate as an array, no per-game Python work.
+
+    This is the entry point for what-if sweeps; score_slate() wraps it with
+    reason strings and memoization for display.
+    """
+    h, a = stats.lookup(homes), stats.lookup(aways)
+    home_qb_out = np.asarray(home_qb_out, dtype=bool)
+    away_qb_out = np.asarray(away_qb_out, dtype=bool)
+
+    home_dvoa, away_dvoa = stats.dvoa[h], stats.dvoa[a]
+    dvoa_diff = home_dvoa - away_dvoa
+    dvoa_home, dvoa_away = dvoa_diff > 8, dvoa_diff < -8
+    home_def, away_def = stats.def_rank[h], stats.def_rank[a]
+    def_home, def_away = home_def <= 5, away_def <= 5
+    home_hw = stats.home_win_pct[h]
+    hw_home = home_hw > 0.65
+
+    # home field is worth a flat 1.0; an opposing QB out is worth 2.5
+    score_home = 1.0 * dvoa_home + 1.0 * def_home + 1.0 + 2.5 * away_qb_out + 0.8 * hw_home
+    score_away = 1.0 * dvoa_away + 1.0 * def_away + 2.5 * home_qb_out
+    total = score_home + score_away
+    safe_total = np.where(total > 0, total, 1.0)
+    # the weights allow only 96 distinct score pairs; np.round matches round(x, 1) on all of them
+    home_final = np.round(np.where(total > 0, score_home / safe_total * 10, 5.0), 1)
+    away_final = np.round(np.where(total > 0, score_away / safe_total * 10, 5.0), 1)
+    home_pick = home_final >= away_final
+    pick_score = np.where(home_pick, home_final, away_final)
+    tier_idx = np.searchsorted(-_TIER_CUTS, -pick_score, side="left")
+    return SlateArrays(home_dvoa, away_dvoa, dvoa_home, dvoa_away, home_def, away_def, def_home, def_away,
+                       home_hw, hw_home, home_qb_out, away_qb_out, home_final, away_final, home_pick, tier_idx)
+
+
+def _score_batch(matchups, injuries, stats):
+    homes = [home for home, _ in matchups]
+    aways = [away for _, away in matchups]
+    home_inj = [injuries.team_score(t) if t is not None else NO_INJURIES for t in homes]
+    away_inj = [injuries.team_score(t) if t is not None else NO_INJURIES for t in aways]
+    s = score_arrays(homes, aways, [inj[2] for inj in home_inj], [inj[2] for inj in away_inj], stats)
+    home_final, away_final = s.home_final.tolist(), s.away_final.tolist()
+
+    picks = []
+    for i, (home, away) in enumerate(matchups):
+        reasons = []
+        if s.home_pick[i]:
+            if s.dvoa_home[i]:
+                reasons.append(f"📊 DVOA +{s.home_dvoa[i]:.1f}")
+            if s.def_home[i]:
+                reasons.append(f"🛡️ #{s.home_def[i]} DEF")
+            if s.away_qb_out[i]:
+                reasons.append("🏥 QB Out")
+            if s.hw_home[i]:
+                reasons.append(f"🏠 {int(s.home_hw[i]*100)}%")
+            pick, score = home, home_final[i]
+        else:
+            if s.dvoa_away[i]:
+                reasons.append(f"📊 DVOA +{s.away_dvoa[i]:.1f}")
+            if s.def_away[i]:
+                reasons.append(f"🛡️ #{s.away_def[i]} DEF")
+            if s.home_qb_out[i]:
+                reasons.append("🏥 QB Out")
+            pick, score = away, away_final[i]
+        label, color = _TIER_LABELS[s.tier_idx[i]]
+        picks.append(MLPick(pick, score, tuple(reasons[:4]), home_inj[i][1], away_inj[i][1],
+                            label, color, home_final[i], away_final[i]))
+    return picks
+
+
+def calc_ml_score(home_team, away_team, injuries, stats=DEFAULT_STATS):
+    p = score_slate([(home_team, away_team)], injuries, stats)[0]
+    return p.pick, p.score, list(p.reasons), list(p.home_out), list(p.away_out)
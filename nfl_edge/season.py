@@ -0,0 +1,289 @@
+"""Multi-week scoreboard loading with completed weeks cached for good.
+
+ESPN serves any week at SCOREBOARD_URL?dates=<season>&seasontype=<2|3>&week=<n>,
+or a date range at ?dates=YYYYMMDD-YYYYMMDD. A slate whose games are all final
+never changes again, so it is written once to NFL_SEASON_DIR (gzipped JSON,
+atomic replace) and kept in memory; it is never refetched. Slates still in play
+sit in a short-TTL FeedCache, like the current scoreboard.
+
+load_weeks() fetches the slates it needs in parallel under one deadline and
+returns a SeasonIndex with dict lookups by event_id and game_key.
+
+Positions on games that left the current scoreboard are found by want_games(),
+which hands them to a background poller: each position's recorded kickoff names
+the one date slate (regular or postseason) to load, and a game found final is
+kept and never looked up again. Only positions saved before kickoffs were
+recorded fall back to scanning the season's regular and postseason weeks.
+Refs belong to the sessions that asked for them and go when those sessions
+have been idle for NFL_ALERT_IDLE; a ref no loaded slate holds is retried
+with exponential backoff rather than on every pass.
+
+    python -m nfl_edge.season 2025 --weeks 1 18
+"""
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+from nfl_edge.alerts import IDLE_EXPIRY
+from nfl_edge.cache import get_cache
+from nfl_edge.espn import SCOREBOARD_URL, parse_scoreboard
+from nfl_edge.httpclient import backoff, get_client, json_loads
+from nfl_edge.models import FINAL, game_from_dict, game_to_dict
+from nfl_edge.poller import IDLE_INTERVAL, ensure_poller
+from nfl_edge.replay import virtual_now
+from nfl_edge.teams import eastern
+
+SEASON_DIR = os.environ.get("NFL_SEASON_DIR", "nfl_season")
+WEEK_TTL = int(os.environ.get("NFL_WEEK_TTL", 60))
+REGULAR, POSTSEASON = 2, 3
+REGULAR_WEEKS = range(1, 19)
+POSTSEASON_WEEKS = range(1, 6)
+RESOLVE_DEADLINE = float(os.environ.get("NFL_FETCH_DEADLINE", 10))
+
+_final = {}  # query -> games, for slates that are all final
+_final_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=int(os.environ.get("NFL_SEASON_WORKERS", 8)),
+                               thread_name_prefix="season")
+
+
+def season_of(now):
+    """NFL season year for a date: January/February games belong to the previous year"""
+    return now.year if now.month >= 3 else now.year - 1
+
+
+def week_query(season, week, seasontype=REGULAR):
+    return (("dates", str(season)), ("seasontype", str(seasontype)), ("week", str(week)))
+
+
+def dates_query(start, end):
+    """Date-range query; start/end are dates or datetimes"""
+    return (("dates", f"{start:%Y%m%d}-{end:%Y%m%d}"),)
+
+
+def is_complete(games):
+    return bool(games) and all(g.phase == FINAL for g in games.values())
+
+
+# ========== DISK ==========
+def _path(query):
+    return os.path.join(SEASON_DIR, "_".join(f"{k}-{v}" for k, v in query) + ".json.gz")
+
+
+def _read(query):
+    try:
+        with gzip.open(_path(query), "rb") as f:
+            return {d["game_key"]: game_from_dict(d) for d in json_loads(f.read())}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write(query, games):
+    path = _path(query)
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(SEASON_DIR, exist_ok=True)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump([game_to_dict(g) for g in games.values()], f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# ========== LOADING ==========
+def load_slate(query):
+    """{game_key: Game} for one scoreboard query, from memory, disk or ESPN"""
+    games = _final.get(query)
+    if games is not None:
+        return games
+    games = _read(query)
+    if games is None:
+        url = SCOREBOARD_URL + "?" + "&".join(f"{k}={v}" for k, v in query)
+        cache = get_cache("scoreboard:" + ":".join(v for _, v in query), ttl=WEEK_TTL)
+        games = cache.get(lambda: get_client().get_parsed(url, parse_scoreboard))
+        if not is_complete(games):
+            return games
+        _write(query, games)
+    with _final_lock:
+        _final[query] = games
+    return games
+
+
+def load_weeks(queries, deadline=10, current=None):
+    """SeasonIndex over every query that loads within `deadline` seconds.
+
+    Slates that miss the deadline keep loading in the background and are
+    reported in `missing`; `current` (the live scoreboard) is indexed last so
+    its games win over any older copy.
+    """
+    queries = list(queries)
+    futures = {q: _executor.submit(load_slate, q) for q in queries}
+    wait(futures.values(), timeout=deadline)
+    slates, missing = [], []
+    for q in queries:
+        future = futures[q]
+        if future.done() and future.exception() is None:
+            slates.append(future.result())
+        else:
+            missing.append(q)
+    if current:
+        slates.append(current)
+    return SeasonIndex(slates, missing)
+
+
+def load_season(season, weeks=REGULAR_WEEKS, seasontype=REGULAR, deadline=10, current=None):
+    return load_weeks((week_query(season, w, seasontype) for w in weeks), deadline, current)
+
+
+class SeasonIndex:
+    """Games from several slates with dict lookups by event_id and game_key.
+
+    A game_key can repeat within a season (a playoff rematch at the same
+    venue); by_key keeps the latest kickoff.
+    """
+
+    def __init__(self, slates, missing=()):
+        self.by_event = {}
+        self.by_key = {}
+        for games in slates:
+            for g in games.values():
+                self.by_event[g.event_id] = g
+                prev = self.by_key.get(g.game_key)
+                if prev is None or g.game_date >= prev.game_date:
+                    self.by_key[g.game_key] = g
+        self.missing = list(missing)
+
+    def get(self, game_key, default=None):
+        return self.by_key.get(game_key, default)
+
+    def find(self, game_key, event_id=None):
+        """The game a position names: by event_id when it recorded one, else by game_key"""
+        g = self.by_event.get(event_id) if event_id else None
+        return g if g is not None else self.by_key.get(game_key)
+
+    def event(self, event_id, default=None):
+        return self.by_event.get(event_id, default)
+
+    def games(self):
+        return sorted(self.by_event.values(), key=lambda g: g.game_date)
+
+    def __contains__(self, game_key):
+        return game_key in self.by_key
+
+    def __len__(self):
+        return len(self.by_event)
+
+
+# ========== OFF-BOARD GAMES ==========
+RESOLVED_CACHE = get_cache("season:resolved", ttl=IDLE_INTERVAL)
+_wanted = {}     # session id -> (refs, monotonic time it last asked); refs are (game_key, event_id, kickoff)
+_settled = {}    # ref -> final Game; never looked up again
+_misses = {}     # ref -> (lookups that loaded every slate and didn't find it, monotonic time to retry)
+_next = (IDLE_INTERVAL, "idle")  # resolve_delay() for the last pass
+_wanted_lock = threading.Lock()
+
+
+def slate_queries(ref, now):
+    """Scoreboard queries that hold the game `ref` names: its Eastern kickoff day,
+    or every regular and postseason week when the position predates kickoffs"""
+    game_key, event_id, kickoff = ref
+    if kickoff:
+        day = datetime.fromisoformat(kickoff).astimezone(eastern)
+        return [dates_query(day, day)]
+    season = season_of(now)
+    return ([week_query(season, w) for w in REGULAR_WEEKS] +
+            [week_query(season, w, POSTSEASON) for w in POSTSEASON_WEEKS])
+
+
+# caller holds _wanted_lock
+def _live_refs(now):
+    """Refs of sessions that asked within IDLE_EXPIRY; state for everything else is dropped"""
+    for sid in [sid for sid, (_, seen) in _wanted.items() if now - seen >= IDLE_EXPIRY]:
+        del _wanted[sid]
+    refs = set().union(*(refs for refs, _ in _wanted.values()))
+    for stale in (_settled, _misses):
+        for ref in [ref for ref in stale if ref not in refs]:
+            del stale[ref]
+    return refs
+
+
+def resolve_wanted():
+    """SeasonIndex of every wanted game found so far; runs on the resolver poller"""
+    global _next
+    clock = time.monotonic()
+    with _wanted_lock:
+        pending = [ref for ref in _live_refs(clock)
+                   if ref not in _settled and _misses.get(ref, (0, 0))[1] <= clock]
+    now = virtual_now(eastern)
+    wanted = {ref: slate_queries(ref, now) for ref in pending}
+    index = load_weeks(sorted({q for queries in wanted.values() for q in queries}), deadline=RESOLVE_DEADLINE)
+    missing = set(index.missing)
+    settled, misses, soon = {}, {}, False
+    for ref, queries in wanted.items():
+        g = index.find(ref[0], ref[1])
+        if g is not None and g.phase == FINAL:
+            settled[ref] = g
+        elif g is not None or missing.intersection(queries):
+            soon = True  # still in play, or its slates haven't loaded yet
+        else:
+            misses[ref] = _misses.get(ref, (0, 0))[0] + 1
+    with _wanted_lock:
+        _settled.update(settled)
+        for ref, count in misses.items():
+            _misses[ref] = (count, clock + backoff(count, WEEK_TTL, IDLE_INTERVAL))
+        found = list(_settled.values())
+        retry = min((at for _, at in _misses.values()), default=None)
+        if soon:
+            _next = (WEEK_TTL, "pending")
+        elif retry is not None:
+            _next = (max(retry - clock, 1), "backoff")
+        else:
+            _next = (IDLE_INTERVAL, "idle")
+    return SeasonIndex([{g.event_id: g for g in found}, index.by_event], index.missing)
+
+
+def resolve_delay(index):
+    """(seconds, mode) until the resolver looks again: soon while a wanted game is
+    loading or still in play, backing off from refs no slate holds, otherwise not
+    until a session wants a new one"""
+    return _next
+
+
+def want_games(session_id, refs):
+    """(SeasonIndex, version) of the games `refs` name, as far as the resolver has got.
+
+    Never waits: new refs wake the background resolver, and their games appear
+    in a later version of the index. A session's refs are dropped once it hasn't
+    asked for IDLE_EXPIRY seconds.
+    """
+    refs = frozenset(refs)
+    clock = time.monotonic()
+    with _wanted_lock:
+        new = not refs <= _live_refs(clock)
+        _wanted[session_id] = (refs, clock)
+    poller = ensure_poller("season", RESOLVED_CACHE, resolve_wanted, schedule=resolve_delay)
+    if new:
+        poller.wake()
+    snap = RESOLVED_CACHE.peek()
+    return (snap.value, snap.version) if snap is not None else (SeasonIndex(()), 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load and cache a season's scoreboards")
+    parser.add_argument("season", type=int)
+    parser.add_argument("--weeks", type=int, nargs=2, default=(1, 18), metavar=("FIRST", "LAST"))
+    parser.add_argument("--postseason", action="store_true")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    index = load_season(args.season, range(args.weeks[0], args.weeks[1] + 1),
+                        POSTSEASON if args.postseason else REGULAR, deadline=60)
+    print(f"{len(index)} games in {time.perf_counter() - start:.2f}s; "
+          f"{len(_final)} final slates cached in {SEASON_DIR}; missing {len(index.missing)}")
+
+
+if __name__ == "__main__":
+    main()
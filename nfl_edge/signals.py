@@ -0,0 +1,357 @@
+"""Live signal lookup tables, evaluated for every live game in one batch.
+
+Field pressure, down stress, clock pressure and blowout risk are pure
+functions of a few small integers (yards, down, distance, quarter, seconds
+left, score margin). The reference if/elif functions below are evaluated once
+over each whole domain at import into uint8 tables of indices into LABELS.
+evaluate() answers any number of games with a handful of array lookups
+(backtests, what-if sweeps). evaluate_labels() answers live-slate sizes from
+flat lists of the (label, color) pairs instead, one game at a time, and only
+goes through NumPy from VECTORIZE_AT games.
+
+    python -m nfl_edge.signals    # exhaustive check: tables == reference functions
+"""
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from nfl_edge.models import clock_seconds
+
+
+# ========== REFERENCE SIGNAL FUNCTIONS (SaaS-SAFE) ==========
+def calc_field_pressure(yards_to_endzone, possession_team, home_team):
+    """Calculate field position pressure - uses only yard line"""
+    if not possession_team or not yards_to_endzone:
+        return "UNKNOWN", "#888888"
+
+    if yards_to_endzone <= 20:
+        return "🔴 RED ZONE", "#ff0000"
+    elif yards_to_endzone <= 35:
+        return "⚠️ THREAT", "#ff8800"
+    elif yards_to_endzone <= 50:
+        return "NEUTRAL", "#888888"
+    else:
+        return "LOW", "#44ff44"
+
+def calc_down_stress(down, distance):
+    """Calculate down & distance stress - uses only down + yards"""
+    if not down or not distance:
+        return "—", "#888888"
+
+    if down == 1:
+        if distance <= 5:
+            return "EASY", "#44ff44"
+        else:
+            return "NORMAL", "#888888"
+    elif down == 2:
+        if distance <= 5:
+            return "FAVORABLE", "#44ff44"
+        elif distance <= 8:
+            return "NORMAL", "#888888"
+        else:
+            return "MODERATE", "#ffaa00"
+    elif down == 3:
+        if distance <= 3:
+            return "CONVERTIBLE", "#44ff44"
+        elif distance <= 6:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "HIGH RISK", "#ff8800"
+    elif down == 4:
+        return "CRITICAL", "#ff0000"
+    else:
+        return "—", "#888888"
+
+def calc_clock_pressure(quarter, time_left_in_q, score_diff, is_trailing):
+    """Calculate clock pressure - uses only time + score margin.
+
+    `time_left_in_q` is Game.seconds_remaining (None when the clock was unreadable).
+    """
+    if time_left_in_q is None:
+        return "UNKNOWN", "#888888"
+    minutes = time_left_in_q // 60
+
+    # Calculate total time remaining
+    quarters_left = 4 - quarter
+    total_seconds = (quarters_left * 15 * 60) + time_left_in_q
+    total_minutes = total_seconds / 60
+
+    if quarter >= 5:  # Overtime
+        return "🚨 OVERTIME", "#ff0000"
+
+    # Trailing team pressure
+    if is_trailing:
+        if quarter == 4 and total_minutes <= 5 and abs(score_diff) > 8:
+            return "PANIC", "#ff0000"
+        elif quarter == 4 and total_minutes <= 10:
+            return "HIGH", "#ff8800"
+        elif quarter >= 3:
+            return "ELEVATED", "#ffaa00"
+
+    # General pressure
+    if quarter == 4 and total_minutes <= 5:
+        return "HIGH", "#ff8800"
+    elif quarter == 4:
+        return "ELEVATED", "#ffaa00"
+    elif quarter == 3 and minutes <= 7:
+        return "MODERATE", "#ffff00"
+    else:
+        return "LOW", "#44ff44"
+
+def calc_blowout_risk(score_diff, quarter):
+    """Calculate blowout risk - uses only score margin + quarter"""
+    if quarter <= 2:
+        if score_diff >= 21:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "LOW", "#44ff44"
+    elif quarter == 3:
+        if score_diff >= 24:
+            return "HIGH", "#ff8800"
+        elif score_diff >= 17:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "LOW", "#44ff44"
+    else:  # Q4
+        if score_diff >= 17:
+            return "BLOWOUT", "#ff0000"
+        elif score_diff >= 14:
+            return "HIGH", "#ff8800"
+        elif score_diff >= 9:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "LOW", "#44ff44"
+
+
+# ========== TABLES ==========
+# Inputs are clipped into these ranges; every cut in the reference functions
+# lies inside them, so clipping never changes an answer.
+MAX_YARDS = 100
+MAX_DISTANCE = 99
+MAX_QUARTER = 5      # 5+ is overtime
+MAX_CLOCK = 15 * 60
+MAX_MARGIN = 24
+
+LABELS = []
+_label_index = {}
+
+
+def _label(pair):
+    if pair not in _label_index:
+        _label_index[pair] = len(LABELS)
+        LABELS.append(pair)
+    return _label_index[pair]
+
+
+def _clock_str(secs):
+    return f"{secs // 60}:{secs % 60:02d}"
+
+
+# index 0 holds the "no yards / no possession" answer; negatives clip to 1
+FIELD_TABLE = np.array([_label(calc_field_pressure(y, "X", None)) if y else _label(calc_field_pressure(0, None, None))
+                        for y in range(MAX_YARDS + 1)], dtype=np.uint8)
+
+# [down 0..5, distance 0..99]; down 5 stands for any unexpected down
+DOWN_TABLE = np.array([[_label(calc_down_stress(d, dist)) for dist in range(MAX_DISTANCE + 1)]
+                       for d in range(6)], dtype=np.uint8)
+
+# [quarter 0..5, seconds left in quarter, trailing, trailing by more than 8]
+CLOCK_TABLE = np.array([[[[_label(calc_clock_pressure(q, s, 9 if big else 0, bool(trailing)))
+                           for big in (0, 1)] for trailing in (0, 1)]
+                         for s in range(MAX_CLOCK + 1)] for q in range(MAX_QUARTER + 1)], dtype=np.uint8)
+CLOCK_UNKNOWN = _label(("UNKNOWN", "#888888"))
+
+# [quarter 0..5, absolute score margin 0..24]
+BLOWOUT_TABLE = np.array([[_label(calc_blowout_risk(m, q)) for m in range(MAX_MARGIN + 1)]
+                          for q in range(MAX_QUARTER + 1)], dtype=np.uint8)
+
+SignalIndex = namedtuple("SignalIndex", ["field", "down", "clock", "blowout"])
+Signals = namedtuple("Signals", ["field", "down", "clock", "blowout"])
+
+
+def evaluate(games):
+    """Label indices for every game in one vectorized lookup; returns a SignalIndex of uint8 arrays"""
+    n = len(games)
+    yards = np.fromiter((g.yards_to_endzone or 0 if g.possession_team else 0 for g in games), dtype=np.int64, count=n)
+    downs = np.fromiter((g.down or 0 for g in games), dtype=np.int64, count=n)
+    dists = np.fromiter((g.distance or 0 for g in games), dtype=np.int64, count=n)
+    quarters = np.fromiter((g.period for g in games), dtype=np.int64, count=n)
+    secs = np.fromiter((-1 if g.seconds_remaining is None else g.seconds_remaining for g in games),
+                       dtype=np.int64, count=n)
+    home = np.fromiter((g.home_score for g in games), dtype=np.int64, count=n)
+    away = np.fromiter((g.away_score for g in games), dtype=np.int64, count=n)
+    poss_home = np.fromiter((g.possession_team == g.home_team for g in games), dtype=bool, count=n)
+    poss_away = np.fromiter((g.possession_team == g.away_team for g in games), dtype=bool, count=n)
+
+    margin = np.abs(home - away)
+    trailing = (poss_home & (home < away)) | (poss_away & (away < home))
+    q = np.clip(quarters, 0, MAX_QUARTER)
+
+    field = FIELD_TABLE[np.where(yards != 0, np.clip(yards, 1, MAX_YARDS), 0)]
+    down_row = np.where((downs >= 0) & (downs <= 4), downs, 5)
+    down = np.where(dists != 0, DOWN_TABLE[down_row, np.clip(dists, 1, MAX_DISTANCE)], DOWN_TABLE[0, 0])
+    clock = CLOCK_TABLE[q, np.clip(secs, 0, MAX_CLOCK), trailing.astype(np.intp), (margin > 8).astype(np.intp)]
+    clock = np.where(secs >= 0, clock, CLOCK_UNKNOWN)
+    blowout = BLOWOUT_TABLE[q, np.clip(margin, 0, MAX_MARGIN)]
+    return SignalIndex(field, down.astype(np.uint8), clock.astype(np.uint8), blowout)
+
+
+# Flat lists of the (label, color) pairs themselves, for per-game lookups: a
+# live slate (a dozen games) is cheaper answered one game at a time in plain
+# Python than through NumPy's fixed per-call overhead, which only pays off from
+# about VECTORIZE_AT games. Indexes: field [yards], down [down * 100 + distance],
+# clock [((quarter * 901 + seconds) * 2 + trailing) * 2 + trailing by 9+],
+# blowout [quarter * 25 + margin].
+VECTORIZE_AT = 32
+FIELD_LABELS = [LABELS[i] for i in FIELD_TABLE.ravel().tolist()]
+DOWN_LABELS = [LABELS[i] for i in DOWN_TABLE.ravel().tolist()]
+CLOCK_LABELS = [LABELS[i] for i in CLOCK_TABLE.ravel().tolist()]
+BLOWOUT_LABELS = [LABELS[i] for i in BLOWOUT_TABLE.ravel().tolist()]
+_CLOCK_SPAN = MAX_CLOCK + 1
+_DOWN_SPAN = MAX_DISTANCE + 1
+_MARGIN_SPAN = MAX_MARGIN + 1
+
+
+def lookup(g, _field=FIELD_LABELS, _down=DOWN_LABELS, _clock=CLOCK_LABELS, _blowout=BLOWOUT_LABELS,
+           _unknown=LABELS[CLOCK_UNKNOWN], _new=tuple.__new__, _signals=Signals):
+    """Signals for one Game straight from the flat tables (the defaults bind them as locals)"""
+    margin = g.home_score - g.away_score
+    poss = g.possession_team
+    if poss:
+        trailing = (margin < 0) if poss == g.home_team else (margin > 0) if poss == g.away_team else False
+        y = g.yards_to_endzone
+        field = _field[y if y and 0 < y <= MAX_YARDS else 0 if not y else 1 if y < 1 else MAX_YARDS]
+    else:
+        trailing, field = False, _field[0]
+    if margin < 0:
+        margin = -margin
+    q = g.period
+    if not 0 <= q <= MAX_QUARTER:
+        q = 0 if q < 0 else MAX_QUARTER
+
+    dist = g.distance
+    if dist:
+        down = g.down
+        row = down if down and 0 < down <= 4 else 0 if not down else 5
+        down_label = _down[row * _DOWN_SPAN + (dist if 0 < dist <= MAX_DISTANCE else 1 if dist < 1 else MAX_DISTANCE)]
+    else:
+        down_label = _down[0]
+
+    secs = g.seconds_remaining
+    if secs is None or secs < 0:
+        clock = _unknown
+    else:
+        clock = _clock[((q * _CLOCK_SPAN + (secs if secs <= MAX_CLOCK else MAX_CLOCK)) * 2 + trailing) * 2 + (margin > 8)]
+    return _new(_signals, (field, down_label, clock,
+                           _blowout[q * _MARGIN_SPAN + (margin if margin <= MAX_MARGIN else MAX_MARGIN)]))
+
+
+def evaluate_labels(games):
+    """[Signals(field, down, clock, blowout) of (label, color)] for a list of Games, in order"""
+    if len(games) >= VECTORIZE_AT:
+        return _labels_from_index(evaluate(games))
+    return [lookup(g) for g in games]
+
+
+def _labels_from_index(idx):
+    return [Signals(LABELS[f], LABELS[d], LABELS[c], LABELS[b])
+            for f, d, c, b in zip(idx.field.tolist(), idx.down.tolist(), idx.clock.tolist(), idx.blowout.tolist())]
+
+
+# ========== LIVESTATE ==========
+LiveState = namedtuple("LiveState", ["label", "color", "expected_leak", "q_display", "clock_pressure", "score_pressure"])
+
+
+def live_state(g):
+    """Headline LiveState for one live game - uses only quarter + score margin"""
+    quarter = g.period
+    score_diff = abs(g.home_score - g.away_score)
+
+    if score_diff >= 17:
+        score_pressure = "Blowout"
+    elif score_diff >= 9:
+        score_pressure = "Two Poss"
+    else:
+        score_pressure = "One Poss"
+
+    if quarter >= 5:
+        return LiveState("MAX UNCERTAINTY", "#ff0000", "3-7¢", "🏈 OVERTIME", "🚨 OVERTIME", score_pressure)
+    elif quarter == 4 and score_diff <= 8:
+        return LiveState("ELEVATED", "#ffaa00", "1-4¢", f"Q{quarter}", "Q4 Crunch", score_pressure)
+    else:
+        return LiveState("NORMAL", "#44ff44", "—", f"Q{quarter}", f"Q{quarter}", score_pressure)
+
+
+# ========== EQUIVALENCE CHECK ==========
+def check_tables(only=("field", "down", "clock", "blowout")):
+    """Compare lookup() and evaluate() against the reference functions over every input the tables cover.
+
+    Returns a list of mismatches (empty when the tables are exact).
+    """
+    from nfl_edge.models import Game
+
+    def game(**kw):
+        base = dict(event_id="1", game_key="A@H", away_team="A", home_team="H", away_code="A", home_code="H",
+                    away_id="", home_id="", away_score=0, home_score=0, total=0, period=1, clock="15:00",
+                    seconds_remaining=900, status_type="STATUS_IN_PROGRESS", game_date=None, down=None,
+                    distance=None, yard_line=None, yards_to_endzone=None, ball_yard=50, possession_team=None,
+                    is_red_zone=False, poss_text="", phase="live", kickoff_label="", ticker="")
+        base.update(kw)
+        return Game(**base)
+
+    mismatches = []
+
+    def compare(name, games, expected, column):
+        # both the per-game and the vectorized path must agree with the reference
+        for got in ([lookup(g) for g in games], _labels_from_index(evaluate(games))):
+            for g, want, have in zip(games, expected, (getattr(s, column) for s in got)):
+                if want != have:
+                    mismatches.append((name, g, want, have))
+
+    if "field" in only:
+        games = [game(yards_to_endzone=y, possession_team=p) for p in (None, "H", "A", "X")
+                 for y in (None, *range(-5, 111))]
+        compare("field", games, [calc_field_pressure(g.yards_to_endzone, g.possession_team, g.home_team)
+                                 for g in games], "field")
+
+    if "down" in only:
+        games = [game(down=d, distance=dist) for d in (None, *range(-1, 7)) for dist in (None, *range(-3, 120))]
+        compare("down", games, [calc_down_stress(g.down, g.distance) for g in games], "down")
+
+    if "clock" in only:
+        _check_clock(game, compare)
+
+    if "blowout" in only:
+        games = [game(period=q, home_score=m, away_score=0) for q in range(-1, 8) for m in range(0, 60)]
+        compare("blowout", games, [calc_blowout_risk(g.home_score, g.period) for g in games], "blowout")
+    return mismatches
+
+
+def _check_clock(game, compare):
+    # every second of every quarter, with margins either side of the 8-point cut, for both sides in possession
+    clocks = [_clock_str(s) for s in range(MAX_CLOCK + 1)] + ["", "--", "0:32.4"]
+    games = []
+    for q in range(0, 8):
+        for clock in clocks:
+            for home, away in ((0, 0), (7, 10), (3, 12), (24, 3), (10, 31), (8, 16), (16, 8), (9, 0), (0, 9)):
+                for poss in (None, "H", "A"):
+                    games.append(game(period=q, clock=clock, seconds_remaining=clock_seconds(clock),
+                                      home_score=home, away_score=away, possession_team=poss))
+    expected = []
+    for g in games:
+        diff = abs(g.home_score - g.away_score)
+        trailing = (g.possession_team == g.home_team and g.home_score < g.away_score) or \
+                   (g.possession_team == g.away_team and g.away_score < g.home_score)
+        expected.append(calc_clock_pressure(g.period, g.seconds_remaining, diff if trailing else -diff, trailing))
+    compare("clock", games, expected, "clock")
+
+
+if __name__ == "__main__":
+    bad = check_tables()
+    for name, g, want, have in bad[:20]:
+        print(f"{name}: period={g.period} clock={g.clock!r} down={g.down} dist={g.distance} "
+              f"yds={g.yards_to_endzone} poss={g.possession_team} score={g.away_score}-{g.home_score}: "
+              f"expected {want}, got {have}")
+    print(f"{len(bad)} mismatches")
+    sys.exit(1 if bad else 0)
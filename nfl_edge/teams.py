@@ -0,0 +1,103 @@
+"""Static team reference data shared across the app"""
+from functools import lru_cache
+
+import pytz
+
+# Kalshi dates NFL events by the Eastern kickoff date
+eastern = pytz.timezone("US/Eastern")
+
+KALSHI_CODES = {
+    "Arizona": "ARI", "Atlanta": "ATL", "Baltimore": "BAL", "Buffalo": "BUF",
+    "Carolina": "CAR", "Chicago": "CHI", "Cincinnati": "CIN", "Cleveland": "CLE",
+    "Dallas": "DAL", "Denver": "DEN", "Detroit": "DET", "Green Bay": "GB",
+    "Houston": "HOU", "Indianapolis": "IND", "Jacksonville": "JAX", "Kansas City": "KC",
+    "Las Vegas": "LV", "LA Chargers": "LAC", "LA Rams": "LA", "Miami": "MIA",
+    "Minnesota": "MIN", "New England": "NE", "New Orleans": "NO", "NY Giants": "NYG",
+    "NY Jets": "NYJ", "Philadelphia": "PHI", "Pittsburgh": "PIT", "San Francisco": "SF",
+    "Seattle": "SEA", "Tampa Bay": "TB", "Tennessee": "TEN", "Washington": "WAS"
+}
+
+# ESPN displayName -> app team name
+TEAM_ABBREVS = {
+    "Arizona Cardinals": "Arizona", "Atlanta Falcons": "Atlanta", "Baltimore Ravens": "Baltimore",
+    "Buffalo Bills": "Buffalo", "Carolina Panthers": "Carolina", "Chicago Bears": "Chicago",
+    "Cincinnati Bengals": "Cincinnati", "Cleveland Browns": "Cleveland", "Dallas Cowboys": "Dallas",
+    "Denver Broncos": "Denver", "Detroit Lions": "Detroit", "Green Bay Packers": "Green Bay",
+    "Houston Texans": "Houston", "Indianapolis Colts": "Indianapolis", "Jacksonville Jaguars": "Jacksonville",
+    "Kansas City Chiefs": "Kansas City", "Las Vegas Raiders": "Las Vegas", "Los Angeles Chargers": "LA Chargers",
+    "Los Angeles Rams": "LA Rams", "Miami Dolphins": "Miami", "Minnesota Vikings": "Minnesota",
+    "New England Patriots": "New England", "New Orleans Saints": "New Orleans", "New York Giants": "NY Giants",
+    "New York Jets": "NY Jets", "Philadelphia Eagles": "Philadelphia", "Pittsburgh Steelers": "Pittsburgh",
+    "San Francisco 49ers": "San Francisco", "Seattle Seahawks": "Seattle", "Tampa Bay Buccaneers": "Tampa Bay",
+    "Tennessee Titans": "Tennessee", "Washington Commanders": "Washington"
+}
+
+TEAM_STATS = {
+    "Arizona": {"dvoa": -8.5, "def_rank": 28, "home_win_pct": 0.45},
+    "Atlanta": {"dvoa": 2.5, "def_rank": 20, "home_win_pct": 0.55},
+    "Baltimore": {"dvoa": 12.5, "def_rank": 2, "home_win_pct": 0.72},
+    "Buffalo": {"dvoa": 15.8, "def_rank": 4, "home_win_pct": 0.78},
+    "Carolina": {"dvoa": -12.5, "def_rank": 26, "home_win_pct": 0.38},
+    "Chicago": {"dvoa": 8.5, "def_rank": 10, "home_win_pct": 0.65},
+    "Cincinnati": {"dvoa": 5.8, "def_rank": 12, "home_win_pct": 0.58},
+    "Cleveland": {"dvoa": -2.5, "def_rank": 15, "home_win_pct": 0.52},
+    "Dallas": {"dvoa": 3.2, "def_rank": 14, "home_win_pct": 0.62},
+    "Denver": {"dvoa": 12.5, "def_rank": 3, "home_win_pct": 0.75},
+    "Detroit": {"dvoa": 18.5, "def_rank": 6, "home_win_pct": 0.75},
+    "Green Bay": {"dvoa": 8.2, "def_rank": 10, "home_win_pct": 0.70},
+    "Houston": {"dvoa": 6.5, "def_rank": 8, "home_win_pct": 0.58},
+    "Indianapolis": {"dvoa": -6.8, "def_rank": 22, "home_win_pct": 0.48},
+    "Jacksonville": {"dvoa": -4.5, "def_rank": 19, "home_win_pct": 0.45},
+    "Kansas City": {"dvoa": 22.5, "def_rank": 7, "home_win_pct": 0.82},
+    "Las Vegas": {"dvoa": -8.2, "def_rank": 25, "home_win_pct": 0.45},
+    "LA Chargers": {"dvoa": 7.8, "def_rank": 9, "home_win_pct": 0.55},
+    "LA Rams": {"dvoa": 5.5, "def_rank": 14, "home_win_pct": 0.55},
+    "Miami": {"dvoa": 5.2, "def_rank": 13, "home_win_pct": 0.62},
+    "Minnesota": {"dvoa": 10.5, "def_rank": 11, "home_win_pct": 0.68},
+    "New England": {"dvoa": 9.5, "def_rank": 5, "home_win_pct": 0.70},
+    "New Orleans": {"dvoa": -3.8, "def_rank": 21, "home_win_pct": 0.55},
+    "NY Giants": {"dvoa": -15.5, "def_rank": 30, "home_win_pct": 0.35},
+    "NY Jets": {"dvoa": -7.5, "def_rank": 23, "home_win_pct": 0.42},
+    "Philadelphia": {"dvoa": 14.8, "def_rank": 3, "home_win_pct": 0.75},
+    "Pittsburgh": {"dvoa": 2.8, "def_rank": 5, "home_win_pct": 0.65},
+    "San Francisco": {"dvoa": 10.5, "def_rank": 6, "home_win_pct": 0.68},
+    "Seattle": {"dvoa": 14.5, "def_rank": 2, "home_win_pct": 0.78},
+    "Tampa Bay": {"dvoa": 4.2, "def_rank": 29, "home_win_pct": 0.55},
+    "Tennessee": {"dvoa": -9.8, "def_rank": 31, "home_win_pct": 0.42},
+    "Washington": {"dvoa": 9.5, "def_rank": 8, "home_win_pct": 0.62}
+}
+
+STAR_PLAYERS = {
+    "Arizona": ["Kyler Murray"], "Atlanta": ["Kirk Cousins", "Bijan Robinson"],
+    "Baltimore": ["Lamar Jackson", "Derrick Henry"], "Buffalo": ["Josh Allen", "James Cook"],
+    "Carolina": ["Bryce Young"], "Chicago": ["Caleb Williams"],
+    "Cincinnati": ["Joe Burrow", "Ja'Marr Chase"], "Cleveland": ["Deshaun Watson"],
+    "Dallas": ["Dak Prescott", "CeeDee Lamb"], "Denver": ["Bo Nix"],
+    "Detroit": ["Jared Goff", "Amon-Ra St. Brown"], "Green Bay": ["Jordan Love"],
+    "Houston": ["C.J. Stroud", "Nico Collins"], "Indianapolis": ["Anthony Richardson"],
+    "Jacksonville": ["Trevor Lawrence"], "Kansas City": ["Patrick Mahomes", "Travis Kelce"],
+    "Las Vegas": ["Gardner Minshew"], "LA Chargers": ["Justin Herbert"],
+    "LA Rams": ["Matthew Stafford", "Puka Nacua"], "Miami": ["Tua Tagovailoa", "Tyreek Hill"],
+    "Minnesota": ["J.J. McCarthy", "Justin Jefferson"], "New England": ["Drake Maye"],
+    "New Orleans": ["Derek Carr"], "NY Giants": ["Daniel Jones"],
+    "NY Jets": ["Aaron Rodgers"], "Philadelphia": ["Jalen Hurts", "Saquon Barkley"],
+    "Pittsburgh": ["Russell Wilson"], "San Francisco": ["Brock Purdy", "Christian McCaffrey"],
+    "Seattle": ["Sam Darnold", "Jaxon Smith-Njigba"], "Tampa Bay": ["Baker Mayfield"],
+    "Tennessee": ["Will Levis"], "Washington": ["Jayden Daniels"]
+}
+
+
+def team_code(team):
+    return KALSHI_CODES.get(team, team[:3].upper()) if team else "???"
+
+
+@lru_cache(maxsize=256)
+def _ticker_date(game_date):
+    if game_date.tzinfo is not None:
+        game_date = game_date.astimezone(eastern)  # a 20:15 ET kickoff is already tomorrow in UTC
+    return game_date.strftime("%y%b%d").upper()
+
+
+def kalshi_ticker(away_team, home_team, game_date):
+    date_str = _ticker_date(game_date)
+    return f"KXNFLGAME-{date_str}{KALSHI_CODES.get(away_team, 'XXX')}{KALSHI_CODES.get(home_team, 'XXX')}"
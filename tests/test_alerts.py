@@ -0,0 +1,47 @@
+import os
+
+from nfl_edge.alerts import DEDUP_WINDOW, AlertEngine, QueueSink, Rule
+from nfl_edge.espn import parse_scoreboard
+from nfl_edge.gamestate import EXPIRE_AFTER
+from nfl_edge.httpclient import json_loads
+from nfl_edge.models import LIVE
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "sunday_early.scoreboard.json")
+
+
+def live_game():
+    with open(FIXTURE, "rb") as f:
+        games = parse_scoreboard(json_loads(f.read()))
+    return next(g for g in games.values() if g.phase == LIVE)
+
+
+def engine_for(g):
+    sink = QueueSink()
+    engine = AlertEngine([sink])
+    engine.set_rules("u", [Rule("u:red_zone", "u", "red_zone", g.game_key, None)])
+    return engine, sink
+
+
+def test_older_version_does_not_rediff():
+    g = live_game()
+    outside = g._replace(is_red_zone=False)
+    inside = g._replace(is_red_zone=True)
+    engine, sink = engine_for(g)
+    engine.sync(1, {g.game_key: outside}, now=0)
+    assert [a.event for a in engine.sync(2, {g.game_key: inside}, now=10)] == ["red_zone"]
+    facts = dict(engine.facts)
+    # a slower session syncs the board its script saw, after the dedup window
+    assert engine.sync(1, {g.game_key: outside}, now=10 + DEDUP_WINDOW) == []
+    assert engine.facts == facts and engine.version == 2
+    assert engine.sync(3, {g.game_key: inside}, now=20 + DEDUP_WINDOW) == []
+    assert len(sink.drain("u")) == 1
+
+
+def test_facts_of_games_off_the_board_expire():
+    g = live_game()
+    engine, _ = engine_for(g)
+    engine.sync(1, {g.game_key: g}, now=0)
+    engine.sync(2, {}, now=EXPIRE_AFTER / 2)
+    assert g.event_id in engine.facts
+    engine.sync(3, {}, now=EXPIRE_AFTER + 1)
+    assert engine.facts == {} and engine.facts_at == {}
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from nfl_edge.cache import FeedCache
+
+
+def test_concurrent_misses_share_one_load():
+    cache = FeedCache("test", ttl=60)
+    calls = []
+    started = threading.Barrier(8)
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"v": len(calls)}
+
+    results = []
+
+    def reader():
+        started.wait()
+        results.append(cache.get_snapshot(loader))
+
+    threads = [threading.Thread(target=reader) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len({id(s) for s in results}) == 1
+    assert cache.loads == 1 and cache.misses == 8
+
+
+def test_republishing_the_same_object_keeps_its_version():
+    cache = FeedCache("test", ttl=60)
+    value = {"a": 1}
+    first = cache.put(value)
+    assert cache.put(value).version == first.version
+    assert cache.put({"a": 1}).version == first.version + 1
+
+
+def test_expired_snapshot_is_served_while_one_refresh_runs():
+    cache = FeedCache("test", ttl=60)
+    old = cache.put("old", ttl=0)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "new"
+
+    assert cache.get_snapshot(loader) is old
+    assert cache.get_snapshot(loader) is old
+    release.set()
+    for _ in range(100):
+        if cache.peek().value == "new":
+            break
+        time.sleep(0.01)
+    assert cache.peek().value == "new" and cache.peek().version == old.version + 1
+    assert len(calls) == 1 and cache.stale_hits == 2
+
+
+def test_failed_load_reaches_every_waiter_and_is_recorded():
+    cache = FeedCache("test", ttl=60)
+
+    def loader():
+        raise ValueError("down")
+
+    with pytest.raises(ValueError):
+        cache.get(loader)
+    assert isinstance(cache.last_error, ValueError) and cache.failing_since is not None
+    cache.refresh(lambda: "up")
+    assert cache.last_error is None and cache.failing_since is None
@@ -0,0 +1,44 @@
+import os
+
+from nfl_edge.espn import parse_scoreboard
+from nfl_edge.gamestate import GameStateEngine
+from nfl_edge.httpclient import json_loads
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "sunday_early.scoreboard.json")
+
+
+def live_game():
+    with open(FIXTURE, "rb") as f:
+        games = parse_scoreboard(json_loads(f.read()))
+    return next(g for g in games.values() if g.period > 0)
+
+
+def board(g, home_score):
+    g = g._replace(home_score=home_score, total=g.away_score + home_score)
+    return {g.game_key: g}
+
+
+def test_older_version_does_not_replay(tmp_path):
+    g = live_game()
+    engine = GameStateEngine(str(tmp_path / "state.json"))
+    engine.sync(1, board(g, g.home_score), now=100)
+    engine.sync(2, board(g, g.home_score + 7), now=200)
+    track = engine.tracks[g.event_id]
+    before = (track.last_total, track.last_score_time, list(track.scores), track.scored_version)
+    engine.sync(1, board(g, g.home_score), now=300)
+    assert engine.version == 2
+    assert (track.last_total, track.last_score_time, list(track.scores), track.scored_version) == before
+    assert engine.drought(g.event_id, now=300)[0] == "JUST SCORED"
+
+
+def test_score_change_is_recorded_once(tmp_path):
+    g = live_game()
+    engine = GameStateEngine(str(tmp_path / "state.json"))
+    engine.sync(1, board(g, g.home_score), now=100)
+    engine.sync(2, board(g, g.home_score + 3), now=160)
+    engine.sync(2, board(g, g.home_score + 3), now=170)
+    track = engine.tracks[g.event_id]
+    assert list(track.scores) == [(160, g.total + 3)]
+    assert engine.drought(g.event_id, now=220)[2] == "0:00"
+    engine.sync(3, board(g, g.home_score + 3), now=220)
+    assert engine.drought(g.event_id, now=220)[:3] == ("NORMAL", "#44ff44", "1:00")
@@ -0,0 +1,82 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from nfl_edge import httpclient
+from nfl_edge.httpclient import CircuitBreaker, HttpClient
+
+
+def test_breaker_closed_open_half_open_closed():
+    breaker = CircuitBreaker("test", threshold=2, base=0.05, cap=0.05)
+    assert breaker.allow()
+    breaker.failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open"
+    assert not breaker.allow() and breaker.rejected == 1
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == "half-open"
+    assert not breaker.allow()  # one trial call at a time
+    breaker.success()
+    assert breaker.state == "closed" and breaker.failures == 0 and breaker.allow()
+
+
+def test_failed_trial_reopens_for_longer():
+    breaker = CircuitBreaker("test", threshold=1, base=0.05, cap=10)
+    breaker.failure()
+    first = breaker.retry_in()
+    time.sleep(first + 0.01)
+    assert breaker.allow() and breaker.state == "half-open"
+    breaker.failure()
+    assert breaker.state == "open" and breaker.opens == 2
+    assert breaker.retry_in() > 0.045  # second open backs off from 2 * base, halved by jitter at most
+
+
+class TrickleHandler(BaseHTTPRequestHandler):
+    """Sends headers at once, then the body one byte every 50ms"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "40")
+        self.end_headers()
+        for _ in range(40):
+            try:
+                self.wfile.write(b" ")
+                self.wfile.flush()
+            except OSError:
+                return
+            time.sleep(0.05)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_budget_ends_the_worker_request_too(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TrickleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(httpclient, "BODY_CHUNK", 1)
+    client = HttpClient()
+    ended = []
+    fetch = client._fetch
+
+    def traced(*args):
+        try:
+            return fetch(*args)
+        finally:
+            ended.append(time.monotonic())
+
+    client._fetch = traced
+    started = time.monotonic()
+    try:
+        with pytest.raises(requests.Timeout):
+            client.get_parsed(f"http://127.0.0.1:{server.server_port}/scoreboard", lambda data: data, timeout=0.3)
+        for _ in range(100):
+            if ended:
+                break
+            time.sleep(0.01)
+        assert ended and ended[0] - started < 0.6  # the body alone takes 2s
+    finally:
+        server.shutdown()
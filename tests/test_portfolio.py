@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from nfl_edge.portfolio import Portfolio, position_cost, position_payout
+
+
+def recomputed(book):
+    sides = {}
+    for pos in book.positions.values():
+        side = sides.setdefault(pos["pick"], [0, 0, 0.0, 0.0])
+        side[0] += 1
+        side[1] += pos["contracts"]
+        side[2] += position_cost(pos["price"], pos["contracts"])
+        side[3] += position_payout(pos["price"], pos["contracts"])
+    return sides
+
+
+def assert_totals_match(portfolio):
+    for book in portfolio.by_game.values():
+        expected = recomputed(book)
+        assert book.sides.keys() == expected.keys()
+        for pick, side in book.sides.items():
+            assert side[:2] == expected[pick][:2]
+            assert side[2:] == pytest.approx(expected[pick][2:])
+    assert sum(len(book) for book in portfolio.by_game.values()) == len(portfolio.by_id)
+
+
+def test_running_totals_follow_add_update_remove():
+    rng = random.Random(7)
+    games = {"A@B": ("A", "B"), "C@D": ("C", "D"), "E@F": ("E", "F")}
+    portfolio = Portfolio()
+    next_id = 1
+    for _ in range(500):
+        op = rng.random()
+        if op < 0.5 or not portfolio.by_id:
+            game = rng.choice(list(games))
+            portfolio.add({"id": next_id, "game": game, "pick": rng.choice(games[game]),
+                           "price": rng.randint(1, 99), "contracts": rng.randint(1, 20)})
+            next_id += 1
+        elif op < 0.8:
+            pos_id = rng.choice(list(portfolio.by_id))
+            game = portfolio.by_id[pos_id]["game"]
+            portfolio.update(pos_id, pick=rng.choice(games[game]), price=rng.randint(1, 99),
+                             contracts=rng.randint(1, 20))
+        else:
+            portfolio.remove(rng.choice(list(portfolio.by_id)))
+        assert_totals_match(portfolio)
+
+
+def test_version_bumps_on_every_change():
+    portfolio = Portfolio()
+    portfolio.add({"id": 1, "game": "A@B", "pick": "B", "price": 40, "contracts": 2})
+    portfolio.update(1, price=60)
+    portfolio.remove(1)
+    assert portfolio.version == 3 and portfolio.by_game == {}
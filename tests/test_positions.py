@@ -0,0 +1,59 @@
+import sqlite3
+import threading
+
+from nfl_edge.positions import ADDED_COLUMNS, PositionStore
+
+OLD_SCHEMA = """
+CREATE TABLE positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, user_id TEXT NOT NULL, game TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT 'ml', pick TEXT, price INTEGER NOT NULL, contracts INTEGER NOT NULL,
+    cost REAL NOT NULL, added_at TEXT
+);
+INSERT INTO positions (user_id, game, pick, price, contracts, cost) VALUES ('u', 'A@B', 'B', 40, 2, 0.8);
+"""
+
+
+def columns(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {row[1] for row in conn.execute("PRAGMA table_info(positions)")}
+    finally:
+        conn.close()
+
+
+def test_old_database_is_migrated_once_under_concurrent_opens(tmp_path):
+    path = str(tmp_path / "positions.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(OLD_SCHEMA)
+    conn.close()
+    errors = []
+
+    def open_store():
+        try:
+            PositionStore(path)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=open_store) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert set(ADDED_COLUMNS) <= columns(path)
+    assert PositionStore(path).list("u")[0]["event_id"] is None
+
+
+def test_connections_are_shared_across_threads(tmp_path):
+    store = PositionStore(str(tmp_path / "positions.db"), pool_size=2)
+
+    def rerun():
+        store.add("u", {"game": "A@B", "pick": "B", "price": 50, "contracts": 1})
+        store.list("u")
+
+    for _ in range(10):
+        t = threading.Thread(target=rerun)
+        t.start()
+        t.join()
+    assert store._opened == 1
+    assert len(store.list("u")) == 10
@@ -0,0 +1,51 @@
+import os
+import time
+from datetime import datetime
+
+import pytz
+
+from nfl_edge import season
+from nfl_edge.espn import parse_scoreboard
+from nfl_edge.httpclient import json_loads
+from nfl_edge.season import POSTSEASON, SeasonIndex, slate_queries, week_query
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "sunday_early.scoreboard.json")
+NOW = datetime(2026, 1, 20, 12, 0, tzinfo=pytz.utc)
+
+
+def test_kickoff_names_its_eastern_day_slate():
+    # Thursday 8:15 PM ET is Friday 00:15 UTC
+    ref = ("ARI@ATL", "401", datetime(2025, 10, 10, 0, 15, tzinfo=pytz.utc).isoformat())
+    assert slate_queries(ref, NOW) == [(("dates", "20251009-20251009"),)]
+
+
+def test_position_without_kickoff_scans_postseason_too():
+    queries = slate_queries(("ARI@ATL", None, None), NOW)
+    assert week_query(2025, 18) in queries
+    assert week_query(2025, 5, POSTSEASON) in queries
+    assert len(queries) == 23
+
+
+def test_find_prefers_event_id():
+    with open(FIXTURE, "rb") as f:
+        games = parse_scoreboard(json_loads(f.read()))
+    index = SeasonIndex([games])
+    g = next(iter(games.values()))
+    assert index.find(g.game_key, g.event_id) is g
+    assert index.find(g.game_key, "no-such-event") is g
+    assert index.find("NOPE@NONE") is None
+
+
+def test_unfound_ref_backs_off_and_expires_with_its_session(monkeypatch):
+    queried = []
+    monkeypatch.setattr(season, "load_weeks", lambda queries, deadline: queried.append(queries) or SeasonIndex(()))
+    monkeypatch.setattr(season, "_wanted", {"s": (frozenset({("NOPE@NONE", None, None)}), time.monotonic())})
+    monkeypatch.setattr(season, "_misses", {})
+    season.resolve_wanted()
+    season.resolve_wanted()
+    assert [len(q) for q in queried] == [23, 0]
+    assert season.resolve_delay(None)[1] == "backoff"
+    monkeypatch.setattr(season, "IDLE_EXPIRY", 0)
+    season.resolve_wanted()
+    assert season._wanted == {} and season._misses == {}
+    assert season.resolve_delay(None) == (season.IDLE_INTERVAL, "idle")
@@ -0,0 +1,188 @@
+import os
+
+import pytest
+
+from nfl_edge import signals
+from nfl_edge.espn import parse_scoreboard
+from nfl_edge.httpclient import json_loads
+from nfl_edge.models import LIVE, clock_seconds
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures")
+
+
+@pytest.mark.parametrize("name", ["field", "down", "clock", "blowout"])
+def test_tables_match_reference_functions(name):
+    # every input each table covers, through both lookup() and the vectorized evaluate()
+    assert signals.check_tables(only=(name,)) == []
+
+
+@pytest.mark.parametrize("slate", ["sunday_early", "overtime"])
+def test_slate_paths_agree(slate):
+    with open(os.path.join(FIXTURES, f"{slate}.scoreboard.json"), "rb") as f:
+        games = list(parse_scoreboard(json_loads(f.read())).values())
+    per_game = [signals.lookup(g) for g in games]
+    assert signals._labels_from_index(signals.evaluate(games)) == per_game
+    assert signals.evaluate_labels(games * signals.VECTORIZE_AT) == per_game * signals.VECTORIZE_AT
+    assert all(isinstance(s, signals.Signals) for s in per_game)
+
+
+# ========== ORIGINAL SIGNAL FUNCTIONS ==========
+# Verbatim from app.py before the signals moved to lookup tables (string clocks and all),
+# so the tables are checked against the original if/elif logic, not a rewritten copy.
+def calc_field_pressure(yards_to_endzone, possession_team, home_team):
+    """Calculate field position pressure - uses only yard line"""
+    if not possession_team or not yards_to_endzone:
+        return "UNKNOWN", "#888888"
+    
+    if yards_to_endzone <= 20:
+        return "🔴 RED ZONE", "#ff0000"
+    elif yards_to_endzone <= 35:
+        return "⚠️ THREAT", "#ff8800"
+    elif yards_to_endzone <= 50:
+        return "NEUTRAL", "#888888"
+    else:
+        return "LOW", "#44ff44"
+
+def calc_down_stress(down, distance):
+    """Calculate down & distance stress - uses only down + yards"""
+    if not down or not distance:
+        return "—", "#888888"
+    
+    if down == 1:
+        if distance <= 5:
+            return "EASY", "#44ff44"
+        else:
+            return "NORMAL", "#888888"
+    elif down == 2:
+        if distance <= 5:
+            return "FAVORABLE", "#44ff44"
+        elif distance <= 8:
+            return "NORMAL", "#888888"
+        else:
+            return "MODERATE", "#ffaa00"
+    elif down == 3:
+        if distance <= 3:
+            return "CONVERTIBLE", "#44ff44"
+        elif distance <= 6:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "HIGH RISK", "#ff8800"
+    elif down == 4:
+        return "CRITICAL", "#ff0000"
+    else:
+        return "—", "#888888"
+
+def calc_clock_pressure(quarter, clock_str, score_diff, is_trailing):
+    """Calculate clock pressure - uses only time + score margin"""
+    try:
+        parts = clock_str.split(":")
+        minutes = int(parts[0])
+        seconds = int(parts[1]) if len(parts) > 1 else 0
+        time_left_in_q = minutes * 60 + seconds
+    except:
+        return "UNKNOWN", "#888888"
+    
+    # Calculate total time remaining
+    quarters_left = 4 - quarter
+    total_seconds = (quarters_left * 15 * 60) + time_left_in_q
+    total_minutes = total_seconds / 60
+    
+    if quarter >= 5:  # Overtime
+        return "🚨 OVERTIME", "#ff0000"
+    
+    # Trailing team pressure
+    if is_trailing:
+        if quarter == 4 and total_minutes <= 5 and abs(score_diff) > 8:
+            return "PANIC", "#ff0000"
+        elif quarter == 4 and total_minutes <= 10:
+            return "HIGH", "#ff8800"
+        elif quarter >= 3:
+            return "ELEVATED", "#ffaa00"
+    
+    # General pressure
+    if quarter == 4 and total_minutes <= 5:
+        return "HIGH", "#ff8800"
+    elif quarter == 4:
+        return "ELEVATED", "#ffaa00"
+    elif quarter == 3 and minutes <= 7:
+        return "MODERATE", "#ffff00"
+    else:
+        return "LOW", "#44ff44"
+
+def calc_blowout_risk(score_diff, quarter, clock_str):
+    """Calculate blowout risk - uses only score margin + time"""
+    try:
+        parts = clock_str.split(":")
+        minutes = int(parts[0])
+    except:
+        minutes = 15
+    
+    if quarter <= 2:
+        if score_diff >= 21:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "LOW", "#44ff44"
+    elif quarter == 3:
+        if score_diff >= 24:
+            return "HIGH", "#ff8800"
+        elif score_diff >= 17:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "LOW", "#44ff44"
+    else:  # Q4
+        if score_diff >= 17:
+            return "BLOWOUT", "#ff0000"
+        elif score_diff >= 14:
+            return "HIGH", "#ff8800"
+        elif score_diff >= 9:
+            return "MODERATE", "#ffaa00"
+        else:
+            return "LOW", "#44ff44"
+
+
+def original_signals(g):
+    """The four signals as the original render_signal_feed computed them from a game"""
+    score_diff = abs(g.home_score - g.away_score)
+    is_home_trailing = g.home_score < g.away_score
+    is_away_trailing = g.away_score < g.home_score
+    poss_team = g.possession_team
+    is_trailing = (poss_team == g.home_team and is_home_trailing) or \
+                  (poss_team == g.away_team and is_away_trailing)
+    return signals.Signals(
+        calc_field_pressure(g.yards_to_endzone, g.possession_team, g.home_team),
+        calc_down_stress(g.down, g.distance),
+        calc_clock_pressure(g.period, g.clock, score_diff if is_trailing else -score_diff, is_trailing),
+        calc_blowout_risk(score_diff, g.period, g.clock),
+    )
+
+
+def base_game():
+    with open(os.path.join(FIXTURES, "sunday_early.scoreboard.json"), "rb") as f:
+        games = parse_scoreboard(json_loads(f.read()))
+    return next(g for g in games.values() if g.phase == LIVE)
+
+
+def assert_matches_original(games):
+    expected = [original_signals(g) for g in games]
+    assert [signals.lookup(g) for g in games] == expected
+    assert signals._labels_from_index(signals.evaluate(games)) == expected
+
+
+def test_clock_and_blowout_match_original_string_functions():
+    g = base_game()
+    # every "M:SS" of a quarter plus unreadable clocks, the way ESPN strings reach Game.seconds_remaining
+    clocks = [f"{s // 60}:{s % 60:02d}" for s in range(15 * 60 + 1)] + ["", "--", "0:32.4", "5"]
+    scores = ((0, 0), (7, 10), (3, 12), (24, 3), (10, 31), (8, 16), (16, 8), (9, 0), (0, 9), (21, 0), (0, 40))
+    games = [g._replace(period=q, clock=clock, seconds_remaining=clock_seconds(clock),
+                        home_score=home, away_score=away, possession_team=poss)
+             for q in range(1, 8) for clock in clocks for home, away in scores
+             for poss in (None, g.home_team, g.away_team)]
+    assert_matches_original(games)
+
+
+def test_field_and_down_match_original_functions():
+    g = base_game()
+    games = [g._replace(yards_to_endzone=y, possession_team=poss, down=d, distance=dist)
+             for poss in (None, g.home_team, g.away_team) for y in (None, *range(0, 101, 3))
+             for d in (None, 1, 2, 3, 4) for dist in (None, *range(0, 30))]
+    assert_matches_original(games)
@@ -0,0 +1,29 @@
+import os
+from datetime import datetime
+
+import pytz
+
+from nfl_edge.espn import parse_scoreboard
+from nfl_edge.httpclient import json_loads
+from nfl_edge.teams import kalshi_ticker
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "sunday_early.scoreboard.json")
+
+
+def test_ticker_uses_eastern_date_for_late_kickoff():
+    # Thursday 8:15 PM ET is Friday 00:15 UTC
+    kickoff = datetime(2025, 10, 10, 0, 15, tzinfo=pytz.utc)
+    assert kalshi_ticker("Arizona", "Atlanta", kickoff) == "KXNFLGAME-25OCT09ARIATL"
+
+
+def test_ticker_keeps_afternoon_date():
+    kickoff = datetime(2025, 10, 12, 17, 0, tzinfo=pytz.utc)
+    assert kalshi_ticker("Buffalo", "Kansas City", kickoff) == "KXNFLGAME-25OCT12BUFKC"
+
+
+def test_parsed_primetime_games_match_kickoff_label():
+    with open(FIXTURE, "rb") as f:
+        games = parse_scoreboard(json_loads(f.read()))
+    for g in games.values():
+        eastern_day = g.kickoff_label.split(" • ")[0].split(" ", 1)[1].upper().replace(" ", "")
+        assert g.ticker.split("-")[1][2:7] == eastern_day, g.game_key